@@ -1,4 +1,33 @@
 from distutils.core import setup
+from distutils.command.build_py import build_py
+from distutils import log
+import os
+
+RESOURCES = 'unitytweak/data/unity-tweak-tool.gresource.xml'
+
+class build_resources(build_py):
+    '''Compile the .ui files and images into one GResource bundle, which
+    settings.py maps in at startup instead of opening each file'''
+    def run(self):
+        build_py.run(self)
+        target = os.path.join(self.build_lib, 'unitytweak', 'data',
+                              'unity-tweak-tool.gresource')
+        self.mkpath(os.path.dirname(target))
+        try:
+            self.spawn(['glib-compile-resources', '--sourcedir=unitytweak/data',
+                        '--target='+target, RESOURCES])
+        except Exception as e:
+            # Fall back to shipping the loose files, which settings.py also reads
+            log.warn("glib-compile-resources failed ({}), installing loose data files".format(e))
+            for name in self.loose_files():
+                self.copy_file(name, os.path.join(self.build_lib, name))
+
+    def loose_files(self):
+        for directory in ('unitytweak/data', 'unitytweak/data/icons/24', 'unitytweak/data/icons/36'):
+            for name in sorted(os.listdir(directory)):
+                if name.endswith(('.ui', '.png', '.svg')):
+                    self.mkpath(os.path.join(self.build_lib, directory))
+                    yield os.path.join(directory, name)
 
 setup(
     name='unity-tweak-tool',
@@ -10,8 +39,7 @@ setup(
     license='GPLv3+',
     packages=['unitytweak'],
     scripts=['unity-tweak-tool'],
-    package_data={'unitytweak': ['data/*.ui','data/*.png',
-                                'data/icons/24/*.svg','data/icons/36/*.svg']},
+    cmdclass={'build_py': build_resources},
     data_files=[
         ('share/applications',
             ['unity-tweak-tool.desktop']
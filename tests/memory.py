@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Stand-in schemas and an in-memory backend for tests that need settings"""
+
+import shutil, tempfile, unittest
+
+try:
+    from gi.repository import Gio
+    from unitytweak import benchmark, gsettings
+except ImportError:
+    gsettings = None
+
+@unittest.skipIf(gsettings is None, 'PyGObject is not installed')
+@unittest.skipUnless(shutil.which('glib-compile-schemas'), 'glib-compile-schemas is not installed')
+class MemoryTest(unittest.TestCase):
+    """Point gsettings at the benchmark's stand-in schemas, with every
+    key at its default in a fresh memory backend for each test"""
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory(prefix = 'unity-tweak-tool-test-')
+        cls.source = benchmark.compile_schemas(cls.directory.name, benchmark.read_dump())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def setUp(self):
+        gsettings.configure(self.source, Gio.memory_settings_backend_new())
+        self.addCleanup(gsettings.configure)
+        # Leave no write timers behind for the next test
+        self.addCleanup(gsettings.flush)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Value mappings and the headless get/set/reset commands"""
+
+import os, re, subprocess, unittest
+
+from tests.memory import MemoryTest, gsettings
+
+from unitytweak import mappings
+
+try:
+    from gi.repository import Gio
+    from unitytweak import benchmark, cli
+except ImportError:
+    pass
+
+class strings():
+    """Stand-in for a snapshot view holding string keys"""
+    def __init__(self, values):
+        self.values = values
+    def get_string(self, key):
+        return self.values[key]
+
+class MappingsTest(unittest.TestCase):
+    def test_hotcorners(self):
+        snap = type('snap', (), {
+            'core': strings({'show-desktop-edge': 'TopLeft'}),
+            'expo': strings({'expo-edge': 'TopRight|Left'}),
+            'scale': strings({'initiate-edge': ''})})()
+        values = mappings.hotcorner_values(snap)
+        self.assertEqual(values, {'show_desktop': ['TopLeft'], 'expo': ['TopRight', 'Left'],
+                                  'window_spread': []})
+        self.assertEqual(mappings.hotcorner_action(values, 'Left'), 'expo')
+        self.assertEqual(mappings.hotcorner_action(values, 'Bottom'), 'none')
+
+        # Moving an edge changes the list it leaves and the one it joins
+        self.assertEqual(sorted(mappings.set_hotcorner(values, 'Left', 'window_spread')),
+                         ['expo', 'window_spread'])
+        self.assertEqual(values['expo'], ['TopRight'])
+        self.assertEqual(mappings.set_hotcorner(values, 'Left', 'window_spread'), [])
+        self.assertEqual(mappings.set_hotcorner(values, 'TopLeft', 'none'), ['show_desktop'])
+        for edge in mappings.EDGES:
+            self.assertLessEqual(sum(edge in edges for edges in values.values()), 1)
+
+    def test_launcher_color(self):
+        for custom in (True, False):
+            value = mappings.launcher_color_value(custom, '#3a5c7e')
+            self.assertEqual(mappings.launcher_color(value), (custom, '#3a5c7e'))
+        self.assertEqual(mappings.launcher_color('#00000000'), (False, '#000000'))
+
+class CliTest(MemoryTest):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The stand-in schemas have no ranges; give icon-size the real one
+        xml = benchmark.schema_xml(benchmark.read_dump())
+        xml = re.sub(r'(<key name="icon-size" type="i"><default>\d+</default>)',
+                     r'\1<range min="8" max="64"/>', xml)
+        with open(os.path.join(cls.directory.name, 'unity-tweak-tool-benchmark.gschema.xml'), 'w') as f:
+            f.write(xml)
+        subprocess.check_call(['glib-compile-schemas', cls.directory.name])
+        cls.source = Gio.SettingsSchemaSource.new_from_directory(cls.directory.name, None, False)
+
+    def test_parse(self):
+        core = gsettings.core
+        self.assertEqual(cli._parse(core, 'hsize', '3').unpack(), 3)
+        # Plain words are let through for string keys only
+        self.assertEqual(cli._parse(gsettings.interface, 'gtk-theme', 'Radiance').unpack(), 'Radiance')
+        self.assertEqual(cli._parse(gsettings.interface, 'gtk-theme', "'Radiance'").unpack(), 'Radiance')
+        with self.assertRaises(ValueError):
+            cli._parse(core, 'hsize', 'three')
+        with self.assertRaises(ValueError):
+            cli._parse(gsettings.unityshell, 'icon-size', '500')
+
+    def test_read_write_reset(self):
+        cli.write('core', 'hsize', '3')
+        self.assertEqual(cli.read('core', 'hsize'), '3')
+        with self.assertRaises(ValueError):
+            cli.write('unityshell', 'icon-size', '4')
+        self.assertEqual(cli.read('unityshell', 'icon-size'), '32')
+        cli.reset('core', ['hsize'])
+        self.assertEqual(cli.read('core', 'hsize'), '2')
+        with self.assertRaises(LookupError):
+            cli.read('core', 'no-such-key')
+        with self.assertRaises(LookupError):
+            cli.read('no-such-object', 'hsize')
+
+    def test_virtual_objects(self):
+        cli.write('hotcorners', 'TopLeft', 'expo')
+        cli.write('hotcorners', 'Left', 'expo')
+        cli.write('hotcorners', 'Left', 'show_desktop')
+        self.assertEqual(gsettings.expo.get_string('expo-edge'), 'TopLeft')
+        self.assertEqual(gsettings.core.get_string('show-desktop-edge'), 'Left')
+        cli.reset('hotcorners', ['Left'])
+        self.assertEqual(cli.read('hotcorners', 'Left'), 'none')
+        self.assertEqual(cli.read('hotcorners', 'TopLeft'), 'expo')
+        with self.assertRaises(ValueError):
+            cli.write('hotcorners', 'Left', 'somewhere')
+
+        cli.write('launcher_color', 'color', '#3A5C7E')
+        self.assertEqual(cli.read('launcher_color', 'color'), '#3a5c7e')
+        cli.write('launcher_color', 'color', 'chameleon')
+        self.assertEqual(cli.read('launcher_color', 'color'), 'chameleon')
+        with self.assertRaises(ValueError):
+            cli.write('launcher_color', 'color', 'blue')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Changesets and the write scheduler"""
+
+import time, unittest
+
+from tests.memory import MemoryTest, gsettings
+
+try:
+    from gi.repository import GLib
+except ImportError:
+    pass
+
+def run(milliseconds):
+    """Run the main loop for a while, so scheduled writes can fire"""
+    loop = GLib.MainLoop()
+    GLib.timeout_add(milliseconds, loop.quit)
+    loop.run()
+
+class ChangesetTest(MemoryTest):
+    def test_commits_once_per_schema(self):
+        unityshell = gsettings.unityshell
+        events = []
+        unityshell.connect('change-event', lambda settings, keys, n_keys: events.append(n_keys) and False)
+        with gsettings.changeset() as changes:
+            changes[unityshell].set_int('icon-size', 40)
+            changes[unityshell].set_double('launcher-opacity', 0.5)
+            # Nothing reaches the registry object before the block ends
+            self.assertEqual(unityshell.get_int('icon-size'), 32)
+        self.assertEqual(unityshell.get_int('icon-size'), 40)
+        self.assertEqual(unityshell.get_double('launcher-opacity'), 0.5)
+        self.assertEqual(events, [2])
+
+    def test_exception_reverts_everything(self):
+        with self.assertRaises(RuntimeError):
+            with gsettings.changeset() as changes:
+                changes[gsettings.unityshell].set_int('icon-size', 40)
+                changes[gsettings.core].set_int('hsize', 4)
+                raise RuntimeError
+        self.assertEqual(gsettings.unityshell.get_int('icon-size'), 32)
+        self.assertEqual(gsettings.core.get_int('hsize'), 2)
+        # The delayed twins start clean for the next changeset
+        with gsettings.changeset() as changes:
+            changes[gsettings.core].set_int('vsize', 3)
+        self.assertEqual(gsettings.unityshell.get_int('icon-size'), 32)
+        self.assertEqual(gsettings.core.get_int('vsize'), 3)
+
+class ScheduleTest(MemoryTest):
+    def setUp(self):
+        super().setUp()
+        self.settings = gsettings.unityshell
+        self.writes = []
+        self.settings.connect('changed::icon-size', lambda settings, key: self.writes.append(settings.get_int(key)))
+
+    def test_debounce_keeps_the_last_value(self):
+        for size in range(40, 50):
+            gsettings.schedule(self.settings, 'icon-size', size, debounce = 20)
+        self.assertEqual(self.writes, [])
+        self.assertEqual(gsettings.scheduled(self.settings, 'icon-size'), 49)
+        run(100)
+        self.assertEqual(self.writes, [49])
+        self.assertIsNone(gsettings.scheduled(self.settings, 'icon-size'))
+
+    def test_throttle_writes_while_moving(self):
+        gsettings.schedule(self.settings, 'icon-size', 40, debounce = 1000, throttle = 10)
+        time.sleep(0.02)
+        gsettings.schedule(self.settings, 'icon-size', 41, debounce = 1000, throttle = 10)
+        self.assertEqual(self.writes, [41])
+
+    def test_flush_and_unchanged_values(self):
+        done = []
+        gsettings.schedule(self.settings, 'icon-size', 40, debounce = 1000, done = lambda: done.append(40))
+        gsettings.schedule(self.settings, 'launcher-opacity', self.settings.get_double('launcher-opacity'),
+                           debounce = 1000, done = lambda: done.append('opacity'))
+        gsettings.flush()
+        # The opacity was already stored, so only the icon size is written
+        self.assertEqual(self.writes, [40])
+        self.assertEqual(sorted(done, key = str), [40, 'opacity'])
+        self.assertEqual(self.settings.get_double('launcher-opacity'),
+                         self.settings.get_default_value('launcher-opacity').get_double())
+
+    def test_other_writes_cancel_the_pending_one(self):
+        gsettings.schedule(self.settings, 'icon-size', 40, debounce = 20)
+        gsettings.cancel(self.settings, 'icon-size')
+        self.settings.set_int('icon-size', 44)
+        gsettings.schedule(self.settings, 'launcher-opacity', 0.5, debounce = 20)
+        with gsettings.changeset() as changes:
+            changes[self.settings].reset('launcher-opacity')
+        run(100)
+        self.assertEqual(self.writes, [44])
+        self.assertEqual(self.settings.get_double('launcher-opacity'),
+                         self.settings.get_default_value('launcher-opacity').get_double())
+
+if __name__ == '__main__':
+    unittest.main()
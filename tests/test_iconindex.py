@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Icon lookups through icon-theme.cache files and Inherits chains"""
+
+import os, os.path, struct, tempfile, unittest
+from unittest import mock
+
+try:
+    from unitytweak import iconindex, themes
+except ImportError:
+    iconindex = None
+
+def icon_cache(icons, dirs):
+    """Build an icon-theme.cache the way gtk-update-icon-cache lays it
+    out, from {name: [(directory, flags)]} and the directory list"""
+    buckets = 3
+    chains = [[] for i in range(buckets)]
+    for number, name in enumerate(sorted(icons)):
+        chains[number % buckets].append(name)
+    data = bytearray(12)
+    strings = {}
+    def string(text):
+        if text not in strings:
+            strings[text] = len(data)
+            data.extend(text.encode('utf-8') + b'\0')
+        return strings[text]
+    dir_offsets = [string(directory) for directory in dirs]
+    images = {}
+    for name, entries in icons.items():
+        images[name] = len(data)
+        data.extend(struct.pack('>I', len(entries)))
+        for directory, flags in entries:
+            data.extend(struct.pack('>HHI', dirs.index(directory), flags, 0))
+    names = {name: string(name) for name in icons}
+    heads = []
+    for chain in chains:
+        following = iconindex.NONE
+        for name in reversed(chain):
+            offset = len(data)
+            data.extend(struct.pack('>III', following, names[name], images[name]))
+            following = offset
+        heads.append(following)
+    hash_offset = len(data)
+    data.extend(struct.pack('>I{}I'.format(buckets), buckets, *heads))
+    dirs_offset = len(data)
+    data.extend(struct.pack('>I{}I'.format(len(dirs)), len(dirs), *dir_offsets))
+    struct.pack_into('>HHII', data, 0, 1, 0, hash_offset, dirs_offset)
+    return bytes(data)
+
+def index_theme(name, directories, inherits = ''):
+    lines = ['[Icon Theme]', 'Name='+name, 'Inherits='+inherits,
+             'Directories='+','.join(directories), '']
+    for directory in directories:
+        lines += ['['+directory+']', 'Size='+directory.split('x')[0], 'Context=Applications', '']
+    return '\n'.join(lines)
+
+@unittest.skipIf(iconindex is None, 'PyGObject is not installed')
+class IconIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory(prefix = 'unity-tweak-tool-test-')
+        self.root = self.directory.name
+        patch = mock.patch.object(themes, 'roots', lambda kind: [self.root])
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def theme(self, name, icons, inherits = ''):
+        """Write a theme with {directory: [icon file names]}"""
+        path = os.path.join(self.root, name)
+        for directory, files in icons.items():
+            os.makedirs(os.path.join(path, directory))
+            for filename in files:
+                open(os.path.join(path, directory, filename), 'w').close()
+        with open(os.path.join(path, 'index.theme'), 'w') as f:
+            f.write(index_theme(name, sorted(icons), inherits))
+        return path
+
+    def test_read_cache(self):
+        path = os.path.join(self.root, 'icon-theme.cache')
+        with open(path, 'wb') as f:
+            f.write(icon_cache({'folder': [('16x16/places', 4), ('scalable/places', 2)],
+                                'user-home': [('16x16/places', 5)],
+                                'image-missing': [('16x16/status', 1)]},
+                               ['16x16/places', 'scalable/places', '16x16/status']))
+        self.assertEqual(iconindex.read_cache(path), {
+            'folder': [('16x16/places', '.png'), ('scalable/places', '.svg')],
+            # PNG wins when an image comes in several formats
+            'user-home': [('16x16/places', '.png')],
+            'image-missing': [('16x16/status', '.xpm')]})
+
+    def test_read_cache_rejects_other_versions(self):
+        path = os.path.join(self.root, 'icon-theme.cache')
+        with open(path, 'wb') as f:
+            f.write(struct.pack('>HHII', 2, 0, 12, 16) + bytes(8))
+        with self.assertRaises(ValueError):
+            iconindex.read_cache(path)
+
+    def test_cache_and_listing_agree(self):
+        path = self.theme('cached', {'16x16/apps': ['utilities-terminal.png', 'computer.svg']})
+        listed = iconindex.table(path)
+        with open(os.path.join(path, 'icon-theme.cache'), 'wb') as f:
+            f.write(icon_cache({'utilities-terminal': [('16x16/apps', 4)],
+                                'computer': [('16x16/apps', 2)]}, ['16x16/apps']))
+        with mock.patch.object(iconindex, 'walk', side_effect = AssertionError):
+            self.assertEqual(iconindex.table(path), listed)
+
+    def test_inherits_chain(self):
+        self.theme('hicolor', {'16x16/apps': ['folder.png', 'computer.png']})
+        self.theme('base', {'16x16/apps': ['folder.png', 'user-home.png']})
+        self.theme('top', {'32x32/apps': ['folder.png']}, inherits = 'base')
+        found = iconindex.lookup()
+        self.assertEqual(found.chain('top'), ['top', 'base', 'hicolor'])
+        self.assertEqual([entry[0] for entry in found.find('top', 'folder')], [32])
+        self.assertEqual(found.find('top', 'user-home')[0][2],
+                         os.path.join(self.root, 'base', '16x16/apps', 'user-home.png'))
+        self.assertEqual(len(found.find('top', 'computer')), 1)
+        self.assertEqual(found.find('top', 'missing'), [])
+        self.assertAlmostEqual(found.coverage('top'), 3 / len(iconindex.STANDARD))
+
+if __name__ == '__main__':
+    unittest.main()
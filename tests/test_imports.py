@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Deferred imports at startup"""
+
+import io, unittest
+
+try:
+    from unitytweak import benchmark
+except ImportError:
+    benchmark = None
+
+def importable(*modules):
+    for module in modules:
+        try:
+            __import__(module)
+        except (ImportError, ValueError):
+            return False
+    return True
+
+def check(label):
+    """Check one of benchmark.IMPORTS for deferred modules only; how long
+    imports take depends too much on the machine for a unit test"""
+    report = io.StringIO()
+    sets = [entry for entry in benchmark.IMPORTS if entry[0] == label]
+    return benchmark.check_imports(None, report, sets), report.getvalue()
+
+@unittest.skipIf(benchmark is None, 'PyGObject is not installed')
+class ImportTest(unittest.TestCase):
+    def test_startup_leaves_gtk_out(self):
+        problems, report = check('startup')
+        self.assertEqual(problems, [], report)
+
+    @unittest.skipUnless(benchmark and importable('gi.repository.Gtk', 'gi.repository.Gdk', 'cairo'),
+                         'Gtk, Gdk or cairo is not installed')
+    def test_pages_defer_unity_and_cairo(self):
+        problems, report = check('pages')
+        self.assertEqual(problems, [], report)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""apply-offline against temporary home directories"""
+
+import io, json, os, os.path, shutil, stat, subprocess, tempfile, unittest
+from unittest import mock
+
+try:
+    from unitytweak import offline, benchmark, profile
+except ImportError:
+    offline = None
+
+SECTIONS = {
+    'org/compiz/profiles/unity/plugins/core': {'hsize': '2', 'vsize': '2'},
+    'com/canonical/unity/launcher': {'favorites': "['application://firefox.desktop']"},
+}
+
+@unittest.skipIf(offline is None, 'PyGObject is not installed')
+class ApplyTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory(prefix = 'unity-tweak-tool-test-')
+        self.root = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def home(self, name):
+        home = os.path.join(self.root, name)
+        os.mkdir(home)
+        return home
+
+    def fake_dconf(self, dump):
+        """A dconf that dumps the given bytes and compiles nothing"""
+        path = os.path.join(self.root, 'dconf')
+        with open(path, 'wb') as script:
+            script.write(b'#!/bin/sh\nif [ "$1" = dump ]; then printf \'' + dump + b'\'; else exit 1; fi\n')
+        os.chmod(path, stat.S_IRWXU)
+        return path
+
+    def dump(self, home):
+        """The keys in a home's dconf database, as dconf dump shows them"""
+        config = os.path.join(home, '.config')
+        with tempfile.TemporaryDirectory() as scratch:
+            env = dict(os.environ, XDG_CONFIG_HOME = config, XDG_RUNTIME_DIR = scratch,
+                       DCONF_PROFILE = os.path.join(scratch, 'profile'))
+            with open(env['DCONF_PROFILE'], 'w') as dconf_profile:
+                dconf_profile.write('user-db:user\n')
+            output = subprocess.run(['dconf', 'dump', '/'], env = env, check = True,
+                                    stdout = subprocess.PIPE, universal_newlines = True).stdout
+        keyfile = offline._keyfile()
+        keyfile.read_string(output)
+        return keyfile
+
+    def test_without_dconf_writes_nothing(self):
+        home = self.home('a')
+        with mock.patch.object(offline.shutil, 'which', return_value = None):
+            with self.assertRaises(LookupError):
+                offline.apply(SECTIONS, [home], jobs = 1)
+        self.assertEqual(os.listdir(home), [])
+
+    @unittest.skipUnless(shutil.which('dconf'), 'dconf is not installed')
+    def test_merges_into_existing_database(self):
+        home = self.home('a')
+        offline.apply({'org/gnome/desktop/interface': {'gtk-theme': "'Radiance'"}}, [home], jobs = 1)
+        failures, seconds = offline.apply(SECTIONS, [home, self.home('b')], jobs = 2)
+        self.assertEqual(failures, [])
+        keyfile = self.dump(home)
+        self.assertEqual(keyfile['org/gnome/desktop/interface']['gtk-theme'], "'Radiance'")
+        self.assertEqual(keyfile['org/compiz/profiles/unity/plugins/core']['hsize'], '2')
+        self.assertEqual(keyfile['com/canonical/unity/launcher']['favorites'],
+                         "['application://firefox.desktop']")
+        self.assertFalse(os.path.exists(os.path.join(home, '.config', 'dconf', 'user.ini')))
+
+    def test_keyfiles(self):
+        homes = [self.home('a'), self.home('b')]
+        failures, seconds = offline.apply(SECTIONS, homes, jobs = 2, keyfiles = True)
+        self.assertEqual(failures, [])
+        for home in homes:
+            keyfile = offline._keyfile()
+            keyfile.read(os.path.join(home, '.config', 'dconf', 'user.ini'))
+            self.assertEqual(keyfile['org/compiz/profiles/unity/plugins/core']['hsize'], '2')
+            self.assertEqual(keyfile['com/canonical/unity/launcher']['favorites'],
+                             "['application://firefox.desktop']")
+
+    def test_failing_home_does_not_stop_the_others(self):
+        good = self.home('good')
+        bad = os.path.join(self.root, 'not-a-directory')
+        open(bad, 'w').close()
+        failures, seconds = offline.apply(SECTIONS, [bad, good], jobs = 2, keyfiles = True)
+        self.assertEqual([home for home, error in failures], [bad])
+        self.assertTrue(os.path.exists(os.path.join(good, '.config', 'dconf', 'user.ini')))
+
+    def test_undecodable_dump_fails_only_that_home(self):
+        home = self.home('binary')
+        os.makedirs(os.path.join(home, '.config', 'dconf'))
+        open(os.path.join(home, '.config', 'dconf', 'user'), 'wb').close()
+        other = self.home('other')
+        dconf = self.fake_dconf(b'\\377\\376')
+        with mock.patch.object(offline.shutil, 'which', return_value = dconf):
+            failures, seconds = offline.apply(SECTIONS, [home, other], jobs = 1)
+        failed = dict(failures)
+        self.assertIn(home, failed)
+        # The other home has no database to dump, and fails only at compiling
+        self.assertIn(other, failed)
+        self.assertNotIn('codec', failed[other])
+
+@unittest.skipIf(offline is None, 'PyGObject is not installed')
+class CompileTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory(prefix = 'unity-tweak-tool-test-')
+        source = benchmark.compile_schemas(self.directory.name, benchmark.read_dump())
+        patch = mock.patch.object(offline.Gio.SettingsSchemaSource, 'get_default', return_value = source)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def compile(self, *entries):
+        lines = [json.dumps({'format': profile.FORMAT, 'version': profile.VERSION})]
+        lines += [json.dumps(dict(zip(('schema', 'path', 'key', 'type', 'value'), entry)))
+                  for entry in entries]
+        return offline.compile_profile(io.StringIO('\n'.join(lines)+'\n'))
+
+    def test_paths_and_values(self):
+        sections, skipped = self.compile(
+            ('org.compiz.core', '/org/compiz/profiles/unity/plugins/core/', 'hsize', 'i', '3'),
+            ('org.gnome.desktop.interface', None, 'gtk-theme', 's', "'Radiance'"))
+        self.assertEqual(sections, {
+            'org/compiz/profiles/unity/plugins/core': {'hsize': '3'},
+            'org/gnome/desktop/interface': {'gtk-theme': "'Radiance'"}})
+        self.assertEqual(skipped, 0)
+
+    def test_skips_what_the_schema_does_not_take(self):
+        sections, skipped = self.compile(
+            ('org.compiz.core', '/org/compiz/profiles/unity/plugins/core/', 'hsize', 's', "'3'"),
+            ('org.gnome.desktop.interface', None, 'no-such-key', 's', "''"),
+            ('org.gnome.desktop.interface', None, 'gtk-theme', 's', "'Radiance'"))
+        self.assertEqual(sections, {'org/gnome/desktop/interface': {'gtk-theme': "'Radiance'"}})
+        self.assertEqual(skipped, 2)
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            self.compile(('org.gnome.desktop.interface', None, 'gtk-theme', 's', 'zz'))
+
+if __name__ == '__main__':
+    unittest.main()
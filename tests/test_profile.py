@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Profile export and import"""
+
+import io, json, unittest
+
+from tests.memory import MemoryTest, gsettings
+
+try:
+    from unitytweak import profile
+except ImportError:
+    pass
+
+class ProfileTest(MemoryTest):
+    def export(self):
+        stream = io.StringIO()
+        count = profile.export(stream)
+        return stream.getvalue(), count
+
+    def test_round_trip(self):
+        text, count = self.export()
+        self.assertEqual(count, sum(len(gsettings.installed(name)) for name in gsettings.managed))
+        with gsettings.changeset() as changes:
+            changes[gsettings.unityshell].set_int('icon-size', 40)
+            changes[gsettings.core].set_int('hsize', 4)
+            changes[gsettings.launcher].set_strv('favorites', ['unity://running-apps'])
+        applied, skipped = profile.load(io.StringIO(text))
+        self.assertEqual((applied, skipped), (3, 0))
+        self.assertEqual(self.export()[0], text)
+
+    def test_skips_what_it_cannot_apply(self):
+        lines = [json.dumps({'format': profile.FORMAT, 'version': profile.VERSION}),
+                 # Not managed, wrong type, then one that applies
+                 json.dumps({'schema': 'org.example', 'path': None, 'key': 'x', 'type': 'b', 'value': 'true'}),
+                 json.dumps({'schema': 'com.canonical.Unity.Launcher', 'path': None,
+                             'key': 'favorites', 'type': 's', 'value': "'x'"}),
+                 json.dumps({'schema': 'org.compiz.core', 'path': '/org/compiz/profiles/unity/plugins/core/',
+                             'key': 'hsize', 'type': 'i', 'value': '4'})]
+        applied, skipped = profile.load(io.StringIO('\n'.join(lines)+'\n'))
+        self.assertEqual((applied, skipped), (1, 2))
+        self.assertEqual(gsettings.core.get_int('hsize'), 4)
+
+    def test_rejects_malformed_profiles(self):
+        header = json.dumps({'format': profile.FORMAT, 'version': profile.VERSION})
+        good = json.dumps({'schema': 'org.compiz.core', 'path': '/org/compiz/profiles/unity/plugins/core/',
+                           'key': 'hsize', 'type': 'i', 'value': '4'})
+        for text in ('{"format": "something else"}\n',
+                     json.dumps({'format': profile.FORMAT, 'version': 99})+'\n',
+                     header+'\n'+good+'\nnot json\n',
+                     header+'\n'+good+'\n{"schema": "org.compiz.core"}\n',
+                     header+'\n'+good+'\n'+good.replace('"4"', '"four"')+'\n'):
+            with self.assertRaises(ValueError, msg = text):
+                profile.load(io.StringIO(text))
+            # Nothing from before the bad line is applied either
+            self.assertEqual(gsettings.core.get_int('hsize'), 2)
+
+if __name__ == '__main__':
+    unittest.main()
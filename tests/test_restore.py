@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Restoring the managed keys"""
+
+import unittest
+
+from tests.memory import MemoryTest, gsettings
+
+try:
+    from unitytweak import restore
+except ImportError:
+    pass
+
+class RestoreTest(MemoryTest):
+    def test_target(self):
+        unityshell = gsettings.unityshell
+        self.assertTrue(restore.target('unityshell', 'icon-size', unityshell).equal(
+            unityshell.get_default_value('icon-size')))
+        self.assertIsNone(restore.target('interface', 'gtk-theme', gsettings.interface))
+
+        launcher = gsettings.launcher
+        launcher.set_strv('favorites', ['application://firefox.desktop'])
+        self.assertIsNone(restore.target('launcher', 'favorites', launcher))
+        launcher.set_strv('favorites', ['application://firefox.desktop', restore.DESKTOP_ICON])
+        self.assertEqual(restore.target('launcher', 'favorites', launcher).unpack(),
+                         ['application://firefox.desktop'])
+
+    def test_modified_and_restore(self):
+        self.assertEqual(restore.modified(), [])
+        with gsettings.changeset() as changes:
+            changes[gsettings.core].set_strv('active-plugins', ['core'])
+            changes[gsettings.unityshell].set_int('icon-size', 40)
+            changes[gsettings.interface].set_string('gtk-theme', 'Radiance')
+            changes[gsettings.launcher].set_strv('favorites', ['application://firefox.desktop',
+                                                               restore.DESKTOP_ICON])
+        found = [(name, key) for name, key, value, wanted in restore.modified()]
+        self.assertEqual(sorted(found), [('core', 'active-plugins'), ('launcher', 'favorites'),
+                                         ('unityshell', 'icon-size')])
+        # Compiz reloads its plugins when the list changes, so it goes last
+        self.assertEqual(found[-1], ('core', 'active-plugins'))
+
+        keys, seconds = restore.restore(dry_run = True)
+        self.assertEqual(gsettings.unityshell.get_int('icon-size'), 40)
+        keys, seconds = restore.restore()
+        self.assertEqual(len(keys), 3)
+        self.assertEqual(restore.modified(), [])
+        self.assertEqual(gsettings.interface.get_string('gtk-theme'), 'Radiance')
+        self.assertEqual(gsettings.launcher.get_strv('favorites'), ['application://firefox.desktop'])
+
+if __name__ == '__main__':
+    unittest.main()
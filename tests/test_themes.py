@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Theme classification and the on-disk theme index"""
+
+import os, os.path, tempfile, unittest
+from unittest import mock
+
+try:
+    from unitytweak import themes
+except ImportError:
+    themes = None
+
+def write(path, text = ''):
+    os.makedirs(os.path.dirname(path), exist_ok = True)
+    with open(path, 'w') as f:
+        f.write(text)
+
+ICON_INDEX = '''[Icon Theme]
+Name=Test
+Inherits=hicolor
+Directories=16x16/apps,scalable/apps
+'''
+
+@unittest.skipIf(themes is None, 'PyGObject is not installed')
+class ClassifyTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory(prefix = 'unity-tweak-tool-test-')
+        self.root = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_parse_index(self):
+        path = os.path.join(self.root, 'index.theme')
+        write(path, ICON_INDEX.replace('hicolor', ' gnome , hicolor,') + 'Hidden=True\n')
+        self.assertEqual(themes.parse_index(path), {
+            'name': 'Test', 'inherits': ['gnome', 'hicolor'],
+            'directories': ['16x16/apps', 'scalable/apps'], 'hidden': True})
+        write(path, '[Desktop Entry]\nName=Test\n')
+        self.assertIsNone(themes.parse_index(path))
+        self.assertIsNone(themes.parse_index(os.path.join(self.root, 'missing')))
+
+    def test_gtk_themes(self):
+        theme = os.path.join(self.root, 'gtk')
+        for part in ('gtk-2.0', 'gtk-3.0'):
+            os.makedirs(os.path.join(theme, part))
+        entry = themes.classify(theme)
+        self.assertEqual(entry['flags'], ['gtk2', 'gtk3'])
+        self.assertEqual(entry['complete'], [])
+        self.assertEqual(themes.row('gtk', theme, entry), ('Gtk', theme, False))
+
+        os.mkdir(os.path.join(theme, 'metacity-1'))
+        entry = themes.classify(theme)
+        self.assertEqual(entry['complete'], ['gtk'])
+        self.assertEqual(themes.row('gtk', theme, entry), ('Gtk', theme, True))
+        self.assertIsNone(themes.row('gtk', self.root, themes.classify(self.root)))
+
+    def test_icon_themes(self):
+        theme = os.path.join(self.root, 'icons')
+        os.makedirs(os.path.join(theme, '16x16', 'apps'))
+        write(os.path.join(theme, 'index.theme'), ICON_INDEX)
+        # One of its directories is missing
+        self.assertEqual(themes.classify(theme)['complete'], [])
+
+        os.makedirs(os.path.join(theme, 'scalable', 'apps'))
+        entry = themes.classify(theme)
+        self.assertEqual(entry['flags'], ['index'])
+        self.assertEqual(entry['index']['name'], 'Test')
+        self.assertEqual(entry['complete'], ['icon'])
+        self.assertEqual(themes.row('icon', theme, entry), ('Icons', theme, False, True, False))
+
+        write(os.path.join(theme, 'index.theme'), ICON_INDEX + 'Hidden=true\n')
+        self.assertEqual(themes.classify(theme)['complete'], [])
+
+@unittest.skipIf(themes is None, 'PyGObject is not installed')
+class IndexTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory(prefix = 'unity-tweak-tool-test-')
+        self.root = os.path.join(self.directory.name, 'icons')
+        os.mkdir(self.root)
+        cache = os.path.join(self.directory.name, 'cache', 'themes.json')
+        for patch in (mock.patch.object(themes, 'roots', lambda kind: [self.root] if kind == 'icons' else []),
+                      mock.patch.object(themes, 'cache_file', lambda: cache)):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def touch(self, path, seconds):
+        os.utime(path, ns = (seconds*10**9, seconds*10**9))
+
+    def test_edited_index_theme_is_classified_again(self):
+        theme = os.path.join(self.root, 'test')
+        os.makedirs(os.path.join(theme, '16x16', 'apps'))
+        write(os.path.join(theme, 'index.theme'), ICON_INDEX)
+        found = themes.index()
+        self.assertEqual(found[self.root]['themes']['test']['complete'], [])
+
+        # Finishing the theme leaves the root's mtime alone
+        root_mtime = os.stat(self.root).st_mtime_ns
+        os.makedirs(os.path.join(theme, 'scalable', 'apps'))
+        write(os.path.join(theme, 'index.theme'), ICON_INDEX.replace('Test', 'Finished'))
+        self.touch(os.path.join(theme, 'index.theme'), 2000000000)
+        self.assertEqual(os.stat(self.root).st_mtime_ns, root_mtime)
+
+        found = themes.index()
+        entry = found[self.root]['themes']['test']
+        self.assertEqual(entry['index']['name'], 'Finished')
+        self.assertEqual(entry['complete'], ['icon'])
+
+    def test_unchanged_themes_come_from_the_cache(self):
+        theme = os.path.join(self.root, 'test')
+        os.makedirs(os.path.join(theme, '16x16', 'apps'))
+        write(os.path.join(theme, 'index.theme'), ICON_INDEX)
+        themes.index()
+        with mock.patch.object(themes, 'classify', side_effect = AssertionError):
+            found = themes.index()
+        self.assertIn('test', found[self.root]['themes'])
+
+if __name__ == '__main__':
+    unittest.main()
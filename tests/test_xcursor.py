@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Reading Xcursor files"""
+
+import os, os.path, struct, tempfile, unittest
+
+from unitytweak import xcursor
+
+def cursor(*images):
+    """Build an Xcursor file from (nominal size, width, height, pixel)
+    images, pixel being one premultiplied ARGB value used throughout"""
+    toc_size = 16 + 12*len(images)
+    toc, chunks = [], b''
+    for nominal, width, height, pixel in images:
+        toc.append(struct.pack('<3I', xcursor.IMAGE, nominal, toc_size + len(chunks)))
+        chunks += xcursor.IMAGE_HEADER.pack(36, xcursor.IMAGE, nominal, 1, width, height, 0, 0, 0)
+        chunks += struct.pack('<I', pixel) * (width*height)
+    return struct.pack('<4sIII', xcursor.MAGIC, 16, 0x10000, len(images)) + b''.join(toc) + chunks
+
+class XcursorTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory(prefix = 'unity-tweak-tool-test-')
+        self.cursors = os.path.join(self.directory.name, 'cursors')
+        os.mkdir(self.cursors)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, data):
+        path = os.path.join(self.cursors, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_toc(self):
+        data = cursor((24, 2, 2, 0xff000000), (32, 3, 3, 0xff000000))
+        self.assertEqual(xcursor.toc(data), [(24, 40), (32, 40 + 36 + 2*2*4)])
+        for bad in (b'Xcu', b'Nope' + data[4:], data[:20],
+                    struct.pack('<4sIII', xcursor.MAGIC, 16, 0x10000, 0)):
+            with self.assertRaises(ValueError):
+                xcursor.toc(bad)
+
+    def test_image_picks_the_nearest_size(self):
+        # Half transparent red, premultiplied, and opaque blue
+        path = self.write('left_ptr', cursor((24, 1, 1, 0x80800000), (48, 2, 1, 0xff0000ff)))
+        self.assertEqual(xcursor.image(path, 22), (1, 1, bytes((255, 0, 0, 0x80))))
+        self.assertEqual(xcursor.image(path, 40), (2, 1, bytes((0, 0, 255, 255))*2))
+
+    def test_check(self):
+        good = cursor((24, 4, 4, 0xff000000))
+        xcursor.check(self.write('good', good))
+        with self.assertRaises(ValueError):
+            xcursor.check(self.write('truncated', good[:-4]))
+        with self.assertRaises(ValueError):
+            # Image chunk of the wrong type
+            xcursor.check(self.write('wrong', good[:28+4] + struct.pack('<I', 0) + good[28+8:]))
+
+    def test_broken(self):
+        for name in xcursor.CORE:
+            self.write(name, cursor((24, 1, 1, 0xff000000)))
+        self.assertEqual(xcursor.broken(self.directory.name), [])
+        os.remove(os.path.join(self.cursors, 'watch'))
+        self.write('xterm', b'Xcur')
+        self.assertEqual(xcursor.broken(self.directory.name), ['xterm', 'watch'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -40,10 +40,9 @@ class About ():
         '''Handler Initialisations.
         Obtain all references here.'''
         self.builder = Gtk.Builder()
-        self.glade = (os.path.join(settings.UI_DIR,
-                                    'about.ui'))
+        self.glade = 'about.ui'
         self.container = container
-        self.builder.add_from_file(self.glade)
+        settings.add_ui(self.builder, self.glade)
         self.ui = ui(self.builder)
         self.builder.connect_signals(self)
 
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Settings layer benchmarks.
+
+Builds stand-in schemas for every managed key, points gsettings at them
+and at an in-memory backend, and times the operations the tool performs:
+snapshot reads, restore, profile export and import, slider writes, and,
+when a display is available, each page's refresh, reset and bound
+widget handlers.
+
+    python3 -m unitytweak.benchmark [-n 50] [--save FILE] [--baseline FILE]
+    python3 -m unitytweak.benchmark --imports [--import-budget MS]
+
+Defaults come from notes/GsettingsKeysDump.txt where it has the key and
+from FALLBACK below otherwise, so runs on different machines start from
+the same values."""
+
+import io, json, os, os.path, re, subprocess, sys, tempfile, time
+from xml.sax.saxutils import escape, quoteattr
+
+from gi.repository import GLib, Gio
+
+from . import gsettings
+from . import profile
+from . import restore
+
+DUMP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                    'notes', 'GsettingsKeysDump.txt')
+
+# Defaults for the managed keys the dump does not cover, as GVariant text
+FALLBACK = {
+    'com.canonical.indicator.bluetooth': {
+        'visible': 'true'},
+    'com.canonical.indicator.datetime': {
+        'show-calendar': 'true', 'show-clock': 'true', 'show-date': 'false',
+        'show-day': 'false', 'show-seconds': 'false', 'time-format': "'locale-default'"},
+    'com.canonical.indicator.power': {
+        'icon-policy': "'present'", 'show-time': 'false'},
+    'com.canonical.desktop.interface': {
+        'scrollbar-mode': "'overlay-auto'"},
+    'com.canonical.indicator.session': {
+        'show-real-name-on-panel': 'false'},
+    'com.canonical.indicator.sound': {
+        'interested-media-players': "['rhythmbox']",
+        'preferred-media-players': "['rhythmbox']",
+        'show-notify-osd-on-scroll': 'true', 'visible': 'true'},
+    'org.gnome.settings-daemon.plugins.xsettings': {
+        'antialiasing': "'grayscale'", 'hinting': "'slight'"},
+    'org.gnome.desktop.background': {
+        'show-desktop-icons': 'true'},
+    'org.gnome.nautilus.desktop': {
+        'home-icon-visible': 'true', 'network-icon-visible': 'false',
+        'trash-icon-visible': 'true', 'volumes-visible': 'true'},
+    'org.gnome.desktop.interface': {
+        'cursor-theme': "'DMZ-White'", 'document-font-name': "'Sans 11'",
+        'font-name': "'Ubuntu 11'", 'gtk-theme': "'Ambiance'",
+        'icon-theme': "'ubuntu-mono-dark'", 'monospace-font-name': "'Ubuntu Mono 13'",
+        'text-scaling-factor': '1.0', 'ubuntu-overlay-scrollbars': 'true'},
+    'org.gnome.desktop.lockdown': {
+        'disable-lock-screen': 'false', 'disable-log-out': 'false',
+        'disable-print-setup': 'false', 'disable-printing': 'false',
+        'disable-user-switching': 'false'},
+    'org.gnome.desktop.wm.preferences': {
+        'button-layout': "'close,minimize,maximize:'", 'theme': "'Ambiance'",
+        'titlebar-font': "'Ubuntu Bold 11'"},
+    'org.gnome.settings-daemon.peripherals.touchpad': {
+        'scroll-method': "'two-finger-scrolling'"},
+    'com.canonical.Unity.Launcher': {
+        'favorites': "['application://nautilus.desktop', 'unity://running-apps', "
+                     "'unity://expo-icon', 'unity://devices']"},
+    'com.canonical.Unity.Lenses': {
+        'remote-content-search': "'all'"},
+    'com.canonical.unity.webapps': {
+        'integration-allowed': 'true'},
+}
+
+# Flag an operation when its median is this much slower than the baseline
+THRESHOLD = 0.25
+
+# ===== Stand-in schemas ===== #
+
+def read_dump(filename = DUMP):
+    """Parse a gsettings dump into {schema: {key: text}}"""
+    dump = {}
+    current = None
+    with open(filename) as f:
+        for line in f:
+            match = re.match(r'--- (\S+) ---', line)
+            if match:
+                current = dump.setdefault(match.group(1), {})
+                continue
+            match = re.match(r'\s+(\S+)\s*:\s*(.*)$', line)
+            if match and current is not None:
+                current[match.group(1)] = match.group(2).strip()
+    return dump
+
+def schema_xml(dump):
+    """Write a schema list declaring every managed key.
+
+    Compiz plugin schemas stay relocatable, as they are installed; the
+    others get a fixed path of their own."""
+    lines = ['<schemalist>']
+    for name, keys in sorted(gsettings.managed.items()):
+        schema, path = gsettings.objects[name]
+        defaults = dict(FALLBACK.get(schema, {}))
+        defaults.update(dump.get(schema, {}))
+        if path:
+            lines.append('  <schema id={}>'.format(quoteattr(schema)))
+        else:
+            fixed = '/'+schema.replace('.', '/')+'/'
+            lines.append('  <schema id={} path={}>'.format(quoteattr(schema), quoteattr(fixed)))
+        for key in keys:
+            if key not in defaults:
+                raise KeyError("No default for {} {}".format(schema, key))
+            value = GLib.Variant.parse(None, defaults[key], None, None)
+            lines.append('    <key name={} type={}><default>{}</default></key>'.format(
+                quoteattr(key), quoteattr(value.get_type_string()), escape(value.print_(False))))
+        lines.append('  </schema>')
+    lines.append('</schemalist>')
+    return '\n'.join(lines)+'\n'
+
+def compile_schemas(directory, dump):
+    """Compile the stand-in schemas into directory and return their source"""
+    with open(os.path.join(directory, 'unity-tweak-tool-benchmark.gschema.xml'), 'w') as f:
+        f.write(schema_xml(dump))
+    subprocess.check_call(['glib-compile-schemas', directory])
+    return Gio.SettingsSchemaSource.new_from_directory(directory, None, False)
+
+# ===== Measuring ===== #
+
+class counter():
+    """Count the commits and keys each registry object reports"""
+    def __init__(self):
+        self.commits = 0
+        self.keys = 0
+        self.seen = set()
+
+    def attach(self):
+        for settings in list(gsettings._registry.values()):
+            if id(settings) not in self.seen:
+                self.seen.add(id(settings))
+                settings.connect('change-event', self.on_change_event)
+
+    def on_change_event(self, settings, keys, n_keys):
+        self.commits += 1
+        self.keys += n_keys
+        return False
+
+def pump():
+    """Run the main loop until idle, so signals and idle refreshes land"""
+    context = GLib.MainContext.default()
+    while context.pending():
+        context.iteration(False)
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered)-1, int(round(p/100*(len(ordered)-1))))]
+
+def measure(count, operation, runs, setup = None):
+    """Time operation over runs, pumping the main loop after each call"""
+    samples = []
+    commits = keys = 0
+    for i in range(runs):
+        if setup:
+            setup()
+            pump()
+        count.attach()
+        before = (count.commits, count.keys)
+        start = time.perf_counter()
+        operation()
+        gsettings.flush()
+        pump()
+        samples.append(time.perf_counter() - start)
+        count.attach()
+        pump()
+        commits += count.commits - before[0]
+        keys += count.keys - before[1]
+    return {
+        'runs': runs,
+        'p50_ms': percentile(samples, 50)*1000,
+        'p90_ms': percentile(samples, 90)*1000,
+        'p99_ms': percentile(samples, 99)*1000,
+        'max_ms': max(samples)*1000,
+        'commits': commits/runs,
+        'keys': keys/runs,
+    }
+
+def scramble():
+    """Move every boolean and number away from its default"""
+    with gsettings.changeset() as changes:
+        for name, keys in gsettings.managed.items():
+            settings = getattr(gsettings, name)
+            for key in keys:
+                value = settings.get_default_value(key)
+                kind = value.get_type_string()
+                if kind == 'b':
+                    changes[settings].set_boolean(key, not value.get_boolean())
+                elif kind in ('i', 'd'):
+                    for step in (1, -1):
+                        candidate = GLib.Variant(kind, value.unpack()+step)
+                        if settings.range_check(key, candidate):
+                            changes[settings].set_value(key, candidate)
+                            break
+
+def invalidate():
+    gsettings._values.clear()
+    gsettings._snapshot.views.clear()
+
+def read_all():
+    snap = gsettings.snapshot()
+    for name, keys in gsettings.managed.items():
+        values = getattr(snap, name)
+        for key in keys:
+            values[key]
+
+def slider():
+    settings = gsettings.unityshell
+    for i in range(100):
+        gsettings.schedule(settings, 'launcher-opacity', 0.5 + i/1000)
+
+# ===== Operations ===== #
+
+def settings_operations():
+    """(name, operation, setup) for the Gtk-free settings layer"""
+    saved = io.StringIO()
+    profile.export(saved)
+    text = saved.getvalue()
+    return [
+        ('snapshot.read_all', read_all, invalidate),
+        ('snapshot.cached', read_all, None),
+        ('restore', restore.restore, scramble),
+        ('restore.dry_run', lambda: restore.restore(dry_run = True), scramble),
+        ('profile.export', lambda: profile.export(io.StringIO()), None),
+        ('profile.load', lambda: profile.load(io.StringIO(text)), scramble),
+        ('schedule.slider', slider, None),
+    ]
+
+def toggles(page, bindings):
+    """Flip every boolean widget property the page binds to a key"""
+    def operation():
+        for name, key, widget, prop, mapping, dependants in bindings:
+            if not gsettings.available(name):
+                continue
+            widget = page.ui[widget]
+            value = widget.get_property(prop)
+            if isinstance(value, bool):
+                widget.set_property(prop, not value)
+    return operation
+
+def page_operations():
+    """(name, operation, setup) for each page, or None without Gtk or a
+    display"""
+    try:
+        import gi
+        gi.require_version('Gtk', '3.0')
+        from gi.repository import Gtk
+    except (ImportError, ValueError):
+        return None
+    if not Gtk.init_check(sys.argv)[0]:
+        return None
+    from . import unity, compiz, theme, desktop
+    pages = [
+        ('unity', unity, unity.Unitysettings),
+        ('compiz', compiz, compiz.Compizsettings),
+        ('theme', theme, theme.Themesettings),
+        ('desktop', desktop, desktop.Desktopsettings),
+    ]
+    operations = []
+    for label, module, factory in pages:
+        page = factory(None)
+        # Sub-tabs load when shown; build them all so every handler is live
+        if hasattr(page, 'tabs'):
+            page.tabs.load_all()
+        pump()
+        operations.append((label+'.refresh', page.refresh, None))
+        for attr in sorted(dir(page)):
+            if attr.startswith('on_b_') and attr.endswith('_reset_clicked'):
+                handler = getattr(page, attr)
+                operations.append(('{}.{}'.format(label, attr[len('on_b_'):-len('_clicked')]),
+                                   lambda handler = handler: handler(None), scramble))
+        operations.append((label+'.bound_toggles', toggles(page, module.bindings), None))
+    return operations
+
+def run(runs, dump = DUMP):
+    """Run every operation and return {name: result}"""
+    results = {}
+    with tempfile.TemporaryDirectory(prefix = 'unity-tweak-tool-benchmark-') as directory:
+        source = compile_schemas(directory, read_dump(dump))
+        gsettings.configure(source, Gio.memory_settings_backend_new())
+        try:
+            # Build every object up front so all their commits are counted
+            for name in gsettings.managed:
+                getattr(gsettings, name)
+            count = counter()
+            operations = settings_operations()
+            pages = page_operations()
+            if pages is None:
+                print("No Gtk or no display, skipping the page handlers", file = sys.stderr)
+            else:
+                operations += pages
+            # An operation that raises fails the whole run rather than
+            # leaving a hole in the baseline
+            for name, operation, setup in operations:
+                results[name] = measure(count, operation, runs, setup)
+        finally:
+            gsettings.configure()
+    return results
+
+# ===== Import time ===== #
+
+# What gets imported before the window is up: the modules the entry
+# script loads for every run, then the ones for the pages. Neither may
+# pull in the modules listed with it, which are loaded when first used.
+IMPORTS = [
+    ('startup', ('unitytweak.gsettings', 'unitytweak.profile', 'unitytweak.restore', 'unitytweak.cli'),
+        ('gi.repository.Gtk', 'gi.repository.Unity', 'gi.repository.Dbusmenu',
+         'gi.repository.Dee', 'cairo')),
+    ('pages', ('unitytweak.ui', 'unitytweak.start', 'unitytweak.unity', 'unitytweak.compiz',
+               'unitytweak.theme', 'unitytweak.desktop', 'unitytweak.about'),
+        ('gi.repository.Unity', 'gi.repository.Dbusmenu', 'gi.repository.Dee', 'cairo')),
+]
+
+# Milliseconds each set may take to import, dependencies included
+IMPORT_BUDGET = 400
+
+def import_times(modules):
+    """Import modules in a fresh interpreter under -X importtime.
+    Returns [(module, self ms, cumulative ms)] in import order."""
+    env = dict(os.environ)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [root, env.get('PYTHONPATH')]))
+    output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import '+', '.join(modules)],
+                            stdout = subprocess.DEVNULL, stderr = subprocess.PIPE,
+                            env = env, universal_newlines = True, check = True).stderr
+    times = []
+    for line in output.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|\s+(\S+)', line)
+        if match:
+            times.append((match.group(3), int(match.group(1))/1000, int(match.group(2))/1000))
+    return times
+
+def check_imports(budget = IMPORT_BUDGET, stream = sys.stdout, sets = IMPORTS):
+    """Report each import set's total and heaviest modules. Returns the
+    problems found: sets over budget or importing what they must not.
+    With budget None only the imports are checked, not their times."""
+    problems = []
+    for label, modules, deferred in sets:
+        times = import_times(modules)
+        total = sum(own for name, own, cumulative in times)
+        stream.write('{}: {:.1f} ms\n'.format(label, total))
+        for name, own, cumulative in sorted(times, key = lambda t: -t[1])[:10]:
+            stream.write('    {:>8.1f} ms  {}\n'.format(own, name))
+        if budget is not None and total > budget:
+            problems.append('{} imports take {:.1f} ms, over the {} ms budget'.format(label, total, budget))
+        loaded = {name for name, own, cumulative in times}
+        for name in deferred:
+            if name in loaded:
+                problems.append('{} imports {}'.format(label, name))
+    return problems
+
+# ===== Reporting ===== #
+
+def regressions(results, baseline, threshold = THRESHOLD):
+    """Return the operations slower or writing more than in baseline"""
+    found = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        if result['p50_ms'] > old['p50_ms']*(1+threshold):
+            found.append((name, 'p50 {:.3f} ms, was {:.3f} ms'.format(result['p50_ms'], old['p50_ms'])))
+        if result['commits'] > old['commits'] or result['keys'] > old['keys']:
+            found.append((name, '{:g} commits/{:g} keys, was {:g}/{:g}'.format(
+                result['commits'], result['keys'], old['commits'], old['keys'])))
+    return found
+
+def report(results, stream = sys.stdout):
+    stream.write('{:<42} {:>9} {:>9} {:>9} {:>9} {:>8} {:>6}\n'.format(
+        'operation', 'p50 ms', 'p90 ms', 'p99 ms', 'max ms', 'commits', 'keys'))
+    for name, result in results.items():
+        stream.write('{:<42} {p50_ms:>9.3f} {p90_ms:>9.3f} {p99_ms:>9.3f} {max_ms:>9.3f} '
+                     '{commits:>8g} {keys:>6g}\n'.format(name, **result))
+
+def main(argv = None):
+    import argparse
+    parser = argparse.ArgumentParser(prog = 'python3 -m unitytweak.benchmark')
+    parser.add_argument('-n', '--runs', type=int, default=50, help='Runs per operation')
+    parser.add_argument('--dump', default=DUMP, help='gsettings dump to take defaults from')
+    parser.add_argument('--save', metavar='FILE', help='Save the results as a baseline')
+    parser.add_argument('--baseline', metavar='FILE', help='Compare against a saved baseline')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='Allowed median slowdown before flagging, as a fraction')
+    parser.add_argument('--imports', action='store_true',
+                        help='Check import times and deferred imports instead')
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET, metavar='MS',
+                        help='Milliseconds each import set may take')
+    args = parser.parse_args(argv)
+
+    if args.imports:
+        problems = check_imports(args.import_budget)
+        for problem in problems:
+            print("REGRESSION {}".format(problem))
+        return 1 if problems else 0
+
+    results = run(args.runs, args.dump)
+    report(results)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent = 1, sort_keys = True)
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(results, json.load(f), args.threshold)
+        for name, reason in found:
+            print("REGRESSION {}: {}".format(name, reason))
+        if found:
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+from gi.repository import GLib, Gio
+
+from . import gsettings
+from . import mappings
+
+# Command line access to the managed keys. Only Gio is imported, so a
+# scripted check never brings up Gtk.
+#
+# Besides the gsettings objects there are objects that show keys the way
+# the pages do: hotcorners (one key per screen edge, valued none,
+# show_desktop, expo or window_spread) and launcher_color (chameleon or
+# '#rrggbb').
+
+virtual = {
+    'hotcorners':       (('core', 'expo', 'scale'), mappings.EDGES),
+    'launcher_color':   (('unityshell',), ('color',)),
+}
+
+class _defaults():
+    """Default values of the managed keys, with the snapshot getters"""
+    def __getattr__(self, name):
+        settings = getattr(gsettings, name)
+        return gsettings.view({key: settings.get_default_value(key) for key in gsettings.installed(name)})
+
+def names():
+    """Return every object that can be used here on this system"""
+    result = [name for name in gsettings.managed if gsettings.available(name)]
+    result += [name for name, (needs, keys) in virtual.items() if gsettings.available(*needs)]
+    return result
+
+def keys(name):
+    if name in virtual:
+        return virtual[name][1]
+    try:
+        return gsettings.managed[name]
+    except KeyError:
+        raise LookupError("unknown object {}".format(name))
+
+def _check(name, key):
+    if key not in keys(name):
+        raise LookupError("{} has no key {}".format(name, key))
+    needs = virtual[name][0] if name in virtual else (name,)
+    if not gsettings.available(*needs):
+        raise LookupError("the schemas for {} are not installed".format(name))
+    if name not in virtual and key not in gsettings.installed(name):
+        raise LookupError("the installed schema for {} has no key {}".format(name, key))
+
+def _read(snap, name, key):
+    if name == 'hotcorners':
+        return mappings.hotcorner_action(mappings.hotcorner_values(snap), key)
+    if name == 'launcher_color':
+        custom, color = mappings.launcher_color(snap.unityshell.get_string('background-color'))
+        return color if custom else 'chameleon'
+    return getattr(snap, name).get_value(key).print_(False)
+
+def read(name, key):
+    """Return the value of key as text"""
+    _check(name, key)
+    return _read(gsettings.snapshot(), name, key)
+
+def listing(selected = None):
+    """Return (name, key, value) for every key of the selected objects,
+    all of them by default"""
+    snap = gsettings.snapshot()
+    result = []
+    for name in selected or names():
+        for key in keys(name) if name in virtual else gsettings.installed(name):
+            _check(name, key)
+            result.append((name, key, _read(snap, name, key)))
+    return result
+
+def _parse(settings, key, text):
+    value_type = settings.get_value(key).get_type()
+    try:
+        value = GLib.Variant.parse(value_type, text, None, None)
+    except GLib.Error:
+        # Let plain words through for string keys
+        if value_type.dup_string() != 's':
+            raise ValueError("{!r} is not a valid {} value".format(text, value_type.dup_string()))
+        value = GLib.Variant('s', text)
+    if not settings.range_check(key, value):
+        raise ValueError("{!r} is out of range for {}".format(text, key))
+    return value
+
+def _write_hotcorners(changes, values, actions):
+    for action in actions:
+        name, key = mappings.HOTCORNER_KEYS[action]
+        changes[getattr(gsettings, name)].set_string(key, '|'.join(values[action]))
+
+def _write(changes, snap, name, key, text):
+    if name == 'hotcorners':
+        if text not in mappings.HOTCORNER_ACTIONS:
+            raise ValueError("{!r} is not one of {}".format(text, ', '.join(mappings.HOTCORNER_ACTIONS)))
+        values = mappings.hotcorner_values(snap)
+        _write_hotcorners(changes, values, mappings.set_hotcorner(values, key, text))
+    elif name == 'launcher_color':
+        custom, color = mappings.launcher_color(snap.unityshell.get_string('background-color'))
+        if text == 'chameleon':
+            value = mappings.launcher_color_value(False, color)
+        elif len(text) == 7 and text.startswith('#') and all(c in '0123456789abcdefABCDEF' for c in text[1:]):
+            value = mappings.launcher_color_value(True, text.lower())
+        else:
+            raise ValueError("{!r} is neither chameleon nor a #rrggbb colour".format(text))
+        changes[gsettings.unityshell].set_string('background-color', value)
+    else:
+        settings = getattr(gsettings, name)
+        changes[settings].set_value(key, _parse(settings, key, text))
+
+def write(name, key, text):
+    """Set key from its text form, one commit per schema"""
+    _check(name, key)
+    with gsettings.changeset() as changes:
+        _write(changes, gsettings.snapshot(), name, key, text)
+    Gio.Settings.sync()
+
+def reset(name, selected = None):
+    """Reset the selected keys of name, all of them by default"""
+    selected = selected or keys(name)
+    for key in selected:
+        _check(name, key)
+    with gsettings.changeset() as changes:
+        if name == 'hotcorners':
+            # Go through the mapping so that resetting one edge leaves
+            # the others alone
+            values = mappings.hotcorner_values(gsettings.snapshot())
+            defaults = mappings.hotcorner_values(_defaults())
+            actions = set()
+            for edge in selected:
+                default = mappings.hotcorner_action(defaults, edge)
+                actions.update(mappings.set_hotcorner(values, edge, default))
+            _write_hotcorners(changes, values, actions)
+        elif name == 'launcher_color':
+            changes[gsettings.unityshell].reset('background-color')
+        else:
+            settings = changes[getattr(gsettings, name)]
+            for key in selected:
+                settings.reset(key)
+    Gio.Settings.sync()
@@ -29,35 +29,57 @@
 # this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
 
 import os, os.path
-import cairo
 
 from gi.repository import Gtk, Gio, Gdk
 from math import pi, sqrt
 
-from .ui import ui
+from .ui import ui, tabs, quiet
 from . import settings
 from . import gsettings
+from . import mappings
+
+# Widgets that show a single key as it is: (object, key, widget, property,
+# mapping, dependants). See ui.bind.
+bindings = [
+    # General
+    ('opengl', 'texture-filter', 'cbox_opengl', 'active', None, ()),
+    ('opengl', 'sync-to-vblank', 'check_synctovblank', 'active', None, ()),
+    # Windows spread
+    ('scale', 'overlay-icon', 'check_overlay_emblem', 'active',
+        (lambda value: value >= 1, lambda active: 1 if active else 0), ()),
+    ('scale', 'show-desktop', 'check_click_desktop', 'active', None, ()),
+]
+
+# Widgets to hide when the schemas they need are not installed
+requires = {
+    'box_compiz_general':           ('core', 'zoom', 'move', 'animation', 'opengl'),
+    'box_compiz_workspace':         ('core', 'expo'),
+    'box_compiz_windows_spread':    ('core', 'scale'),
+    'box_compiz_window_snapping':   ('core', 'grid'),
+    'box_compiz_hotcorners':        ('core', 'expo', 'scale'),
+}
+
+# Sub-tabs, each loaded when first shown: (content, tab label, top-level
+# objects it uses). See ui.tabs.
+subpages = [
+    ('box_compiz_general', 'l_page_compiz_general',
+        ('list_compiz_general_keys_accelerators', 'list_compiz_general_zoom_accelerators')),
+    ('box_compiz_workspace', 'l_page_compiz_workspace',
+        ('adj_horizontal_desktop', 'adj_vertical_desktop', 'list_compiz_workspace_accelerators')),
+    ('box_compiz_windows_spread', 'l_page_compiz_windows_spread',
+        ('adj_compiz_spacing', 'list_compiz_windows_spread_accelerators')),
+    ('box_compiz_window_snapping', 'l_compiz_windows_snapping', ('list_window_snapping',)),
+    ('box_compiz_hotcorners', 'l_compiz_hotcorners', ('list_hotcorners',)),
+]
 
 class Compizsettings ():
     def __init__(self, container):
         '''Handler Initialisations.
         Obtain all references here.'''
         self.builder = Gtk.Builder()
-        self.glade = (os.path.join(settings.UI_DIR,
-                                    'compiz.ui'))
+        self.glade = 'compiz.ui'
         self.container = container
-        self.builder.add_from_file(self.glade)
         self.ui = ui(self.builder)
-        self.page = self.ui['nb_compizsettings']
-        self.page.unparent()
-
-
-# Initialise Cairo bits
-        self.window_snapping_drawable = self.ui['draw_window_snapping']
-        self._base_window_snapping_surface = cairo.ImageSurface.create_from_png(os.path.join(settings.UI_DIR, 'monitor-window-snapping.png'))
-
-        self.hotcorners_drawable = self.ui['draw_hotcorners']
-        self._base_hotcorners_surface = cairo.ImageSurface.create_from_png(os.path.join(settings.UI_DIR, 'monitor-hotcorners.png'))
 
         self.window_snapping_cboxes = {
             'cbox_window_snapping_top': [0, 'top-edge-action'],
@@ -69,11 +91,9 @@ class Compizsettings ():
             'cbox_window_snapping_right': [0, 'right-edge-action'],
             'cbox_window_snapping_bottomright': [0, 'bottom-right-corner-action']
         }
-        for box in self.window_snapping_cboxes:
-            self.window_snapping_cboxes[box][0] = gsettings.grid.get_int(self.window_snapping_cboxes[box][1])
-            self.ui[box].set_active(self.window_snapping_cboxes[box][0])
-            self.ui[box].connect("changed", self.on_cbox_window_snapping_changed, box)
-
+        # Set while a handler moves other widgets, whose own handlers
+        # must then leave the writing to it
+        self.updating = False
         self.hotcorners_cboxes = {
             'cbox_hotcorners_top': [0, 'Top'],
             'cbox_hotcorners_topleft': [0, 'TopLeft'],
@@ -84,26 +104,64 @@ class Compizsettings ():
             'cbox_hotcorners_right': [0, 'Right'],
             'cbox_hotcorners_bottomright': [0, 'BottomRight']
         }
-        self.hotcorner_values = {
-            'show_desktop': gsettings.core.get_string('show-desktop-edge').split('|'),
-            'expo': gsettings.expo.get_string('expo-edge').split('|'),
-            'window_spread': gsettings.scale.get_string('initiate-edge').split('|')
-        }
 
-        for box in self.hotcorners_cboxes:
-            if self.hotcorners_cboxes[box][1] in self.hotcorner_values['show_desktop']:
-                self.hotcorners_cboxes[box][0] = 1
-            elif self.hotcorners_cboxes[box][1] in self.hotcorner_values['expo']:
-                self.hotcorners_cboxes[box][0] = 2
-            elif self.hotcorners_cboxes[box][1] in self.hotcorner_values['window_spread']:
-                self.hotcorners_cboxes[box][0] = 3
-            else:
-                self.hotcorners_cboxes[box][0] = 0
+        # Keep the page in sync when the keys change, from here or elsewhere.
+        # Each sub-tab's sections are watched once the sub-tab is built,
+        # and the handlers keep quiet while a section runs.
+        self.handlers = quiet(self)
+        self.watcher = gsettings.watcher([])
+        self.sections = {
+            'box_compiz_general': [
+                (self.handlers.section(self.refresh_general), {
+                    'core': ('active-plugins', 'close-window-key', 'show-desktop-key'),
+                    'zoom': ('zoom-in-key', 'zoom-out-key'),
+                    'move': ('initiate-key',),
+                    'animation': ('unminimize-effects', 'minimize-effects')})],
+            'box_compiz_workspace': [
+                (self.handlers.section(self.refresh_workspace), {
+                    'core': ('hsize', 'vsize'),
+                    'expo': ('selected-color', 'expo-key')})],
+            'box_compiz_windows_spread': [
+                (self.handlers.section(self.refresh_windows_spread), {
+                    'core': ('active-plugins',),
+                    'scale': ('spacing', 'initiate-key', 'initiate-all-key')})],
+            'box_compiz_window_snapping': [
+                (self.handlers.section(self.refresh_window_snapping), {
+                    'core': ('active-plugins',),
+                    'grid': gsettings.managed['grid']})],
+            'box_compiz_hotcorners': [
+                (self.handlers.section(self.refresh_hotcorners), {
+                    'core': ('show-desktop-edge',),
+                    'expo': ('expo-edge',),
+                    'scale': ('initiate-edge',)})],
+        }
 
-            self.ui[box].set_active(self.hotcorners_cboxes[box][0])
-            self.ui[box].connect("changed", self.on_cbox_hotcorners_changed, box)
-        self.refresh()
-        self.builder.connect_signals(self)
+        self.tabs = tabs(self.builder, self.glade, subpages, requires, self.on_subpage_built)
+        self.page = self.tabs.notebook
+
+    def on_subpage_built(self, content):
+        '''Wire up a sub-tab the first time it is shown'''
+        # Initialise Cairo bits; cairo is only imported for these two tabs
+        if content == 'box_compiz_window_snapping':
+            import cairo
+            self.window_snapping_drawable = self.ui['draw_window_snapping']
+            self._base_window_snapping_surface = cairo.ImageSurface.create_from_png(settings.open_data('monitor-window-snapping.png'))
+        elif content == 'box_compiz_hotcorners':
+            import cairo
+            self.hotcorners_drawable = self.ui['draw_hotcorners']
+            self._base_hotcorners_surface = cairo.ImageSurface.create_from_png(settings.open_data('monitor-hotcorners.png'))
+
+        self.ui.hide_missing(requires, content)
+        self.watcher.add(self.sections[content])
+
+        if content == 'box_compiz_window_snapping':
+            for box in self.window_snapping_cboxes:
+                self.ui[box].connect("changed", self.handlers.on_cbox_window_snapping_changed, box)
+        elif content == 'box_compiz_hotcorners':
+            for box in self.hotcorners_cboxes:
+                self.ui[box].connect("changed", self.handlers.on_cbox_hotcorners_changed, box)
+        self.ui.bind(bindings, content)
+        self.builder.connect_signals(self.handlers)
 
     def on_draw_hotcorners_draw (self, window, cr):
         self.draw_monitor(window, cr, self._base_hotcorners_surface, self.hotcorners_cboxes, 'hotcorners')
@@ -208,41 +266,22 @@ class Compizsettings ():
 
     def on_cbox_hotcorners_changed (self, combobox, cbox_id):
         self.hotcorners_cboxes[cbox_id][0] = combobox.get_active()
-        clear_corners = []
-        if combobox.get_active() == 0:
-            clear_corners = ['show_desktop', 'expo', 'window_spread']
-
-        if combobox.get_active() == 1:
-            if self.hotcorners_cboxes[cbox_id][1] not in self.hotcorner_values['show_desktop']:
-                self.hotcorner_values['show_desktop'].append(self.hotcorners_cboxes[cbox_id][1])
-                gsettings.core.set_string('show-desktop-edge', '|'.join(self.hotcorner_values['show_desktop']))
-        else:
-            clear_corners.append('show_desktop')
-
-        if combobox.get_active() == 2:
-            if self.hotcorners_cboxes[cbox_id][1] not in self.hotcorner_values['expo']:
-                self.hotcorner_values['expo'].append(self.hotcorners_cboxes[cbox_id][1])
-                gsettings.expo.set_string('expo-edge', '|'.join(self.hotcorner_values['expo']))
-        else:
-            clear_corners.append('expo')
-
-        if combobox.get_active() == 3:
-            if self.hotcorners_cboxes[cbox_id][1] not in self.hotcorner_values['window_spread']:
-                self.hotcorner_values['window_spread'].append(self.hotcorners_cboxes[cbox_id][1])
-                gsettings.scale.set_string('initiate-edge', '|'.join(self.hotcorner_values['window_spread']))
-        else:
-            clear_corners.append('window_spread')
-
-        # Removing potentially conflicting bindings
-        if 'show_desktop' in clear_corners and self.hotcorners_cboxes[cbox_id][1] in self.hotcorner_values['show_desktop']:
-            self.hotcorner_values['show_desktop'].remove(self.hotcorners_cboxes[cbox_id][1])
-            gsettings.core.set_string('show-desktop-edge', '|'.join(self.hotcorner_values['show_desktop']))
-        if 'expo' in clear_corners and self.hotcorners_cboxes[cbox_id][1] in self.hotcorner_values['expo']:
-            self.hotcorner_values['expo'].remove(self.hotcorners_cboxes[cbox_id][1])
-            gsettings.expo.set_string('expo-edge', '|'.join(self.hotcorner_values['expo']))
-        if 'window_spread' in clear_corners and self.hotcorners_cboxes[cbox_id][1] in self.hotcorner_values['window_spread']:
-            self.hotcorner_values['window_spread'].remove(self.hotcorners_cboxes[cbox_id][1])
-            gsettings.scale.set_string('initiate-edge', '|'.join(self.hotcorner_values['window_spread']))
+        if not self.updating:
+            self.write_hotcorners([cbox_id])
+
+    def write_hotcorners(self, boxes):
+        '''Give the edges of boxes the actions their combo boxes show'''
+        changed = set()
+        for box in boxes:
+            active, edge = self.hotcorners_cboxes[box]
+            changed.update(mappings.set_hotcorner(self.hotcorner_values, edge, mappings.HOTCORNER_ACTIONS[active]))
+
+        # Moving an edge from one action to another rewrites two keys;
+        # commit them all together so compiz only reacts once.
+        with gsettings.changeset() as changes:
+            for action in changed:
+                name, key = mappings.HOTCORNER_KEYS[action]
+                changes[getattr(gsettings, name)].set_string(key, '|'.join(self.hotcorner_values[action]))
 
         self.hotcorners_drawable.queue_draw()
 
@@ -252,8 +291,14 @@ class Compizsettings ():
 #=====================================================================#
 
     def refresh(self):
+        self.watcher.refresh()
 
-        plugins = gsettings.core.get_strv('active-plugins')
+    # ===== General settings ===== #
+
+    def refresh_general(self):
+        snap = gsettings.snapshot()
+
+        plugins = snap.core.get_strv('active-plugins')
         if 'ezoom' in plugins:
             self.ui['sw_compiz_zoom'].set_active(True)
         else:
@@ -262,30 +307,27 @@ class Compizsettings ():
 
         model = self.ui['list_compiz_general_zoom_accelerators']
 
-        zoom_in_key = gsettings.zoom.get_string('zoom-in-key')
+        zoom_in_key = snap.zoom.get_string('zoom-in-key')
         iter_zoom_in_key = model.get_iter_first()
         model.set_value(iter_zoom_in_key, 1, zoom_in_key)
 
-        zoom_out_key = gsettings.zoom.get_string('zoom-out-key')
+        zoom_out_key = snap.zoom.get_string('zoom-out-key')
         iter_zoom_out_key = model.iter_next(iter_zoom_in_key)
         model.set_value(iter_zoom_out_key, 1, zoom_out_key)
 
         del model, zoom_in_key, iter_zoom_in_key, zoom_out_key, iter_zoom_out_key
 
-        self.ui['cbox_opengl'].set_active(gsettings.opengl.get_int('texture-filter'))
-        self.ui['check_synctovblank'].set_active(gsettings.opengl.get_boolean('sync-to-vblank'))
-
         model = self.ui['list_compiz_general_keys_accelerators']
 
-        close_window_key = gsettings.core.get_string('close-window-key')
+        close_window_key = snap.core.get_string('close-window-key')
         iter_close_window_key = model.get_iter_first()
         model.set_value(iter_close_window_key, 1, close_window_key)
 
-        initiate_key = gsettings.move.get_string('initiate-key')
+        initiate_key = snap.move.get_string('initiate-key')
         iter_initiate_key = model.iter_next(iter_close_window_key)
         model.set_value(iter_initiate_key, 1, initiate_key)
 
-        show_desktop_key = gsettings.core.get_string('show-desktop-key')
+        show_desktop_key = snap.core.get_string('show-desktop-key')
         iter_show_desktop_key = model.iter_next(iter_initiate_key)
         model.set_value(iter_show_desktop_key, 1, show_desktop_key)
 
@@ -293,7 +335,7 @@ class Compizsettings ():
 
 
         # Animations
-        unminimize_value = gsettings.animation.get_strv('unminimize-effects')
+        unminimize_value = snap.animation.get_strv('unminimize-effects')
 
         if unminimize_value == ['animation:None']:
             self.ui['cbox_unminimize_animation'].set_active(0)
@@ -321,7 +363,7 @@ class Compizsettings ():
             self.ui['cbox_unminimize_animation'].set_active(0)
         del unminimize_value
 
-        minimize_value = gsettings.animation.get_strv('minimize-effects')
+        minimize_value = snap.animation.get_strv('minimize-effects')
 
         if minimize_value == ['animation:None']:
             self.ui['cbox_minimize_animation'].set_active(0)
@@ -349,10 +391,13 @@ class Compizsettings ():
             self.ui['cbox_minimize_animation'].set_active(0)
         del minimize_value
 
-        # ===== Workspace settings ===== #
+    # ===== Workspace settings ===== #
+
+    def refresh_workspace(self):
+        snap = gsettings.snapshot()
 
-        hsize = gsettings.core.get_int('hsize')
-        vsize = gsettings.core.get_int('vsize')
+        hsize = snap.core.get_int('hsize')
+        vsize = snap.core.get_int('vsize')
         dependants = ['spin_horizontal_desktop',
                     'spin_vertical_desktop']
 
@@ -367,7 +412,7 @@ class Compizsettings ():
         self.ui['spin_vertical_desktop'].set_value(vsize)
         del hsize, vsize
 
-        color = gsettings.expo.get_string('selected-color')
+        color = snap.expo.get_string('selected-color')
         valid, gdkcolor = Gdk.Color.parse(color[:-2])
         if valid:
             self.ui['color_desk_outline'].set_color(gdkcolor)
@@ -375,63 +420,80 @@ class Compizsettings ():
 
         model = self.ui['list_compiz_workspace_accelerators']
 
-        expo_key = gsettings.expo.get_string('expo-key')
+        expo_key = snap.expo.get_string('expo-key')
         iter_expo_key = model.get_iter_first()
         model.set_value(iter_expo_key, 1, expo_key)
 
         del model, expo_key, iter_expo_key
 
-        # ===== Windows Spread settings ===== #
+    # ===== Windows Spread settings ===== #
 
-        plugins = gsettings.core.get_strv('active-plugins')
+    def refresh_windows_spread(self):
+        snap = gsettings.snapshot()
+
+        plugins = snap.core.get_strv('active-plugins')
         if 'scale' in plugins:
             self.ui['sw_windows_spread'].set_active(True)
         else:
             self.ui['sw_windows_spread'].set_active(False)
         del plugins
 
-        self.ui['spin_compiz_spacing'].set_value(gsettings.scale.get_int('spacing'))
-
-        if gsettings.scale.get_int('overlay-icon') >=  1:
-            self.ui['check_overlay_emblem'].set_active(True)
-        else:
-            self.ui['check_overlay_emblem'].set_active(False)
-
-        self.ui['check_click_desktop'].set_active(gsettings.scale.get_boolean('show-desktop'))
+        self.ui['spin_compiz_spacing'].set_value(snap.scale.get_int('spacing'))
 
         model = self.ui['list_compiz_windows_spread_accelerators']
 
-        initiate_key = gsettings.scale.get_string('initiate-key')
+        initiate_key = snap.scale.get_string('initiate-key')
         iter_initiate_key = model.get_iter_first()
         model.set_value(iter_initiate_key, 1, initiate_key)
 
-        initiate_all_key = gsettings.scale.get_string('initiate-all-key')
+        initiate_all_key = snap.scale.get_string('initiate-all-key')
         iter_initiate_all_key = model.iter_next(iter_initiate_key)
         model.set_value(iter_initiate_all_key, 1, initiate_all_key)
 
         del model, initiate_key, iter_initiate_key, initiate_all_key, iter_initiate_all_key
 
-        # ===== Window Snapping settings ===== #
+    # ===== Window Snapping settings ===== #
 
-        plugins = gsettings.core.get_strv('active-plugins')
+    def refresh_window_snapping(self):
+        snap = gsettings.snapshot()
+
+        plugins = snap.core.get_strv('active-plugins')
         if 'grid' in plugins:
             self.ui['sw_window_snapping'].set_active(True)
         else:
             self.ui['sw_window_snapping'].set_active(False)
         del plugins
 
-        color = gsettings.grid.get_string('fill-color')
+        color = snap.grid.get_string('fill-color')
         valid, gdkcolor = Gdk.Color.parse(color[:-2])
         if valid:
             self.ui['color_fill_color'].set_color(gdkcolor)
         del color, valid, gdkcolor
 
-        color = gsettings.grid.get_string('outline-color')
+        color = snap.grid.get_string('outline-color')
         valid, gdkcolor = Gdk.Color.parse(color[:-2])
         if valid:
             self.ui['color_outline_color'].set_color(gdkcolor)
         del color, valid, gdkcolor
 
+        for box in self.window_snapping_cboxes:
+            self.window_snapping_cboxes[box][0] = snap.grid.get_int(self.window_snapping_cboxes[box][1])
+            self.ui[box].set_active(self.window_snapping_cboxes[box][0])
+        self.window_snapping_drawable.queue_draw()
+
+    # ===== Hotcorners settings ===== #
+
+    def refresh_hotcorners(self):
+        snap = gsettings.snapshot()
+
+        self.hotcorner_values = mappings.hotcorner_values(snap)
+
+        for box in self.hotcorners_cboxes:
+            action = mappings.hotcorner_action(self.hotcorner_values, self.hotcorners_cboxes[box][1])
+            self.hotcorners_cboxes[box][0] = mappings.HOTCORNER_ACTIONS.index(action)
+            self.ui[box].set_active(self.hotcorners_cboxes[box][0])
+        self.hotcorners_drawable.queue_draw()
+
 # TODO : Find a clever way or set each one manually.
 # Do it the dumb way now. BIIIG refactoring needed later.
 
@@ -486,15 +548,6 @@ class Compizsettings ():
         elif path  ==  '1':
             gsettings.zoom.set_string('zoom-out-key', "Disabled")
 
-    #-----General: OpenGL
-
-    def on_cbox_opengl_changed(self, widget, udata = None):
-        mode = self.ui['cbox_opengl'].get_active()
-        gsettings.opengl.set_int('texture-filter', mode)
-
-    def on_check_synctovblank_toggled(self, widget, udata = None):
-        gsettings.opengl.set_boolean('sync-to-vblank', self.ui['check_synctovblank'].get_active())
-
     # keyboard widgets in compiz-general-keys
 
     def on_craccel_compiz_general_keys_accel_edited(self, craccel, path, key, mods, hwcode, model = None):
@@ -531,17 +584,18 @@ class Compizsettings ():
         gsettings.animation.set_strv('minimize-effects', ['animation:'+combobox_text])
 
     def on_b_compiz_general_reset_clicked(self, widget):
-        gsettings.core.reset('active-plugins')
-        gsettings.animation.reset('unminimize-effects')
-        gsettings.animation.reset('minimize-effects')
-        gsettings.zoom.reset('zoom-in-key')
-        gsettings.zoom.reset('zoom-out-key')
-        gsettings.opengl.reset('texture-filter')
-        gsettings.opengl.reset('sync-to-vblank')
-        gsettings.core.reset('close-window-key')
-        gsettings.move.reset('initiate-key')
-        gsettings.core.reset('show-desktop-key')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            changes[gsettings.animation].reset('unminimize-effects')
+            changes[gsettings.animation].reset('minimize-effects')
+            changes[gsettings.zoom].reset('zoom-in-key')
+            changes[gsettings.zoom].reset('zoom-out-key')
+            changes[gsettings.opengl].reset('texture-filter')
+            changes[gsettings.opengl].reset('sync-to-vblank')
+            changes[gsettings.move].reset('initiate-key')
+            core = changes[gsettings.core]
+            core.reset('close-window-key')
+            core.reset('show-desktop-key')
+            core.reset('active-plugins')
 
 #-----BEGIN: Workspaces -----
 
@@ -553,25 +607,32 @@ class Compizsettings ():
                     'spin_horizontal_desktop',
                     'spin_vertical_desktop']
 
+        size = 2 if widget.get_active() else 1
         if widget.get_active():
             self.ui.sensitize(dependants)
-            gsettings.core.set_int('hsize', 2)
-            gsettings.core.set_int('hsize', 2)
-            self.ui['spin_horizontal_desktop'].set_value(2)
-            self.ui['spin_vertical_desktop'].set_value(2)
-
         else:
             self.ui.unsensitize(dependants)
-            gsettings.core.set_int('hsize', 1)
-            gsettings.core.set_int('vsize', 1)
-            self.ui['spin_horizontal_desktop'].set_value(1)
-            self.ui['spin_vertical_desktop'].set_value(1)
+        with gsettings.changeset() as changes:
+            changes[gsettings.core].set_int('hsize', size)
+            changes[gsettings.core].set_int('vsize', size)
+
+        # The spin buttons only show what was just written
+        self.updating = True
+        try:
+            self.ui['spin_horizontal_desktop'].set_value(size)
+            self.ui['spin_vertical_desktop'].set_value(size)
+        finally:
+            self.updating = False
 
     def on_spin_horizontal_desktop_value_changed(self, widget, udata = None):
+        if self.updating:
+            return
         hsize = self.ui['spin_horizontal_desktop'].get_value()
         gsettings.core.set_int('hsize', hsize)
 
     def on_spin_vertical_desktop_value_changed(self, widget, udata = None):
+        if self.updating:
+            return
         vsize = self.ui['spin_vertical_desktop'].get_value()
         gsettings.core.set_int('vsize', vsize)
 
@@ -596,11 +657,11 @@ class Compizsettings ():
         gsettings.expo.set_string('expo-key', "Disabled")
 
     def on_b_compiz_workspace_reset_clicked(self, widget):
-        gsettings.core.reset('hsize')
-        gsettings.core.reset('vsize')
-        gsettings.expo.reset('selected-color')
-        gsettings.expo.reset('expo-key')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            changes[gsettings.core].reset('hsize')
+            changes[gsettings.core].reset('vsize')
+            changes[gsettings.expo].reset('selected-color')
+            changes[gsettings.expo].reset('expo-key')
 
 #-----BEGIN: Windows Spread -----
 
@@ -629,20 +690,7 @@ class Compizsettings ():
                 gsettings.core.set_strv('active-plugins', plugins)
 
     def on_spin_compiz_spacing_value_changed(self, widget):
-        gsettings.scale.set_int('spacing', self.ui['spin_compiz_spacing'].get_value())
-
-    def on_check_overlay_emblem_toggled(self, widget):
-        if self.ui['check_overlay_emblem'].get_active():
-            gsettings.scale.set_int('overlay-icon', 1)
-        else:
-            gsettings.scale.set_int('overlay-icon', 0)
-
-    def on_check_click_desktop_toggled(self, widget):
-
-        if self.ui['check_click_desktop'].get_active():
-            gsettings.scale.set_boolean('show-desktop', True)
-        else:
-            gsettings.scale.set_boolean('show-desktop', False)
+        gsettings.schedule(gsettings.scale, 'spacing', int(self.ui['spin_compiz_spacing'].get_value()))
 
     # keyboard widgets in compiz-windows-spread
     def on_craccel_compiz_windows_spread_accel_edited(self, craccel, path, key, mods, hwcode, model = None):
@@ -665,13 +713,14 @@ class Compizsettings ():
             gsettings.scale.set_string("initiate-all-key", "Disabled")
 
     def on_b_compiz_windows_spread_reset_clicked(self, widget):
-        gsettings.core.reset('active-plugins')
-        gsettings.scale.reset('spacing')
-        gsettings.scale.reset('overlay-icon')
-        gsettings.scale.reset('show-desktop')
-        gsettings.scale.reset('initiate-key')
-        gsettings.scale.reset('initiate-all-key')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            scale = changes[gsettings.scale]
+            scale.reset('spacing')
+            scale.reset('overlay-icon')
+            scale.reset('show-desktop')
+            scale.reset('initiate-key')
+            scale.reset('initiate-all-key')
+            changes[gsettings.core].reset('active-plugins')
 
     # Compiz - Window snapping
     def on_sw_window_snapping_active_notify(self, widget, udata=None):
@@ -699,13 +748,15 @@ class Compizsettings ():
         gsettings.grid.set_string('fill-color', colorhash)
 
     def on_b_compiz_windowsnapping_reset_clicked(self, widget):
-        gsettings.core.reset('active-plugins')
-        gsettings.core.reset('show-desktop-edge')
-        gsettings.expo.reset('expo-edge')
-        gsettings.grid.reset('fill-color')
-        gsettings.grid.reset('outline-color')
-        gsettings.grid.reset('top-edge-action')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            changes[gsettings.expo].reset('expo-edge')
+            grid = changes[gsettings.grid]
+            grid.reset('fill-color')
+            grid.reset('outline-color')
+            grid.reset('top-edge-action')
+            core = changes[gsettings.core]
+            core.reset('show-desktop-edge')
+            core.reset('active-plugins')
 
 
 # ----- BEGIN: Hot Corners -----
@@ -725,14 +776,22 @@ class Compizsettings ():
  
         if widget.get_active():
             self.ui.sensitize(dependants)
-            for box in self.hotcorners_cboxes:
-                self.ui[box].set_active(self.hotcorners_previous[box])
- 
+            actions = {box: self.hotcorners_previous.get(box, 0) for box in self.hotcorners_cboxes}
         else:
             self.ui.unsensitize(dependants)
             for box in self.hotcorners_cboxes:
                 self.hotcorners_previous[box] = self.hotcorners_cboxes[box][0]
-                self.ui[box].set_active(0)
+            actions = {box: 0 for box in self.hotcorners_cboxes}
+
+        # Set every combo box first, then rewrite all the edges in one commit
+        self.updating = True
+        try:
+            for box, active in actions.items():
+                self.hotcorners_cboxes[box][0] = active
+                self.ui[box].set_active(active)
+        finally:
+            self.updating = False
+        self.write_hotcorners(self.hotcorners_cboxes)
 
 if __name__ == '__main__':
 # Fire up the Engines
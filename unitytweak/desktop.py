@@ -32,87 +32,93 @@ import os, os.path
 
 from gi.repository import Gtk, Gio
 
-from .ui import ui
+from .ui import ui, quiet, INVERT
 from . import settings
 from . import gsettings
 
+# Widgets to hide when the schemas they need are not installed
+requires = {
+    'box_desktop_icons_display':    ('desktop',),
+    'l_scrollbars':                 ('scrollbars',),
+    'grid_radio_scrollbars':        ('scrollbars',),
+    'grid_touchpad_scrolling':      ('touch',),
+}
+
+# Widgets that show a single key as it is: (object, key, widget, property,
+# mapping, dependants). See ui.bind.
+bindings = [
+    # Icons
+    ('background', 'show-desktop-icons', 'switch_desktop_icons', 'active', None,
+        ('l_desktop_icons_display', 'check_desktop_home', 'check_desktop_networkserver',
+         'check_desktop_trash', 'check_desktop_devices')),
+    ('desktop', 'home-icon-visible', 'check_desktop_home', 'active', None, ()),
+    ('desktop', 'network-icon-visible', 'check_desktop_networkserver', 'active', None, ()),
+    ('desktop', 'trash-icon-visible', 'check_desktop_trash', 'active', None, ()),
+    ('desktop', 'volumes-visible', 'check_desktop_devices', 'active', None, ()),
+    # Security
+    ('lockdown', 'disable-lock-screen', 'check_security_lock_screen', 'active', INVERT, ()),
+    ('lockdown', 'disable-log-out', 'check_security_logout', 'active', INVERT, ()),
+    ('lockdown', 'disable-user-switching', 'check_security_user_switching', 'active', INVERT, ()),
+]
+
 class Desktopsettings ():
     def __init__(self, container):
         '''Handler Initialisations.
         Obtain all references here.'''
         self.builder = Gtk.Builder()
-        self.glade = (os.path.join(settings.UI_DIR,
-                                    'desktop.ui'))
+        self.glade = 'desktop.ui'
         self.container = container
-        self.builder.add_from_file(self.glade)
+        settings.add_ui(self.builder, self.glade)
         self.ui = ui(self.builder)
         self.page = self.ui['nb_desktop_settings']
         self.page.unparent()
 
+        self.ui.hide_missing(requires)
+
+        # Keep the page in sync when the keys change, from here or elsewhere,
+        # and the handlers keep quiet while a section runs
+        self.handlers = quiet(self)
+        self.watcher = gsettings.watcher([
+            (self.handlers.section(self.refresh_security), {
+                'lockdown': ('disable-printing',)}),
+            (self.handlers.section(self.refresh_scrolling), {
+                'interface': ('ubuntu-overlay-scrollbars',),
+                'scrollbars': ('scrollbar-mode',)}),
+            (self.handlers.section(self.refresh_touchpad), {
+                'touch': ('scroll-method',)}),
+        ])
+
         self.refresh()
-        self.builder.connect_signals(self)
+        self.ui.bind(bindings)
+        self.builder.connect_signals(self.handlers)
 #=====================================================================#
 #                                Helpers                              #
 #=====================================================================#
     def refresh(self):
         '''Reads the current config and refreshes the displayed values'''
+        self.watcher.refresh()
 
-        # ===== Icons ===== #
-        desktop_icons = gsettings.background.get_boolean('show-desktop-icons')
-        dependants = ['l_desktop_icons_display',
-                    'check_desktop_home',
-                    'check_desktop_networkserver',
-                    'check_desktop_trash',
-                    'check_desktop_devices']
-        if desktop_icons == True:
-            self.ui['switch_desktop_icons'].set_active(True)
-            self.ui.sensitize(dependants)
-        else:
-            self.ui['switch_desktop_icons'].set_active(False)
-            self.ui.unsensitize(dependants)
-        del desktop_icons
-        del dependants
-
-        self.ui['check_desktop_home'].set_active(gsettings.desktop.get_boolean('home-icon-visible'))
-        self.ui['check_desktop_networkserver'].set_active(gsettings.desktop.get_boolean('network-icon-visible'))
-        self.ui['check_desktop_trash'].set_active(gsettings.desktop.get_boolean('trash-icon-visible'))
-        self.ui['check_desktop_devices'].set_active(gsettings.desktop.get_boolean('volumes-visible'))
-
-
-        # ===== Security ===== #
+    # ===== Security ===== #
 
-        lockscreen = gsettings.lockdown.get_boolean('disable-lock-screen')
-        if lockscreen == True:
-            self.ui['check_security_lock_screen'].set_active(False)
-        else:
-            self.ui['check_security_lock_screen'].set_active(True)
-        del lockscreen
-
-        logout = gsettings.lockdown.get_boolean('disable-log-out')
-        if logout == True:
-            self.ui['check_security_logout'].set_active(False)
-        else:
-            self.ui['check_security_logout'].set_active(True)
-        del logout
+    def refresh_security(self):
+        snap = gsettings.snapshot()
 
-        printing = gsettings.lockdown.get_boolean('disable-printing')
+        printing = snap.lockdown.get_boolean('disable-printing')
         if printing == True:
             self.ui['check_security_printing'].set_active(False)
         else:
             self.ui['check_security_printing'].set_active(True)
         del printing
 
-        user_switching = gsettings.lockdown.get_boolean('disable-user-switching')
-        if user_switching == True:
-            self.ui['check_security_user_switching'].set_active(False)
-        else:
-            self.ui['check_security_user_switching'].set_active(True)
-        del user_switching
+    # ===== Scrolling ===== #
 
-        # ===== Scrolling ===== #
+    def refresh_scrolling(self):
+        snap = gsettings.snapshot()
 
         # Scrollbars
-        overlay_scrollbars = gsettings.interface.get_boolean('ubuntu-overlay-scrollbars')
+        # Only Ubuntu's GTK has overlay scrollbars to turn off
+        overlay_scrollbars = ('ubuntu-overlay-scrollbars' not in snap.interface or
+                              snap.interface.get_boolean('ubuntu-overlay-scrollbars'))
         dependants = ['l_overlay_scrollbar_mode',
                     'cbox_overlay_scrollbar_mode']
 
@@ -125,7 +131,7 @@ class Desktopsettings ():
         del overlay_scrollbars, dependants
 
         # Scrollbar mode
-        scrollbar_mode = gsettings.scrollbars.get_string('scrollbar-mode')
+        scrollbar_mode = snap.scrollbars.get_string('scrollbar-mode')
         if scrollbar_mode == 'overlay-auto':
             self.ui['cbox_overlay_scrollbar_mode'].set_active(0)
         elif scrollbar_mode == 'overlay-pointer':
@@ -135,8 +141,11 @@ class Desktopsettings ():
         else:
             self.ui['cbox_overlay_scrollbar_mode'].set_active(0)
 
+    def refresh_touchpad(self):
+        snap = gsettings.snapshot()
+
         # Touchpad scroll mode
-        scroll_mode = gsettings.touch.get_string('scroll-method')
+        scroll_mode = snap.touch.get_string('scroll-method')
         if scroll_mode == 'edge-scrolling':
             self.ui['radio_edge'].set_active(True)
         else:
@@ -156,79 +165,31 @@ class Desktopsettings ():
 
 #======== Begin Desktop Icons Settings
 
-    def on_switch_desktop_icons_active_notify(self, widget, udata = None):
-        dependants = ['l_desktop_icons_display',
-                    'check_desktop_home',
-                    'check_desktop_networkserver',
-                    'check_desktop_trash',
-                    'check_desktop_devices']
-
-        if self.ui['switch_desktop_icons'].get_active():
-            gsettings.background.set_boolean("show-desktop-icons", True)
-            self.ui.sensitize(dependants)
-        else:
-            self.ui.unsensitize(dependants)
-            gsettings.background.set_boolean("show-desktop-icons", False)
-
-    def on_check_desktop_home_toggled(self, widget, udata = None):
-        gsettings.desktop.set_boolean('home-icon-visible',
-                                 self.ui['check_desktop_home'].get_active())
-
-    def on_check_desktop_networkserver_toggled(self, widget, udata = None):
-        gsettings.desktop.set_boolean('network-icon-visible',
-                            self.ui['check_desktop_networkserver'].get_active())
-
-    def on_check_desktop_trash_toggled(self, widget, udata = None):
-        gsettings.desktop.set_boolean('trash-icon-visible',
-                            self.ui['check_desktop_trash'].get_active())
-
-    def on_check_desktop_devices_toggled(self, widget, udata = None):
-        gsettings.desktop.set_boolean('volumes-visible',
-                            self.ui['check_desktop_devices'].get_active())
-
     def on_b_desktop_settings_icons_reset_clicked(self, widget):
-        gsettings.desktop.reset('show-desktop-icons')
-        gsettings.desktop.reset('home-icon-visible')
-        gsettings.desktop.reset('network-icon-visible')
-        gsettings.desktop.reset('trash-icon-visible')
-        gsettings.desktop.reset('volumes-visible')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            changes[gsettings.background].reset('show-desktop-icons')
+            desktop = changes[gsettings.desktop]
+            desktop.reset('home-icon-visible')
+            desktop.reset('network-icon-visible')
+            desktop.reset('trash-icon-visible')
+            desktop.reset('volumes-visible')
 
 #======== Begin Desktop Security Settings
 
-    def on_check_security_lock_screen_toggled(self, widget, udata = None):
-        if self.ui['check_security_lock_screen'].get_active() == True :
-            gsettings.lockdown.set_boolean('disable-lock-screen', False)
-        else:
-            gsettings.lockdown.set_boolean('disable-lock-screen', True)
-
-    def on_check_security_logout_toggled(self, widget, udata = None):
-        if self.ui['check_security_logout'].get_active() == True :
-            gsettings.lockdown.set_boolean('disable-log-out', False)
-        else:
-            gsettings.lockdown.set_boolean('disable-log-out', True)
-
     def on_check_security_printing_toggled(self, widget, udata = None):
-        if self.ui['check_security_printing'].get_active() == True :
-            gsettings.lockdown.set_boolean('disable-printing', False)
-            gsettings.lockdown.set_boolean('disable-print-setup', False)
-        else:
-            gsettings.lockdown.set_boolean('disable-printing', True)
-            gsettings.lockdown.set_boolean('disable-print-setup', True)
-
-    def on_check_security_user_switching_toggled(self, widget, udata = None):
-        if self.ui['check_security_user_switching'].get_active() == True :
-            gsettings.lockdown.set_boolean('disable-user-switching', False)
-        else:
-            gsettings.lockdown.set_boolean('disable-user-switching', True)
+        disabled = not self.ui['check_security_printing'].get_active()
+        with gsettings.changeset() as changes:
+            changes[gsettings.lockdown].set_boolean('disable-printing', disabled)
+            changes[gsettings.lockdown].set_boolean('disable-print-setup', disabled)
 
     def on_b_desktop_settings_security_reset_clicked(self, widget):
-        gsettings.lockdown.reset('disable-lock-screen')
-        gsettings.lockdown.reset('disable-log-out')
-        gsettings.lockdown.reset('disable-printing')
-        gsettings.lockdown.reset('disable-print-setup')
-        gsettings.lockdown.reset('disable-user-switching')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            lockdown = changes[gsettings.lockdown]
+            lockdown.reset('disable-lock-screen')
+            lockdown.reset('disable-log-out')
+            lockdown.reset('disable-printing')
+            lockdown.reset('disable-print-setup')
+            lockdown.reset('disable-user-switching')
 
 #======== Begin Desktop Scrolling Settings
 
@@ -280,9 +241,11 @@ class Desktopsettings ():
             gsettings.touch.set_string('scroll-method', 'edge-scrolling')
 
     def on_b_settings_scrolling_reset_clicked(self, widget):
-        gsettings.touch.reset('scroll-method')
-        gsettings.scrollbars.reset('scrollbar-mode')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            if gsettings.available('touch'):
+                changes[gsettings.touch].reset('scroll-method')
+            if gsettings.available('scrollbars'):
+                changes[gsettings.scrollbars].reset('scrollbar-mode')
 
 
 if __name__ == '__main__':
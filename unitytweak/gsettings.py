@@ -28,75 +28,488 @@
 # You should have received a copy of the GNU General Public License along with
 # this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
 
-from gi.repository import Gio,  Gdk
+import time
+from collections.abc import Mapping
 
-def plugin(plugin):
+from gi.repository import GLib, Gio
+
+from . import schemas
+
+# Registry of every Gio.Settings object the tool has built, keyed by
+# (schema, path). Objects are only constructed the first time they are
+# asked for; after that the same instance is handed back.
+_registry = {}
+_timings = {}
+# Reverse lookup from a registry object to its (schema, path)
+_keys = {}
+# Second, permanently delayed object per (schema, path) used by changesets
+_delayed = {}
+
+# Where settings objects come from. None means the installed schemas
+# and the session's dconf; see configure().
+_source = None
+_backend = None
+
+def _new(schema, path):
+    if _source is not None or _backend is not None:
+        source = _source or Gio.SettingsSchemaSource.get_default()
+        return Gio.Settings.new_full(source.lookup(schema, True), _backend, path)
+    if path:
+        return Gio.Settings(schema = schema,  path = path)
+    return Gio.Settings(schema = schema)
+
+def configure(source = None, backend = None):
+    """Build settings objects from a Gio.SettingsSchemaSource and a
+    Gio.SettingsBackend instead of the installed schemas and dconf, or
+    go back to those with no arguments. Every object built so far is
+    forgotten, so call this before creating any page."""
+    global _source, _backend
+    _source = source
+    _backend = backend
+    schemas.use(source)
+    for cache in (_registry, _timings, _keys, _delayed, _pending, _types,
+                  _values, _watched, _snapshot.views):
+        cache.clear()
+    for name in objects:
+        globals().pop(name, None)
+
+def get(schema, path = None):
+    """Return the shared Gio.Settings object for schema (and path),
+    building it on first use"""
+    key = (schema, path)
+    try:
+        return _registry[key]
+    except KeyError:
+        pass
+    # Gio.Settings aborts the whole process on an unknown schema
+    if not schemas.available(schema):
+        raise LookupError("GSettings schema {} is not installed".format(schema))
+    start = time.perf_counter()
+    settings = _new(schema, path)
+    _timings[key] = time.perf_counter() - start
+    _registry[key] = settings
+    _keys[settings] = key
+    return settings
+
+def stats():
+    """Return a list of (schema, path, seconds) for every settings object
+    built so far, in order of creation"""
+    return [(schema, path, seconds) for (schema, path), seconds in _timings.items()]
+
+class changeset():
+    """Group the writes of one user action into a single commit per schema.
+
+    Writes made through a changeset go to delayed twins of the registry
+    objects and reach dconf together when the block ends. If anything
+    raises inside the block, every pending change is reverted instead.
+    Keys written in the block drop their scheduled writes (see cancel()).
+
+        with gsettings.changeset() as changes:
+            changes[gsettings.unityshell].reset('icon-size')
+            changes[gsettings.launcher].set_strv('favorites', fav)
+    """
+    def __init__(self):
+        self.pending = []
+        self.handlers = []
+
+    def __getitem__(self, settings):
+        """Return the delayed twin of a registry settings object"""
+        key = _keys[settings]
+        try:
+            delayed = _delayed[key]
+        except KeyError:
+            delayed = _delayed[key] = _new(*key)
+            delayed.delay()
+        if delayed not in self.pending:
+            self.pending.append(delayed)
+            # A twin reports its own writes straight away
+            self.handlers.append((delayed, delayed.connect('changed', self.on_changed, settings)))
+        return delayed
+
+    def on_changed(self, delayed, key, settings):
+        cancel(settings, key)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.apply()
+        else:
+            self.revert()
+        return False
+
+    def apply(self):
+        try:
+            for delayed in self.pending:
+                delayed.apply()
+        except Exception:
+            self.revert()
+            raise
+        self.done()
+
+    def revert(self):
+        for delayed in self.pending:
+            delayed.revert()
+        self.done()
+
+    def done(self):
+        for delayed, handler in self.handlers:
+            delayed.disconnect(handler)
+        self.pending = []
+        self.handlers = []
+
+# Writes waiting in the scheduler, keyed by (settings, key). Each entry
+# is [variant, timeout source id, time of first pending write, done]
+_pending = {}
+_types = {}
+
+def schedule(settings, key, value, debounce = 150, throttle = 500, done = None):
+    """Write value to key once it stops changing for debounce milliseconds.
+
+    Meant for sliders and spin buttons, which fire on every tick. Later
+    values for the same key replace earlier ones, a write is forced at
+    least every throttle milliseconds while the value keeps moving
+    (never if throttle is None), and writes that would not change the
+    stored value are dropped. done, if given, is called with no
+    arguments once the value is written, dropped or cancelled."""
+    pending_key = (settings, key)
+    try:
+        value_type = _types[pending_key]
+    except KeyError:
+        value_type = _types[pending_key] = settings.get_value(key).get_type_string()
+    variant = GLib.Variant(value_type, value)
+
+    now = time.monotonic()
+    try:
+        pending = _pending[pending_key]
+    except KeyError:
+        pending = _pending[pending_key] = [variant, None, now, done]
+    else:
+        GLib.source_remove(pending[1])
+        pending[0] = variant
+        pending[3] = done
+
+    if throttle is not None and (now - pending[2]) * 1000 >= throttle:
+        _write(pending_key)
+    else:
+        pending[1] = GLib.timeout_add(debounce, _write, pending_key)
+
+def _write(pending_key):
+    settings, key = pending_key
+    variant, source, first, done = _pending.pop(pending_key)
+    if not settings.get_value(key).equal(variant):
+        settings.set_value(key, variant)
+    if done:
+        done()
+    return False
+
+def scheduled(settings, key):
+    """Return the value waiting to be written to key, or None"""
+    try:
+        return _pending[(settings, key)][0].unpack()
+    except KeyError:
+        return None
+
+def cancel(settings, key):
+    """Drop the scheduled write to key, if any. Call this before writing
+    a key directly that a slider also schedules, or the slider's value
+    lands on top of it once the timer fires."""
+    try:
+        pending = _pending.pop((settings, key))
+    except KeyError:
+        return
+    GLib.source_remove(pending[1])
+    if pending[3]:
+        pending[3]()
+
+def flush():
+    """Write every scheduled value now. Call this before quitting."""
+    for pending_key in list(_pending):
+        GLib.source_remove(_pending[pending_key][1])
+        _write(pending_key)
+    Gio.Settings.sync()
+
+def plugin_id(plugin):
     schema = 'org.compiz.'+plugin
     path = '/org/compiz/profiles/unity/plugins/'+plugin+'/'
-    return Gio.Settings(schema = schema,  path = path)
+    return (schema, path)
+
+def plugin(plugin):
+    return get(*plugin_id(plugin))
 
 def unity(child = None):
     schema = 'com.canonical.Unity'
     schema = schema+'.'+child if child else schema
-    return Gio.Settings(schema)
+    return get(schema)
 
 def unity_webapps(child = None):
     schema = 'com.canonical.unity'
     schema = schema+'.'+child if child else schema
-    return Gio.Settings(schema)
+    return get(schema)
 
 def canonical(child):
     schema = 'com.canonical.'+child
-    return Gio.Settings(schema)
+    return get(schema)
 
 def compiz(child):
     schema = 'org.compiz.'+child
-    return Gio.Settings(schema)
+    return get(schema)
 
 def gnome(child):
     schema = 'org.gnome.'+child
-    return Gio.Settings(schema)
+    return get(schema)
 
 def color_to_hash(c):
     """Convert a Gdk.Color or Gdk.RGBA object to hex representation"""
+    # Only the pages pass colours in, keep Gdk out of command line runs
+    from gi.repository import Gdk
     if isinstance(c, Gdk.Color):
         return "#{:02x}{:02x}{:02x}ff".format(*[round(x*255) for x in [c.red_float, c.green_float, c.blue_float]])
-    if isinstance(x, Gdk.RGBA):
+    if isinstance(c, Gdk.RGBA):
         return "#{:02x}{:02x}{:02x}{:02x}".format(*[round(x*255) for x in [c.red, c.green, c.blue, c.alpha]])
     # If it is neither a Gdk.Color object nor a Gdk.RGBA object,
     raise NotImplementedError
 
 # GSettings objects go here
 
-# Sorted by function type and alphabetical order
-
-bluetooth = canonical('indicator.bluetooth')
-datetime = canonical('indicator.datetime')
-power = canonical('indicator.power')
-scrollbars= canonical('desktop.interface')
-session = canonical('indicator.session')
-sound = canonical('indicator.sound')
-
-antialiasing = gnome('settings-daemon.plugins.xsettings')
-background = gnome('desktop.background')
-desktop = gnome('nautilus.desktop')
-interface = gnome('desktop.interface')
-lockdown = gnome('desktop.lockdown')
-wm = gnome('desktop.wm.preferences')
-touch = gnome('settings-daemon.peripherals.touchpad')
-
-animation = plugin('animation')
-core = plugin('core')
-expo = plugin('expo')
-grid = plugin('grid')
-move = plugin('move')
-opengl = plugin('opengl')
-scale = plugin('scale')
-unityshell = plugin('unityshell')
-zoom = plugin('ezoom')
-
-launcher = unity('Launcher')
-lens_apps = unity('ApplicationsLens')
-lenses = unity('Lenses')
-lens_files = unity('FilesLens')
-webapps = unity_webapps('webapps')
+# Sorted by function type and alphabetical order.
+# Each name is resolved through the registry the first time it is used,
+# so importing this module does not touch dconf at all.
+
+objects = {
+    'bluetooth':    ('com.canonical.indicator.bluetooth', None),
+    'datetime':     ('com.canonical.indicator.datetime', None),
+    'power':        ('com.canonical.indicator.power', None),
+    'scrollbars':   ('com.canonical.desktop.interface', None),
+    'session':      ('com.canonical.indicator.session', None),
+    'sound':        ('com.canonical.indicator.sound', None),
+
+    'antialiasing': ('org.gnome.settings-daemon.plugins.xsettings', None),
+    'background':   ('org.gnome.desktop.background', None),
+    'desktop':      ('org.gnome.nautilus.desktop', None),
+    'interface':    ('org.gnome.desktop.interface', None),
+    'lockdown':     ('org.gnome.desktop.lockdown', None),
+    'wm':           ('org.gnome.desktop.wm.preferences', None),
+    'touch':        ('org.gnome.settings-daemon.peripherals.touchpad', None),
+
+    'animation':    plugin_id('animation'),
+    'core':         plugin_id('core'),
+    'expo':         plugin_id('expo'),
+    'grid':         plugin_id('grid'),
+    'move':         plugin_id('move'),
+    'opengl':       plugin_id('opengl'),
+    'scale':        plugin_id('scale'),
+    'unityshell':   plugin_id('unityshell'),
+    'zoom':         plugin_id('ezoom'),
+
+    'launcher':     ('com.canonical.Unity.Launcher', None),
+    'lens_apps':    ('com.canonical.Unity.ApplicationsLens', None),
+    'lenses':       ('com.canonical.Unity.Lenses', None),
+    'lens_files':   ('com.canonical.Unity.FilesLens', None),
+    'webapps':      ('com.canonical.unity.webapps', None),
+}
+
+def available(*names):
+    """Return whether the schemas behind every named object are installed"""
+    return all(schemas.available(objects[name][0]) for name in names)
+
+def installed(name):
+    """Return the managed keys of name that its installed schema has.
+    Some are distribution additions, such as Ubuntu's overlay scrollbars."""
+    schema = get(*objects[name]).props.settings_schema
+    return tuple(key for key in managed[name] if schema.has_key(key))
+
+def __getattr__(name):
+    try:
+        schema, path = objects[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    settings = get(schema, path)
+    # Cache on the module so later lookups skip this hook entirely
+    globals()[name] = settings
+    return settings
+
+# Keys the tool reads and writes, per settings object above
+
+managed = {
+    'bluetooth':    ('visible',),
+    'datetime':     ('show-calendar', 'show-clock', 'show-date', 'show-day',
+                     'show-seconds', 'time-format'),
+    'power':        ('icon-policy', 'show-time'),
+    'scrollbars':   ('scrollbar-mode',),
+    'session':      ('show-real-name-on-panel',),
+    'sound':        ('interested-media-players', 'preferred-media-players',
+                     'show-notify-osd-on-scroll', 'visible'),
+
+    'antialiasing': ('antialiasing', 'hinting'),
+    'background':   ('show-desktop-icons',),
+    'desktop':      ('home-icon-visible', 'network-icon-visible',
+                     'trash-icon-visible', 'volumes-visible'),
+    'interface':    ('cursor-theme', 'document-font-name', 'font-name',
+                     'gtk-theme', 'icon-theme', 'monospace-font-name',
+                     'text-scaling-factor', 'ubuntu-overlay-scrollbars'),
+    'lockdown':     ('disable-lock-screen', 'disable-log-out',
+                     'disable-print-setup', 'disable-printing',
+                     'disable-user-switching'),
+    'wm':           ('button-layout', 'theme', 'titlebar-font'),
+    'touch':        ('scroll-method',),
+
+    'animation':    ('minimize-effects', 'unminimize-effects'),
+    'core':         ('active-plugins', 'close-window-key', 'hsize',
+                     'show-desktop-edge', 'show-desktop-key', 'vsize'),
+    'expo':         ('expo-edge', 'expo-key', 'selected-color'),
+    'grid':         ('bottom-edge-action', 'bottom-left-corner-action',
+                     'bottom-right-corner-action', 'fill-color',
+                     'left-edge-action', 'outline-color', 'right-edge-action',
+                     'top-edge-action', 'top-left-corner-action',
+                     'top-right-corner-action'),
+    'move':         ('initiate-key',),
+    'opengl':       ('sync-to-vblank', 'texture-filter'),
+    'scale':        ('initiate-all-key', 'initiate-edge', 'initiate-key',
+                     'overlay-icon', 'show-desktop', 'spacing'),
+    'unityshell':   ('alt-tab-bias-viewport', 'alt-tab-detail-start',
+                     'alt-tab-detail-stop', 'alt-tab-forward',
+                     'alt-tab-forward-all', 'alt-tab-left',
+                     'alt-tab-next-window', 'alt-tab-prev', 'alt-tab-prev-all',
+                     'alt-tab-prev-window', 'alt-tab-right', 'alt-tab-timeout',
+                     'autohide-animation', 'background-color', 'backlight-mode',
+                     'dash-blur-experimental', 'disable-show-desktop',
+                     'edge-responsiveness', 'execute-command', 'icon-size',
+                     'keyboard-focus', 'launch-animation', 'launcher-hide-mode',
+                     'launcher-opacity', 'launcher-switcher-forward',
+                     'launcher-switcher-prev', 'menus-discovery-duration',
+                     'num-launchers', 'panel-first-menu', 'panel-opacity',
+                     'panel-opacity-maximized-toggle', 'reveal-trigger',
+                     'shortcut-overlay', 'show-hud', 'show-launcher',
+                     'show-minimized-windows', 'urgent-animation'),
+    'zoom':         ('zoom-in-key', 'zoom-out-key'),
+
+    'launcher':     ('favorites',),
+    'lens_apps':    ('display-available-apps', 'display-recent-apps'),
+    'lenses':       ('remote-content-search',),
+    'lens_files':   ('use-locate',),
+    'webapps':      ('integration-allowed',),
+}
+
+# ===== Snapshots ===== #
+
+# Last value read for each (name, key). Entries are dropped as soon as
+# dconf reports the key changed, so only those keys are read again.
+_values = {}
+_watched = set()
+
+def _changed(settings, key, name):
+    if _values.pop((name, key), None) is not None:
+        _snapshot.views.pop(name, None)
+
+class view(Mapping):
+    """Immutable mapping of key to GVariant for one settings object,
+    with the same typed getters as Gio.Settings"""
+    def __init__(self, values):
+        self._values = values
+    def __getitem__(self, key):
+        return self._values[key]
+    def __iter__(self):
+        return iter(self._values)
+    def __len__(self):
+        return len(self._values)
+
+    def get_value(self, key):
+        return self._values[key]
+    def get_boolean(self, key):
+        return self._values[key].get_boolean()
+    def get_int(self, key):
+        return self._values[key].get_int32()
+    def get_double(self, key):
+        return self._values[key].get_double()
+    def get_string(self, key):
+        return self._values[key].get_string()
+    def get_strv(self, key):
+        return self._values[key].get_strv()
+
+class snapshot_reader():
+    """Read-only access to every managed key, one read pass per schema.
+
+    snap.unityshell returns a view of all managed unityshell keys that
+    the installed schema has (see installed()). The
+    view is built on first access and shared by every page until one of
+    its keys changes."""
+    def __init__(self):
+        self.views = {}
+
+    def __getattr__(self, name):
+        try:
+            return self.views[name]
+        except KeyError:
+            pass
+        keys = installed(name)
+        settings = get(*objects[name])
+        if name not in _watched:
+            settings.connect('changed', _changed, name)
+            _watched.add(name)
+        values = {}
+        for key in keys:
+            try:
+                values[key] = _values[(name, key)]
+            except KeyError:
+                values[key] = _values[(name, key)] = settings.get_value(key)
+        self.views[name] = view(values)
+        return self.views[name]
+
+_snapshot = snapshot_reader()
+
+def snapshot():
+    """Return the shared snapshot of managed keys for a refresh pass"""
+    return _snapshot
+
+# ===== Change notifications ===== #
+
+class watcher():
+    """Re-run parts of a page when the keys they show change.
+
+    sections is a list of (callable, {name: keys}) pairs. Change
+    notifications are collected and handled from a single idle callback,
+    so a burst such as a dconf load of hundreds of keys costs one update
+    of each affected section rather than one per key.
+
+    Sections that need a schema which is not installed are left out
+    altogether; refresh() runs every remaining section once."""
+    def __init__(self, sections):
+        self.sections = []
+        self.connected = set()
+        self.dirty = set()
+        self.source = None
+        self.watch(sections)
+
+    def watch(self, sections):
+        sections = [(section, names) for section, names in sections if available(*names)]
+        self.sections += [(section, {(name, key) for name, keys in names.items() for key in keys})
+                            for section, names in sections]
+        for name in {name for section, names in sections for name in names} - self.connected:
+            self.connected.add(name)
+            get(*objects[name]).connect('changed', self.on_changed, name)
+        return [section for section, names in sections]
+
+    def add(self, sections):
+        """Watch more sections, such as those of a tab built later, and
+        run them once"""
+        for section in self.watch(sections):
+            section()
+
+    def refresh(self):
+        for section, keys in self.sections:
+            section()
+
+    def on_changed(self, settings, key, name):
+        self.dirty.add((name, key))
+        if self.source is None:
+            self.source = GLib.idle_add(self.update)
+
+    def update(self):
+        self.source = None
+        dirty, self.dirty = self.dirty, set()
+        for section, keys in self.sections:
+            if keys & dirty:
+                section()
+        return False
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Which icon names each installed icon theme resolves.
+
+A theme is only as good as the names it answers for, itself or through
+its Inherits chain down to hicolor. lookup() builds a name -> entries
+table per theme, read from the theme's icon-theme.cache where there is
+an up to date one and by listing its directories otherwise, then merges
+the tables along each chain once so that every lookup is a dict access.
+score() does that for all icon themes on a worker thread."""
+
+import mmap, os, os.path, struct, threading
+
+from gi.repository import GLib
+
+from . import themes
+
+# A sample of the freedesktop Icon Naming Specification, from each of its
+# contexts, that every usable theme should resolve
+STANDARD = frozenset({
+    # Actions
+    'document-new', 'document-open', 'document-save', 'document-print',
+    'edit-copy', 'edit-cut', 'edit-paste', 'edit-undo', 'edit-redo',
+    'edit-delete', 'edit-find', 'go-next', 'go-previous', 'go-up',
+    'go-down', 'go-home', 'list-add', 'list-remove', 'view-refresh',
+    'system-shutdown', 'window-close', 'media-playback-start',
+    'media-playback-pause',
+    # Applications
+    'accessories-text-editor', 'accessories-calculator', 'help-browser',
+    'system-file-manager', 'utilities-terminal', 'preferences-desktop',
+    # Devices
+    'audio-card', 'camera-photo', 'computer', 'drive-harddisk',
+    'drive-optical', 'input-keyboard', 'input-mouse', 'media-flash',
+    'printer', 'network-wired',
+    # MIME types
+    'application-x-executable', 'audio-x-generic', 'image-x-generic',
+    'text-x-generic', 'video-x-generic', 'x-office-document',
+    'package-x-generic',
+    # Places
+    'folder', 'folder-remote', 'user-home', 'user-desktop', 'user-trash',
+    'network-workgroup',
+    # Status
+    'dialog-error', 'dialog-information', 'dialog-warning',
+    'dialog-question', 'image-missing', 'battery-good',
+    'network-offline', 'audio-volume-high', 'audio-volume-muted',
+})
+
+EXTENSIONS = ('.png', '.svg', '.xpm')
+
+# icon-theme.cache image flags, in the order EXTENSIONS are preferred
+CACHE_FLAGS = ((4, '.png'), (2, '.svg'), (1, '.xpm'))
+NONE = 0xffffffff
+
+def directories(path):
+    """Return {directory: (size, context)} for the directories the
+    index.theme at path lists, or None if it cannot be read"""
+    parser = themes.index_parser(path)
+    if parser is None:
+        return None
+    group = parser['Icon Theme']
+    names = [name.strip() for key in ('Directories', 'ScaledDirectories')
+             for name in group.get(key, '').split(',') if name.strip()]
+    result = {}
+    for name in names:
+        section = parser[name] if parser.has_section(name) else {}
+        try:
+            size = int(section.get('Size', 0))
+        except ValueError:
+            size = 0
+        result[name] = (size, section.get('Context', ''))
+    return result
+
+def read_cache(path):
+    """Return {name: [(directory, extension)]} from an icon-theme.cache,
+    reading only the hash chains and strings out of the mapped file.
+    Raises OSError, ValueError or struct.error when it cannot be read."""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as data:
+        major, minor, hash_offset, dirs_offset = struct.unpack_from('>HHII', data, 0)
+        if major != 1:
+            raise ValueError('unsupported icon cache version {}.{}'.format(major, minor))
+        def string(offset):
+            end = data.find(b'\0', offset)
+            if end < 0:
+                raise ValueError('unterminated string in icon cache')
+            return data[offset:end].decode('utf-8', 'replace')
+        count, = struct.unpack_from('>I', data, dirs_offset)
+        dirs = [string(offset) for offset in struct.unpack_from('>{}I'.format(count), data, dirs_offset+4)]
+        buckets, = struct.unpack_from('>I', data, hash_offset)
+        result = {}
+        for icon in struct.unpack_from('>{}I'.format(buckets), data, hash_offset+4):
+            while icon != NONE:
+                icon, name, images = struct.unpack_from('>III', data, icon)
+                count, = struct.unpack_from('>I', data, images)
+                found = result.setdefault(string(name), [])
+                for index in range(count):
+                    directory, flags, _ = struct.unpack_from('>HHI', data, images+4+8*index)
+                    for flag, extension in CACHE_FLAGS:
+                        if flags & flag:
+                            found.append((dirs[directory], extension))
+                            break
+        return result
+
+def walk(path, dirs):
+    """Return {name: [(directory, extension)]} by listing each directory"""
+    result = {}
+    for directory in dirs:
+        try:
+            with os.scandir(os.path.join(path, directory)) as entries:
+                for entry in entries:
+                    name, extension = os.path.splitext(entry.name)
+                    if extension in EXTENSIONS:
+                        result.setdefault(name, []).append((directory, extension))
+        except OSError:
+            pass
+    return result
+
+def table(path):
+    """Return {name: [(size, context, path)]} for the icon theme
+    directory at path, and the names of the themes it inherits from"""
+    dirs = directories(os.path.join(path, 'index.theme'))
+    if not dirs:
+        return {}, []
+    meta = themes.parse_index(os.path.join(path, 'index.theme'))
+    cache = os.path.join(path, 'icon-theme.cache')
+    found = None
+    try:
+        # Like GTK, ignore a cache older than the theme itself
+        if os.stat(cache).st_mtime >= os.stat(path).st_mtime:
+            found = read_cache(cache)
+    except (OSError, ValueError, struct.error):
+        pass
+    if found is None:
+        found = walk(path, dirs)
+    result = {}
+    for name, images in found.items():
+        entries = [dirs[directory] + (os.path.join(path, directory, name+extension),)
+                   for directory, extension in images if directory in dirs]
+        if entries:
+            result[name] = entries
+    return result, meta['inherits'] if meta else []
+
+class lookup():
+    """Icon tables for every installed icon theme, by theme name.
+
+    A name installed in several roots is one theme made of all of them,
+    the later roots winning. resolved(theme) merges the tables along the
+    Inherits chain the first time it is asked for, after which find() is
+    a single dict access."""
+    def __init__(self):
+        self.paths = {}
+        for root in themes.roots('icons'):
+            for name in themes.subdirs(root):
+                self.paths.setdefault(name, []).append(os.path.join(root, name))
+        self.tables = {}
+        self.inherits = {}
+        self.merged = {}
+
+    def table(self, theme):
+        if theme not in self.tables:
+            merged, inherits = {}, []
+            for path in self.paths.get(theme, ()):
+                found, parents = table(path)
+                merged.update(found)
+                inherits = parents or inherits
+            self.tables[theme] = merged
+            self.inherits[theme] = inherits
+        return self.tables[theme]
+
+    def chain(self, theme):
+        """Return theme and everything it inherits from, depth first, with
+        hicolor last as the specification asks"""
+        result = []
+        pending = [theme]
+        while pending:
+            name = pending.pop()
+            if name in result or name == 'hicolor' or name not in self.paths:
+                continue
+            result.append(name)
+            self.table(name)
+            pending.extend(reversed(self.inherits[name]))
+        return result + ['hicolor']
+
+    def resolved(self, theme):
+        """Return {name: [(size, context, path)]} for every name theme
+        resolves, itself or through what it inherits"""
+        if theme not in self.merged:
+            merged = {}
+            for name in reversed(self.chain(theme)):
+                merged.update(self.table(name))
+            self.merged[theme] = merged
+        return self.merged[theme]
+
+    def find(self, theme, icon):
+        """Return the [(size, context, path)] entries for icon in theme"""
+        return self.resolved(theme).get(icon, [])
+
+    def coverage(self, theme):
+        """Return the share of STANDARD names theme resolves, 0 to 1"""
+        return len(STANDARD & self.resolved(theme).keys()) / len(STANDARD)
+
+class score():
+    """Compute lookup().coverage() for every icon theme on a worker thread.
+
+    on_scores({theme: coverage}) is called on the main loop once they
+    are all known; the tables are only read this once per scan."""
+    def __init__(self, on_scores):
+        self.on_scores = on_scores
+        self.thread = threading.Thread(target = self.run, daemon = True)
+        self.thread.start()
+
+    def run(self):
+        found = lookup()
+        scores = {theme: found.coverage(theme) for theme in found.paths}
+        GLib.idle_add(self.deliver, scores)
+
+    def deliver(self, scores):
+        self.on_scores(scores)
+        return False
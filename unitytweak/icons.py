@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Rasterized copies of the bundled SVG icons.
+
+The toolbar and start page images used to name their SVGs in the .ui
+files, so librsvg parsed every one of them before the first paint. The
+images now start out empty. load() fills them in from a worker thread,
+rendering each icon once per size and scale factor and keeping the
+result under $XDG_CACHE_HOME, keyed by the SVG's content hash."""
+
+import hashlib, os, os.path, re, threading
+
+from gi.repository import GLib, Gio, Gdk, GdkPixbuf
+
+from . import settings
+
+# GtkImage id -> icon, per .ui file
+
+TOOLBAR = {
+    'i_tool_compizsettings':        'icons/36/wm-settings-light_36.svg',
+    'i_tool_desktopsettings':       'icons/36/desktop-settings-light_36.svg',
+    'i_tool_startpage':             'icons/36/overview-light_36.svg',
+    'i_tool_themesettings':         'icons/36/appearance-settings-light_36.svg',
+    'i_tool_unitysettings':         'icons/36/unity-settings-light_36.svg',
+}
+
+STARTPAGE = {
+    'i_tool_additional':            'icons/36/unity-settings-additional-dark_36.svg',
+    'i_unity_webapps':              'icons/36/unity-settings-webapps-dark_36.svg',
+    'i_tool_compiz_switcher':       'icons/36/wm-settings-workspace-switcher-dark_36.svg',
+    'i_tool_cursors':               'icons/36/appearance-settings-cursor-dark_36.svg',
+    'i_tool_dash':                  'icons/36/unity-settings-dash-dark_36.svg',
+    'i_tool_desktop_icons':         'icons/36/desktop-settings-icons-dark_36.svg',
+    'i_tool_desktop_security':      'icons/36/desktop-settings-security-dark_36.svg',
+    'i_tool_fonts':                 'icons/36/appearance-settings-font-dark_36.svg',
+    'i_tool_general':               'icons/36/wm-settings-general-dark_36.svg',
+    'i_tool_hotcorners':            'icons/36/wm-settings-hotcorners-dark_36.svg',
+    'i_tool_icons':                 'icons/36/appearance-settings-icons-dark_36.svg',
+    'i_tool_launcher':              'icons/36/unity-settings-launcher-dark_36.svg',
+    'i_tool_panel':                 'icons/36/unity-settings-panel-dark_36.svg',
+    'i_tool_scrolling':             'icons/36/desktop-settings-scrolling-dark_36.svg',
+    'i_tool_system':                'icons/36/appearance-settings-theme-dark_36.svg',
+    'i_tool_unity_switcher':        'icons/36/unity-settings-switcher-dark_36.svg',
+    'i_tool_window_snapping':       'icons/36/wm-settings-window-snapping-dark_36.svg',
+    'i_tool_window_spread':         'icons/36/wm-settings-window-switcher-dark_36.svg',
+    'i_window_controls':            'icons/36/appearance-settings-window-controls-dark_36.svg',
+    'image_box_start_unity':        'icons/24/unity-settings-dark_24.svg',
+    'image_box_start_compiz':       'icons/24/wm-settings-dark_24.svg',
+    'image_start_theme':            'icons/24/appearance-settings-dark_24.svg',
+    'image_start_desktop':          'icons/24/desktop-settings-dark_24.svg',
+}
+
+def cache_dir():
+    return os.path.join(GLib.get_user_cache_dir(), 'unity-tweak-tool', 'icons')
+
+def size(name):
+    """The size an icon is drawn at, from its _24/_36 suffix"""
+    return int(re.search(r'_(\d+)\.svg$', name).group(1))
+
+def render(name, scale):
+    """Return a pixbuf of the icon name for the scale factor, from the
+    cache or by rendering the SVG and caching the result"""
+    with settings.open_data(name) as f:
+        data = f.read()
+    pixels = size(name)*scale
+    cached = os.path.join(cache_dir(), '{}-{}.png'.format(hashlib.sha1(data).hexdigest(), pixels))
+    try:
+        return GdkPixbuf.Pixbuf.new_from_file(cached)
+    except GLib.Error:
+        pass
+    stream = Gio.MemoryInputStream.new_from_bytes(GLib.Bytes.new(data))
+    pixbuf = GdkPixbuf.Pixbuf.new_from_stream_at_scale(stream, pixels, pixels, True, None)
+    try:
+        os.makedirs(cache_dir(), exist_ok = True)
+        pixbuf.savev(cached+'.tmp', 'png', [], [])
+        os.replace(cached+'.tmp', cached)
+    except (OSError, GLib.Error):
+        # Without a cache the icon is simply rendered again next time
+        pass
+    return pixbuf
+
+def show(image, pixbuf, scale):
+    if scale == 1:
+        image.set_from_pixbuf(pixbuf)
+    else:
+        image.set_from_surface(Gdk.cairo_surface_create_from_pixbuf(pixbuf, scale, None))
+    return False
+
+def load(ui, images):
+    """Fill in the images, an {id: icon} table above, from a worker
+    thread. Each one keeps its final size meanwhile so nothing moves
+    when it arrives."""
+    jobs = []
+    for image, name in images.items():
+        image = ui[image]
+        image.set_size_request(size(name), size(name))
+        jobs.append((image, name, image.get_scale_factor()))
+    def worker():
+        for image, name, scale in jobs:
+            GLib.idle_add(show, image, render(name, scale), scale)
+    threading.Thread(target = worker, daemon = True).start()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+# Value mappings shared by the pages and the command line. Nothing in
+# here may import Gtk.
+
+# ===== Hot corners ===== #
+
+# Each screen edge can trigger one action. Every action keeps the edges
+# that trigger it as a '|' separated list in one key.
+
+EDGES = ('Top', 'TopLeft', 'Left', 'BottomLeft',
+         'Bottom', 'TopRight', 'Right', 'BottomRight')
+
+# In the order of the hot corner combo boxes
+HOTCORNER_ACTIONS = ('none', 'show_desktop', 'expo', 'window_spread')
+
+HOTCORNER_KEYS = {
+    'show_desktop':     ('core', 'show-desktop-edge'),
+    'expo':             ('expo', 'expo-edge'),
+    'window_spread':    ('scale', 'initiate-edge'),
+}
+
+def hotcorner_values(snap):
+    """Return {action: [edges]} read from a gsettings snapshot"""
+    return {action: [edge for edge in getattr(snap, name).get_string(key).split('|') if edge]
+            for action, (name, key) in HOTCORNER_KEYS.items()}
+
+def hotcorner_action(values, edge):
+    """Return the action edge triggers, or 'none'"""
+    for action in HOTCORNER_ACTIONS[1:]:
+        if edge in values[action]:
+            return action
+    return 'none'
+
+def set_hotcorner(values, edge, action):
+    """Make edge trigger action, taking it away from any other action.
+    Updates values in place and returns the actions whose edge lists
+    changed."""
+    changed = []
+    for other in HOTCORNER_ACTIONS[1:]:
+        edges = values[other]
+        if other == action and edge not in edges:
+            edges.append(edge)
+            changed.append(other)
+        elif other != action and edge in edges:
+            edges.remove(edge)
+            changed.append(other)
+    return changed
+
+# ===== Launcher colour ===== #
+
+# background-color is '#rrggbbaa'. Unity paints it over the chameleonic
+# colour, so an alpha of 00 means "chameleonic" and ff means "custom";
+# see notes/launcher_color.txt.
+
+def launcher_color(value):
+    """Split a background-color value into (custom, '#rrggbb')"""
+    return not value.endswith('00'), value[:7]
+
+def launcher_color_value(custom, rgb):
+    """Build a background-color value from a colour and the mode"""
+    return rgb[:7] + ('ff' if custom else '00')
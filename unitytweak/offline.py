@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+import os, os.path, time, shutil, subprocess, tempfile
+import configparser
+import multiprocessing
+
+from gi.repository import GLib, Gio
+
+from . import profile
+
+# Stamping a profile into the dconf databases of users who are not
+# logged in, e.g. while building an image. The profile is turned into
+# dconf keyfile sections once; every home is then merged and compiled
+# with `dconf compile` in a pool of worker processes. Asked to, the
+# profile is written as a keyfile next to the database instead; dconf
+# itself never reads that one.
+
+def compile_profile(stream):
+    """Turn a profile into ({dconf dir: {key: value}}, skipped), with the
+    values in typed GVariant text as dconf keyfiles expect.
+
+    Where the schema is installed, keys it does not have and values of
+    another type are skipped. Raises ValueError if any entry is
+    malformed."""
+    source = Gio.SettingsSchemaSource.get_default()
+    sections = {}
+    skipped = 0
+    for name, entry in profile.entries(stream):
+        key = entry['key']
+        schema = source.lookup(entry['schema'], True) if source is not None else None
+        if schema is not None and (not schema.has_key(key) or
+                entry['type'] != schema.get_key(key).get_value_type().dup_string()):
+            skipped += 1
+            continue
+        path = entry['path']
+        if path is None and schema is not None:
+            path = schema.get_path()
+        if name is None or path is None:
+            skipped += 1
+            continue
+        if not GLib.VariantType.string_is_valid(entry['type']):
+            raise ValueError("{} {}: invalid type {!r}".format(entry['schema'], key, entry['type']))
+        try:
+            value = GLib.Variant.parse(GLib.VariantType.new(entry['type']), entry['value'], None, None)
+        except (GLib.Error, TypeError):
+            raise ValueError("{} {}: invalid value {!r}".format(entry['schema'], key, entry['value']))
+        sections.setdefault(path.strip('/'), {})[key] = value.print_(True)
+    return sections, skipped
+
+def _keyfile():
+    keyfile = configparser.ConfigParser(interpolation = None, delimiters = ('=',))
+    # Keys are case sensitive
+    keyfile.optionxform = str
+    return keyfile
+
+# Set in each worker by _init; _dconf is None when writing keyfiles
+_sections = None
+_dconf = None
+
+def _init(sections, dconf):
+    global _sections, _dconf
+    _sections = sections
+    _dconf = dconf
+
+def apply_home(home):
+    """Merge the profile into the dconf database under home.
+    Returns (home, error), error being None on success."""
+    try:
+        config = os.path.join(home, '.config')
+        directory = os.path.join(config, 'dconf')
+        database = os.path.join(directory, 'user')
+        os.makedirs(directory, exist_ok = True)
+
+        keyfile = _keyfile()
+        with tempfile.TemporaryDirectory(prefix = 'unity-tweak-tool-') as scratch:
+            if _dconf and os.path.exists(database):
+                # dconf reads the database file directly, no session needed
+                env = dict(os.environ, XDG_CONFIG_HOME = config, XDG_RUNTIME_DIR = scratch,
+                           DCONF_PROFILE = os.path.join(scratch, 'profile'))
+                with open(env['DCONF_PROFILE'], 'w') as dconf_profile:
+                    dconf_profile.write('user-db:user\n')
+                dump = subprocess.run([_dconf, 'dump', '/'], env = env, check = True,
+                                      stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+                keyfile.read_string(dump.stdout.decode('utf-8'))
+
+            for section, values in _sections.items():
+                if not keyfile.has_section(section):
+                    keyfile.add_section(section)
+                for key, value in values.items():
+                    keyfile.set(section, key, value)
+
+            if _dconf:
+                keyfiles = os.path.join(scratch, 'keyfiles')
+                os.mkdir(keyfiles)
+                with open(os.path.join(keyfiles, 'user'), 'w') as output:
+                    keyfile.write(output, space_around_delimiters = False)
+                subprocess.run([_dconf, 'compile', database+'.tmp', keyfiles], check = True,
+                               stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+                target = database
+            else:
+                with open(database+'.ini.tmp', 'w') as output:
+                    keyfile.write(output, space_around_delimiters = False)
+                target = database+'.ini'
+            os.replace(target+'.tmp', target)
+
+        # Image builds run as root; the database belongs to the user
+        if os.geteuid() == 0:
+            owner = os.stat(home)
+            for path in (config, directory, target):
+                os.chown(path, owner.st_uid, owner.st_gid)
+        return home, None
+    except (OSError, subprocess.CalledProcessError, configparser.Error, UnicodeDecodeError) as error:
+        if isinstance(error, subprocess.CalledProcessError):
+            error = error.stderr.decode('utf-8', 'replace').strip() or error
+        return home, str(error)
+
+def apply(sections, homes, jobs = None, progress = None, keyfiles = False):
+    """Apply compiled sections to every home with a pool of jobs worker
+    processes (one per CPU by default). progress, if given, is called
+    with (done, total, seconds) as homes finish. Returns (failures,
+    seconds), failures being a list of (home, error).
+
+    With keyfiles, ~/.config/dconf/user.ini is written with the profile
+    alone and no database is touched. Otherwise raises LookupError if
+    dconf is not installed."""
+    if keyfiles:
+        dconf = None
+    else:
+        dconf = shutil.which('dconf')
+        if dconf is None:
+            raise LookupError("dconf is not installed, no database can be written")
+    start = time.perf_counter()
+    failures = []
+    with multiprocessing.Pool(jobs, _init, (sections, dconf)) as pool:
+        done = 0
+        for home, error in pool.imap_unordered(apply_home, homes, chunksize = 8):
+            done += 1
+            if error is not None:
+                failures.append((home, error))
+            if progress:
+                progress(done, len(homes), time.perf_counter() - start)
+    return failures, time.perf_counter() - start
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+import json
+
+from gi.repository import GLib
+
+from . import gsettings
+
+# Profiles are JSON lines: a header object followed by one object per
+# key, so both ends can stream them. Values are GVariant text, which
+# round-trips every type GSettings can hold.
+#
+#   {"format":"unity-tweak-tool-profile","version":1}
+#   {"schema":"org.compiz.core","path":"/org/compiz/...","key":"hsize","type":"i","value":"2"}
+
+FORMAT = 'unity-tweak-tool-profile'
+VERSION = 1
+
+def _line(obj):
+    return json.dumps(obj, separators = (',', ':'))+'\n'
+
+def export(stream):
+    """Write every managed key of every installed schema to stream.
+    Returns the number of keys written."""
+    stream.write(_line({'format': FORMAT, 'version': VERSION}))
+    snap = gsettings.snapshot()
+    count = 0
+    for name in gsettings.managed:
+        if not gsettings.available(name):
+            continue
+        schema, path = gsettings.objects[name]
+        values = getattr(snap, name)
+        for key in values:
+            value = values.get_value(key)
+            stream.write(_line({'schema': schema,
+                                'path': path,
+                                'key': key,
+                                'type': value.get_type_string(),
+                                'value': value.print_(False)}))
+            count += 1
+    return count
+
+def entries(stream):
+    """Check the header of a profile and yield (name, entry) for each
+    key in it, where name is the gsettings object the key belongs to, or
+    None for keys the tool does not manage"""
+    try:
+        header = json.loads(stream.readline())
+        if header['format'] != FORMAT:
+            raise ValueError
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("not a Unity Tweak Tool profile")
+    if header.get('version') != VERSION:
+        raise ValueError("unsupported profile version {!r}".format(header.get('version')))
+
+    known = {gsettings.objects[name]: (name, keys) for name, keys in gsettings.managed.items()}
+    for number, line in enumerate(stream, 2):
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+            for field in ('schema', 'path', 'key', 'type', 'value'):
+                entry[field]
+            name, keys = known.get((entry['schema'], entry['path']), (None, ()))
+        except (ValueError, KeyError, TypeError) as error:
+            raise ValueError("line {}: invalid entry ({})".format(number, error))
+        yield (name if entry['key'] in keys else None), entry
+
+def load(stream):
+    """Apply a profile read from stream, one delayed commit per schema.
+
+    Values equal to the stored ones are left alone. Returns (applied,
+    skipped), where skipped counts keys the tool does not manage, keys
+    the installed schemas do not have and values whose type no longer
+    matches the schema. Raises ValueError, applying nothing, if any entry
+    is malformed."""
+    applied = skipped = 0
+    with gsettings.changeset() as changes:
+        for name, entry in entries(stream):
+            if name is None or not gsettings.available(name) or entry['key'] not in gsettings.installed(name):
+                skipped += 1
+                continue
+            key = entry['key']
+            settings = gsettings.get(entry['schema'], entry['path'])
+            current = settings.get_value(key)
+            if entry['type'] != current.get_type_string():
+                skipped += 1
+                continue
+            try:
+                value = GLib.Variant.parse(GLib.VariantType.new(entry['type']), entry['value'], None, None)
+            except (GLib.Error, TypeError):
+                # Leaving the block with an exception reverts the whole changeset
+                raise ValueError("{} {}: invalid value {!r}".format(entry['schema'], key, entry['value']))
+            if not current.equal(value):
+                changes[settings].set_value(key, value)
+                applied += 1
+    return applied, skipped
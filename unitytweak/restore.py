@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+import time
+
+from gi.repository import GLib, Gio
+
+from . import gsettings
+
+# Managed keys that none of the pages' reset buttons reset, so restoring
+# leaves them alone too: choices made in the theme lists and hot corner
+# combos, and keys other programs maintain
+KEEP = {
+    'grid':         ('bottom-edge-action', 'bottom-left-corner-action',
+                     'bottom-right-corner-action', 'left-edge-action',
+                     'right-edge-action', 'top-left-corner-action',
+                     'top-right-corner-action'),
+    'interface':    ('cursor-theme', 'gtk-theme', 'icon-theme',
+                     'ubuntu-overlay-scrollbars'),
+    'lens_files':   ('use-locate',),
+    'scale':        ('initiate-edge',),
+    'sound':        ('interested-media-players',),
+    'unityshell':   ('autohide-animation', 'menus-discovery-duration'),
+    'wm':           ('button-layout', 'theme'),
+}
+
+# The pinned launcher items are the user's; like the launcher page's
+# reset, restoring only takes the show desktop item out of them
+DESKTOP_ICON = 'unity://desktop-icon'
+
+def target(name, key, settings):
+    """Return the value restoring writes to key, or None to keep it"""
+    if key in KEEP.get(name, ()):
+        return None
+    if (name, key) == ('launcher', 'favorites'):
+        favorites = settings.get_strv(key)
+        if DESKTOP_ICON not in favorites:
+            return None
+        return GLib.Variant('as', [item for item in favorites if item != DESKTOP_ICON])
+    return settings.get_default_value(key)
+
+def modified():
+    """Return (name, key, value, target) for every managed key that
+    restoring would change, with the Compiz core keys last. target is
+    the value it would write: the default, except for the favorites."""
+    names = [name for name in gsettings.managed if name != 'core'] + ['core']
+    result = []
+    for name in names:
+        if not gsettings.available(name):
+            continue
+        settings = gsettings.get(*gsettings.objects[name])
+        keys = list(gsettings.installed(name))
+        # Changing the plugin list makes Compiz reload plugins, so it goes last
+        if 'active-plugins' in keys:
+            keys.remove('active-plugins')
+            keys.append('active-plugins')
+        for key in keys:
+            value = settings.get_value(key)
+            wanted = target(name, key, settings)
+            if wanted is not None and not value.equal(wanted):
+                result.append((name, key, value, wanted))
+    return result
+
+def restore(dry_run = False):
+    """Reset the managed keys the pages can reset in one batch.
+
+    Each schema gets a single delayed commit, applied in the order of
+    modified(), so active-plugins is written after everything else.
+    Returns the list from modified() and the seconds taken."""
+    start = time.perf_counter()
+    keys = modified()
+    if not dry_run:
+        with gsettings.changeset() as changes:
+            for name, key, value, wanted in keys:
+                settings = changes[getattr(gsettings, name)]
+                if wanted.equal(settings.get_default_value(key)):
+                    settings.reset(key)
+                else:
+                    settings.set_value(key, wanted)
+        Gio.Settings.sync()
+    return keys, time.perf_counter() - start
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+import os, os.path, json
+
+from gi.repository import GLib, Gio
+
+# Which GSettings schemas are installed, probed once with a single
+# SettingsSchemaSource listing and remembered on disk between runs. The
+# cached list is thrown away as soon as any schema directory changes.
+
+CACHE_VERSION = 1
+
+def directories():
+    """Return the directories GSettings loads compiled schemas from"""
+    dirs = []
+    if 'GSETTINGS_SCHEMA_DIR' in os.environ:
+        dirs.extend(os.environ['GSETTINGS_SCHEMA_DIR'].split(os.pathsep))
+    for data_dir in [GLib.get_user_data_dir()] + GLib.get_system_data_dirs():
+        dirs.append(os.path.join(data_dir, 'glib-2.0', 'schemas'))
+    return dirs
+
+def stamp():
+    """Return [directory, mtime] for every schema directory, with None
+    for the ones that do not exist"""
+    result = []
+    for directory in directories():
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            mtime = None
+        result.append([directory, mtime])
+    return result
+
+def cache_file():
+    return os.path.join(GLib.get_user_cache_dir(), 'unity-tweak-tool', 'schemas.json')
+
+def probe(source = None):
+    """List every installed schema, relocatable ones included"""
+    if source is None:
+        source = Gio.SettingsSchemaSource.get_default()
+    if source is None:
+        return frozenset()
+    non_relocatable, relocatable = source.list_schemas(True)
+    return frozenset(non_relocatable + relocatable)
+
+def _load(current):
+    try:
+        with open(cache_file()) as cache:
+            data = json.load(cache)
+        if data['version'] == CACHE_VERSION and data['stamp'] == current:
+            return frozenset(data['schemas'])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+def _save(current, schemas):
+    path = cache_file()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        with open(path+'.tmp', 'w') as cache:
+            json.dump({'version': CACHE_VERSION,
+                       'stamp': current,
+                       'schemas': sorted(schemas)}, cache)
+        os.replace(path+'.tmp', path)
+    except OSError:
+        # Not being able to cache only costs the probe on the next start
+        pass
+
+_installed = None
+
+def installed():
+    """Return the set of installed schema ids"""
+    global _installed
+    if _installed is None:
+        current = stamp()
+        _installed = _load(current)
+        if _installed is None:
+            _installed = probe()
+            _save(current, _installed)
+    return _installed
+
+def use(source):
+    """Answer from a Gio.SettingsSchemaSource instead of the installed
+    schemas, or go back to those with None"""
+    global _installed
+    _installed = probe(source) if source is not None else None
+
+def available(schema):
+    return schema in installed()
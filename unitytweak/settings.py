@@ -32,3 +32,44 @@ from os import path
 
 UI_DIR = path.join(path.dirname(path.abspath(__file__)), 'data')
 assert path.isdir(UI_DIR)
+
+# Installed trees have the .ui files and images compiled into one bundle
+# by setup.py; the development tree has only the loose files.
+RESOURCE_FILE = path.join(UI_DIR, 'unity-tweak-tool.gresource')
+RESOURCE_PREFIX = '/com/github/freyja-dev/unity-tweak-tool/'
+
+_bundle = None
+
+def bundle():
+    '''Map the bundle in and register it the first time. Returns whether
+    there is one to use.'''
+    global _bundle
+    if _bundle is None:
+        _bundle = path.isfile(RESOURCE_FILE)
+        if _bundle:
+            from gi.repository import Gio
+            Gio.resources_register(Gio.Resource.load(RESOURCE_FILE))
+    return _bundle
+
+def add_ui(builder, name, objects = None):
+    '''Load the .ui file name into builder, or only the listed objects
+    and their children, from the bundle or the loose file'''
+    if bundle():
+        if objects is None:
+            builder.add_from_resource(RESOURCE_PREFIX+name)
+        else:
+            builder.add_objects_from_resource(RESOURCE_PREFIX+name, objects)
+    else:
+        if objects is None:
+            builder.add_from_file(path.join(UI_DIR, name))
+        else:
+            builder.add_objects_from_file(path.join(UI_DIR, name), objects)
+
+def open_data(name):
+    '''Open a data file such as an image for reading, in binary'''
+    if bundle():
+        from io import BytesIO
+        from gi.repository import Gio
+        return BytesIO(Gio.resources_lookup_data(RESOURCE_PREFIX+name,
+                        Gio.ResourceLookupFlags.NONE).get_data())
+    return open(path.join(UI_DIR, name), 'rb')
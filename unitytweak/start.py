@@ -34,6 +34,7 @@ from gi.repository import Gtk, Gio
 
 from .ui import ui
 from . import settings
+from . import icons
 
 class Startpage ():
     def __init__(self, container, notebook):
@@ -42,12 +43,12 @@ class Startpage ():
         self.builder = Gtk.Builder()
         self.container = container
         self.notebook = notebook
-        self.glade = (os.path.join(settings.UI_DIR, 
-                                   'startpage.ui'))
-        self.builder.add_from_file(self.glade)
+        self.glade = 'startpage.ui'
+        settings.add_ui(self.builder, self.glade)
         self.ui = ui(self.builder)
         self.page = self.ui['box_startpage']
         self.page.unparent()
+        icons.load(self.ui, icons.STARTPAGE)
         self.builder.connect_signals(self)
 
     # Unity settings buttons on start page
@@ -30,85 +30,114 @@
 
 import os, os.path
 
-from gi.repository import Gtk, Gio
+from gi.repository import Gtk, Gio, GdkPixbuf
 
-from .ui import ui
+from .ui import ui, quiet
 from . import settings
 from . import gsettings
+from . import themes
+from . import iconindex
+from . import thumbnails
+
+# Widgets to hide when the schemas they need are not installed
+requires = {
+    'l_antialiasing':   ('antialiasing',),
+    'cbox_antialiasing': ('antialiasing',),
+    'l_hinting':        ('antialiasing',),
+    'cbox_hinting':     ('antialiasing',),
+}
+
+# Widgets that show a single key as it is: (object, key, widget, property,
+# mapping, dependants). See ui.bind. The combo boxes' item ids are the
+# key's values.
+bindings = [
+    ('interface', 'font-name', 'font_default', 'font-name', None, ()),
+    ('interface', 'document-font-name', 'font_document', 'font-name', None, ()),
+    ('interface', 'monospace-font-name', 'font_monospace', 'font-name', None, ()),
+    ('wm', 'titlebar-font', 'font_window_title', 'font-name', None, ()),
+    ('antialiasing', 'antialiasing', 'cbox_antialiasing', 'active-id', None, ()),
+    ('antialiasing', 'hinting', 'cbox_hinting', 'active-id', None, ()),
+]
+
+# Milliseconds a theme picked in the lists is only previewed in this
+# window before it is written for the whole session
+PREVIEW_DELAY = 2000
+
+# Gtk.Settings property that previews each key in this process only
+PREVIEW = {
+    'gtk-theme':    'gtk-theme-name',
+    'icon-theme':   'gtk-icon-theme-name',
+    'cursor-theme': 'gtk-cursor-theme-name',
+}
 
 class Themesettings ():
-    def __init__(self, container):
+    def __init__(self, container, preview_delay = None):
         '''Handler Initialisations.
         Obtain all references here.'''
+        self.preview_delay = PREVIEW_DELAY if preview_delay is None else preview_delay
         self.builder = Gtk.Builder()
-        self.glade = (os.path.join(settings.UI_DIR, 
-                                    'theme.ui'))
+        self.glade = 'theme.ui'
         self.container = container
-        self.builder.add_from_file(self.glade)
+        settings.add_ui(self.builder, self.glade)
         self.ui = ui(self.builder)
         self.page = self.ui['nb_themesettings']
         self.page.unparent()
         
-        self.gtkthemestore=Gtk.ListStore(str,str)
+        # Title, path, whether the theme is complete and its thumbnail;
+        # icon themes also have the share of standard icon names they resolve
+        self.gtkthemestore=Gtk.ListStore(str,str,bool,GdkPixbuf.Pixbuf)
         self.windowthemestore=self.gtkthemestore
-        self.ui['tree_gtk_theme'].set_model(self.gtkthemestore)
-        self.ui['tree_window_theme'].set_model(self.windowthemestore)
-# Get all themes
-        systhdir='/usr/share/themes'
-        systemthemes=[(theme.capitalize(),os.path.join(systhdir,theme)) for theme in os.listdir(systhdir) if os.path.isdir(os.path.join(systhdir,theme))]
-        try:
-            uthdir=os.path.expanduser('~/.themes')
-            userthemes=[(theme.capitalize(),os.path.join(uthdir,theme)) for theme in os.listdir(uthdir) if os.path.isdir(os.path.join(uthdir,theme))]
-        except OSError as e:
-            userthemes=[]
-        allthemes=systemthemes+userthemes
-        allthemes.sort()
-        required=['gtk-2.0','gtk-3.0','metacity-1']
+        self.iconthemestore=Gtk.ListStore(str,str,bool,str,GdkPixbuf.Pixbuf)
+        self.cursorthemestore=Gtk.ListStore(str,str,bool,GdkPixbuf.Pixbuf)
+        # Rows arrive in batches, keep them in order as they come
+        for store in (self.gtkthemestore, self.iconthemestore, self.cursorthemestore):
+            store.set_sort_column_id(0, Gtk.SortType.ASCENDING)
+        # Incomplete themes stay in the stores and are filtered out of view
+        self.show_incomplete=False
+        self.gtkthemefilter=self.gtkthemestore.filter_new()
+        self.iconthemefilter=self.iconthemestore.filter_new()
+        self.cursorthemefilter=self.cursorthemestore.filter_new()
+        for themefilter in (self.gtkthemefilter, self.iconthemefilter, self.cursorthemefilter):
+            themefilter.set_visible_func(self.theme_visible)
+        self.ui['tree_gtk_theme'].set_model(self.gtkthemefilter)
+        self.ui['tree_window_theme'].set_model(self.gtkthemefilter)
+        self.ui['tree_icon_theme'].set_model(self.iconthemefilter)
+        self.ui['tree_cursor_theme'].set_model(self.cursorthemefilter)
+
         self.gtkthemes={}
         self.windowthemes={}
-        for theme in allthemes:
-            if all([os.path.isdir(os.path.join(theme[1],req)) for req in required]):
-                iter=self.gtkthemestore.append(theme)
-                themename=os.path.split(theme[1])[1]
-                self.gtkthemes[themename]={"iter":iter,"path":theme[1]}
-                self.windowthemes[themename]={"iter":iter,"path":theme[1]}
-
-        self.iconthemestore=Gtk.ListStore(str,str)
-        self.cursorthemestore=Gtk.ListStore(str,str)
-        self.ui['tree_icon_theme'].set_model(self.iconthemestore)
-        self.ui['tree_cursor_theme'].set_model(self.cursorthemestore)
-        
-        sysithdir='/usr/share/icons'
-        systemiconthemes= [(theme.capitalize(),os.path.join(sysithdir,theme)) for theme in os.listdir(sysithdir) if os.path.isdir(os.path.join(sysithdir,theme))]
-        to_be_hidden=[('Loginicons','/usr/share/icons/LoginIcons'),('Unity-webapps-applications','/usr/share/icons/unity-webapps-applications')]
-        for item in to_be_hidden:
-            try:
-                systemiconthemes.remove(item)
-            except ValueError as e:
-                pass
-        try:
-            uithdir=os.path.expanduser('~/.icons')
-            usericonthemes=[(theme.capitalize(),os.path.join(uithdir,theme)) for theme in os.listdir(uithdir) if os.path.isdir(os.path.join(uithdir,theme))]
-        except OSError as e:
-            usericonthemes=[]
-        allithemes=systemiconthemes+usericonthemes
-        allithemes.sort()
         self.iconthemes={}
         self.cursorthemes={}
-        for theme in allithemes:
-            iter=self.iconthemestore.append(theme)
-            themename=os.path.split(theme[1])[1]
-            self.iconthemes[themename]={"iter":iter,"path":theme[1]}
-            if os.path.isdir(os.path.join(theme[1],'cursors')):
-                iter=self.cursorthemestore.append(theme)
-                self.cursorthemes[themename]={"iter":iter,"path":theme[1]}
+        self.selecting=False
+
+# Get all themes, away from the main thread
+        self.thumbnails=thumbnails.renderer(self.on_thumbnail)
+        self.monitor=None
+        themes.scan(self.on_themes_found, self.on_themes_scanned)
 
         self.matchthemes=True
+        self.ui.hide_missing(requires)
         self.refresh()
         self.refresh_window_controls()
         self.refresh_window_controls_combobox()
         self.refresh_window_controls_checkbox()
-        self.builder.connect_signals(self)
+        # Keep the page in sync when the keys change, from here or elsewhere,
+        # and the handlers keep quiet while a section runs
+        self.handlers = quiet(self)
+        self.ui.bind(bindings)
+        self.builder.connect_signals(self.handlers)
+
+        button_layout = {'wm': ('button-layout',)}
+        self.watcher = gsettings.watcher([
+            (self.handlers.section(self.refresh_themes), {
+                'interface': ('gtk-theme', 'icon-theme', 'cursor-theme'),
+                'wm': ('theme',)}),
+            (self.handlers.section(self.refresh_fonts), {
+                'interface': ('text-scaling-factor',)}),
+            (self.handlers.section(self.refresh_window_controls), button_layout),
+            (self.handlers.section(self.refresh_window_controls_combobox), button_layout),
+            (self.handlers.section(self.refresh_window_controls_checkbox), button_layout),
+        ])
 
 #=====================================================================#
 #                                Helpers                              #
@@ -116,62 +145,137 @@ class Themesettings ():
 
 
     def refresh(self):
-        # System theme
-        gtkthemesel=self.ui['tree_gtk_theme'].get_selection()
-        gtktheme=gsettings.gnome('desktop.interface').get_string('gtk-theme')
-        gtkthemesel.select_iter(self.gtkthemes[gtktheme]['iter'])
-
-        # Window Theme
-        windowthemesel=self.ui['tree_window_theme'].get_selection()
-        windowtheme=gsettings.gnome('desktop.wm.preferences').get_string('theme')
-        windowthemesel.select_iter(self.windowthemes[windowtheme]['iter'])
-
-        # Icon theme
-        iconthemesel=self.ui['tree_icon_theme'].get_selection()
-        icontheme=gsettings.gnome('desktop.interface').get_string('icon-theme')
-        iconthemesel.select_iter(self.iconthemes[icontheme]['iter'])
-
-        # Cursor theme
-        cursorthemesel=self.ui['tree_cursor_theme'].get_selection()
-        cursortheme=gsettings.gnome('desktop.interface').get_string('cursor-theme')
-
-# FIXME: LP bug: #1097227
+        self.refresh_themes()
+        self.refresh_fonts()
+
+    def refresh_themes(self):
+        snap = gsettings.snapshot()
+
+        # Showing the current themes must not write them back
+        self.selecting=True
         try:
-            cursorthemesel.select_iter(self.cursorthemes[cursortheme]['iter'])
-# TODO: except part should make sure the selection is deselected.
-        except KeyError:
-            cursorthemesel.unselect_all()
-
-        # ===== Fonts ===== #
-
-        # Fonts
-        self.ui['font_default'].set_font_name(gsettings.interface.get_string('font-name'))
-        self.ui['font_document'].set_font_name(gsettings.interface.get_string('document-font-name'))
-        self.ui['font_monospace'].set_font_name(gsettings.interface.get_string('monospace-font-name'))
-        self.ui['font_window_title'].set_font_name(gsettings.wm.get_string('titlebar-font'))
-
-        # Antialiasing        
-        antialiasing = gsettings.antialiasing.get_string('antialiasing')
-        if antialiasing == 'none':
-            self.ui['cbox_antialiasing'].set_active(0)
-        elif antialiasing == 'grayscale':
-            self.ui['cbox_antialiasing'].set_active(1)
-        elif antialiasing == 'rgba':
-            self.ui['cbox_antialiasing'].set_active(2)
-
-        # Hinting            
-        hinting = gsettings.antialiasing.get_string('hinting')
-        if hinting == 'none':
-            self.ui['cbox_hinting'].set_active(0)
-        elif hinting == 'slight':
-            self.ui['cbox_hinting'].set_active(1)
-        elif hinting == 'medium':
-            self.ui['cbox_hinting'].set_active(2)
-        elif hinting == 'full':
-            self.ui['cbox_hinting'].set_active(3)
+            # System theme
+            self.select_theme('tree_gtk_theme', self.gtkthemes, self.chosen(snap, 'interface', 'gtk-theme'))
+
+            # Window Theme
+            self.select_theme('tree_window_theme', self.windowthemes, self.chosen(snap, 'wm', 'theme'))
+
+            # Icon theme
+            self.select_theme('tree_icon_theme', self.iconthemes, self.chosen(snap, 'interface', 'icon-theme'))
+
+            # Cursor theme
+            self.select_theme('tree_cursor_theme', self.cursorthemes, self.chosen(snap, 'interface', 'cursor-theme'))
+        finally:
+            self.selecting=False
+
+    def chosen(self, snap, name, key):
+        '''The theme to show as selected for key: the one being previewed
+        while its write is pending, else the stored one'''
+        theme = gsettings.scheduled(getattr(gsettings, name), key)
+        return getattr(snap, name).get_string(key) if theme is None else theme
+
+    def select_theme(self, tree, found, theme):
+        selection=self.ui[tree].get_selection()
+        # Not found (yet): LP bug: #1097227 for cursors
+        if theme in found:
+            model=self.ui[tree].get_model()
+            visible,iter=model.convert_child_iter_to_iter(found[theme]['iter'])
+            # An incomplete theme in use shows as no selection while it is hidden
+            if visible:
+                selection.select_iter(iter)
+                return
+        selection.unselect_all()
+
+    def theme_visible(self, model, iter, udata=None):
+        return self.show_incomplete or model[iter][2]
+
+    def on_themes_found(self, kind, rows):
+        '''Add a batch of themes from themes.scan, and select the current
+        ones as soon as they show up'''
+        if kind == 'gtk':
+            for title, path, complete in rows:
+                iter=self.gtkthemestore.append((title, path, complete, None))
+                themename=os.path.basename(path)
+                self.gtkthemes[themename]={"iter":iter,"path":path}
+                self.windowthemes[themename]={"iter":iter,"path":path}
+                self.thumbnails.add('gtk', path)
+        else:
+            for title, path, cursors, complete, cursors_complete in rows:
+                iter=self.iconthemestore.append((title, path, complete, '', None))
+                themename=os.path.basename(path)
+                self.iconthemes[themename]={"iter":iter,"path":path}
+                self.thumbnails.add('icon', path)
+                if cursors:
+                    iter=self.cursorthemestore.append((title, path, cursors_complete, None))
+                    self.cursorthemes[themename]={"iter":iter,"path":path}
+                    self.thumbnails.add('cursor', path)
+        self.refresh_themes()
+
+    def on_thumbnail(self, kind, path, pixbuf):
+        '''Show a thumbnail from the worker processes, if its row is still there'''
+        found, store, column={
+            'gtk':      (self.gtkthemes, self.gtkthemestore, 3),
+            'icon':     (self.iconthemes, self.iconthemestore, 4),
+            'cursor':   (self.cursorthemes, self.cursorthemestore, 3),
+        }[kind]
+        themename=os.path.basename(path)
+        if themename in found and found[themename]['path'] == path:
+            store.set_value(found[themename]['iter'], column, pixbuf)
+
+    def close(self):
+        '''Stop the thumbnail workers and the theme monitor'''
+        self.thumbnails.close()
+        if self.monitor is not None:
+            self.monitor.cancel()
+
+    def on_themes_scanned(self):
+        # Follow themes being installed and removed from now on
+        self.monitor=themes.monitor(self.on_themes_changed)
+        iconindex.score(self.on_icon_coverage)
+
+    def on_icon_coverage(self, scores):
+        '''Show how many standard icon names each icon theme resolves'''
+        for themename, coverage in scores.items():
+            if themename in self.iconthemes:
+                self.iconthemestore.set_value(self.iconthemes[themename]['iter'], 3, '{:.0%}'.format(coverage))
+
+    def on_themes_changed(self, changes):
+        '''Apply themes added or removed while the page is open, row by row'''
+        added={'gtk': [], 'icon': []}
+        # Removing a selected row must not write anything either
+        self.selecting=True
+        try:
+            for path, entry in changes.items():
+                themename=os.path.basename(path)
+                # The window list shares the GTK store, so its rows go with those
+                for found, store in ((self.gtkthemes, self.gtkthemestore), (self.windowthemes, None),
+                                     (self.iconthemes, self.iconthemestore), (self.cursorthemes, self.cursorthemestore)):
+                    if themename in found and found[themename]['path'] == path:
+                        if store is not None:
+                            store.remove(found[themename]['iter'])
+                        del found[themename]
+                if entry is not None:
+                    kind=themes.kind_of(path)
+                    row=themes.row(kind, path, entry)
+                    if row is not None:
+                        added[kind].append(row)
+        finally:
+            self.selecting=False
+        for kind, rows in added.items():
+            if rows:
+                self.on_themes_found(kind, rows)
+        self.refresh_themes()
+        # An icon theme coming or going can change what others inherit
+        if any(themes.kind_of(path) == 'icon' for path in changes):
+            iconindex.score(self.on_icon_coverage)
+
+    # ===== Fonts ===== #
+
+    def refresh_fonts(self):
+        snap = gsettings.snapshot()
 
         # Scaling        
-        self.ui['spin_textscaling'].set_value(gsettings.interface.get_double('text-scaling-factor'))
+        self.ui['spin_textscaling'].set_value(snap.interface.get_double('text-scaling-factor'))
 
 
 # Custom refresh functions, due to the reset button for the window controls calls a segmentation fault when
@@ -182,8 +286,9 @@ class Themesettings ():
 
     # Button layout
     def refresh_window_controls(self):
+        snap = gsettings.snapshot()
 
-        button_layout = gsettings.wm.get_string('button-layout')
+        button_layout = snap.wm.get_string('button-layout')
         combobox = ['cbox_custom_layout']
         dependants = ['radio_left',
                     'radio_right']
@@ -204,8 +309,9 @@ class Themesettings ():
 
     # Custom Combobox
     def refresh_window_controls_combobox(self):
+        snap = gsettings.snapshot()
 
-        button_layout_cbox = gsettings.wm.get_string('button-layout')
+        button_layout_cbox = snap.wm.get_string('button-layout')
         if button_layout_cbox == 'close:':
             self.ui['cbox_custom_layout'].set_active(1)
         elif button_layout_cbox == 'close,maximize:':
@@ -220,8 +326,9 @@ class Themesettings ():
 
     # Show menu
     def refresh_window_controls_checkbox(self):
+        snap = gsettings.snapshot()
 
-        button_layout_check = gsettings.wm.get_string('button-layout')
+        button_layout_check = snap.wm.get_string('button-layout')
         if button_layout_check.startswith('menu:'):
             self.ui['check_show_menu'].set_active(True)
         elif button_layout_check.endswith(':menu'):
@@ -238,102 +345,102 @@ class Themesettings ():
 
 # These check for nonetype and return since for some bizzare reason Gtk.quit destroys 
 # the selection object and then calls these callbacks. This is a temporary fix to LP:1096964
+# They also return while refresh_themes is showing the current themes.
+
+    def preview_theme(self, settings, key, theme):
+        '''Restyle only this window with theme, and write it to key once the
+        selection has rested for preview_delay or a row is activated.
+        Window decorations are drawn by the window manager, so the window
+        theme is only written, later.'''
+        if not self.preview_delay:
+            settings.set_string(key, theme)
+            return
+        done = None
+        if key in PREVIEW:
+            Gtk.Settings.get_default().set_property(PREVIEW[key], theme)
+            done = lambda: self.on_preview_done(key)
+        gsettings.schedule(settings, key, theme, debounce = self.preview_delay, throttle = None, done = done)
+
+    def on_preview_done(self, key):
+        '''The previewed theme was written, or dropped: let the window
+        follow the session's theme again'''
+        Gtk.Settings.get_default().reset_property(PREVIEW[key])
+
+    def on_tree_theme_row_activated(self, tree, path, column, udata=None):
+        # Apply the previewed themes now
+        gsettings.flush()
 
     # System Theme
     def on_treeselection_gtk_theme_changed(self,udata=None):
         gtktreesel = self.ui['tree_gtk_theme'].get_selection()
-        if gtktreesel is None:
+        if gtktreesel is None or self.selecting:
             return
         gtkthemestore,iter = gtktreesel.get_selected()
         if self.matchthemes:
             self.ui['treeselection_window_theme'].select_iter(iter)
         themepath=gtkthemestore.get_value(iter,1)
         theme=os.path.split(themepath)[1]
-        gsettings.gnome('desktop.interface').set_string('gtk-theme',theme)
+        self.preview_theme(gsettings.interface, 'gtk-theme', theme)
 
     def on_treeselection_window_theme_changed(self,udata=None):
         windowtreesel = self.ui['tree_window_theme'].get_selection()
-        if windowtreesel is None:
+        if windowtreesel is None or self.selecting:
             return
         windowthemestore,iter = windowtreesel.get_selected()
         if self.matchthemes:
             self.ui['treeselection_gtk_theme'].select_iter(iter)
         themepath=windowthemestore.get_value(iter,1)
         theme=os.path.split(themepath)[1]
-        gsettings.gnome('desktop.wm.preferences').set_string('theme',theme)
+        self.preview_theme(gsettings.wm, 'theme', theme)
 
     # Icon theme
     def on_tree_icon_theme_cursor_changed(self,udata=None):
         icontreesel = self.ui['tree_icon_theme'].get_selection()
-        if icontreesel is None:
+        if icontreesel is None or self.selecting:
             return
         iconthemestore,iter = icontreesel.get_selected()
         themepath=iconthemestore.get_value(iter,1)
         theme=os.path.split(themepath)[1]
-        gsettings.gnome('desktop.interface').set_string('icon-theme',theme)
+        self.preview_theme(gsettings.interface, 'icon-theme', theme)
 
     def on_check_show_incomplete_toggled(self,udata=None):
-    # TODO 
-        print('To do')
+        self.show_incomplete=self.ui['check_show_incomplete'].get_active()
+        self.selecting=True
+        try:
+            for themefilter in (self.gtkthemefilter, self.iconthemefilter, self.cursorthemefilter):
+                themefilter.refilter()
+        finally:
+            self.selecting=False
+        self.refresh_themes()
 
     # Cursor theme
     def on_tree_cursor_theme_cursor_changed(self,udata=None):
         cursortreesel = self.ui['tree_cursor_theme'].get_selection()
-        if cursortreesel is None:
+        if cursortreesel is None or self.selecting:
             return
         cursorthemestore,iter = cursortreesel.get_selected()
         themepath=cursorthemestore.get_value(iter,1)
         theme=os.path.split(themepath)[1]
-        gsettings.gnome('desktop.interface').set_string('cursor-theme',theme)
+        self.preview_theme(gsettings.interface, 'cursor-theme', theme)
 
 #----- End: Theme settings------
 
 #----- Begin: Font settings--------
 
-    def on_font_default_font_set(self, widget):
-        gsettings.interface.set_string('font-name', self.ui['font_default'].get_font_name())
-    
-    def on_font_document_font_set(self, widget):
-        gsettings.interface.set_string('document-font-name', self.ui['font_document'].get_font_name())
-    
-    def on_font_monospace_font_set(self, widget):
-        gsettings.interface.set_string('monospace-font-name', self.ui['font_monospace'].get_font_name())
-        
-    def on_font_window_title_font_set(self, widget):
-        gsettings.wm.set_string('titlebar-font', self.ui['font_window_title'].get_font_name())
-        
-    def on_cbox_antialiasing_changed(self, widget):
-        mode = self.ui['cbox_antialiasing'].get_active()
-        if mode == 0:
-            gsettings.antialiasing.set_string('antialiasing', "none")
-        elif mode == 1:
-            gsettings.antialiasing.set_string('antialiasing', "grayscale")
-        elif mode == 2:
-            gsettings.antialiasing.set_string('antialiasing', "rgba")
-
-    def on_cbox_hinting_changed(self, widget):
-        mode = self.ui['cbox_hinting'].get_active()
-        if mode == 0:
-            gsettings.antialiasing.set_string('hinting', "none")
-        elif mode == 1:
-            gsettings.antialiasing.set_string('hinting', "slight")
-        elif mode == 2:
-            gsettings.antialiasing.set_string('hinting', "medium")
-        elif mode == 3:
-            gsettings.antialiasing.set_string('hinting', "full")
-            
     def on_spin_textscaling_value_changed(self, widget):
-        gsettings.interface.set_double('text-scaling-factor', self.ui['spin_textscaling'].get_value())
+        gsettings.schedule(gsettings.interface, 'text-scaling-factor', self.ui['spin_textscaling'].get_value())
 
     def on_b_theme_font_reset_clicked(self, widget):
-        gsettings.interface.reset('font-name')
-        gsettings.interface.reset('document-font-name')
-        gsettings.interface.reset('monospace-font-name')
-        gsettings.wm.reset('titlebar-font')
-        gsettings.antialiasing.reset('antialiasing')
-        gsettings.antialiasing.reset('hinting')
-        gsettings.interface.reset('text-scaling-factor')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            interface = changes[gsettings.interface]
+            interface.reset('font-name')
+            interface.reset('document-font-name')
+            interface.reset('monospace-font-name')
+            interface.reset('text-scaling-factor')
+            changes[gsettings.wm].reset('titlebar-font')
+            if gsettings.available('antialiasing'):
+                changes[gsettings.antialiasing].reset('antialiasing')
+                changes[gsettings.antialiasing].reset('hinting')
 
 #----- End: Font settings--------
 
@@ -428,9 +535,6 @@ class Themesettings ():
 
     def on_b_theme_window_controls_reset_clicked(self, widget):
         gsettings.wm.set_string('button-layout', 'close,minimize,maximize:')
-        self.refresh_window_controls()
-        self.refresh_window_controls_combobox()
-        self.refresh_window_controls_checkbox()
 
 #----- End: Window control settings--------
         
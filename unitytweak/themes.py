@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Finding the installed GTK, window, icon and cursor themes.
+
+Listing theme directories can take seconds on a slow or networked home,
+so scan() walks them on a worker thread and hands the rows to the main
+loop in batches. What each theme root holds is remembered on disk
+between runs. A root is only listed again once its mtime changes, and a
+theme is only looked at again once its directory, index.theme or
+cursors directory does.
+While the tool is open, monitor() reports themes added and removed."""
+
+import os, os.path, json, threading, time
+import configparser
+
+from gi.repository import GLib, Gio
+
+from . import xcursor
+
+CACHE_VERSION = 4
+
+# What classify() records about a theme, from the subdirectories and
+# files at its top
+FLAGS = {
+    'gtk-2.0':      'gtk2',
+    'gtk-3.0':      'gtk3',
+    'metacity-1':   'metacity',
+    'cursors':      'cursors',
+    'index.theme':  'index',
+}
+
+# A GTK theme is complete when it has all of these, and listed as
+# incomplete when it has at least one of the GTK parts
+REQUIRED = {'gtk2', 'gtk3', 'metacity'}
+
+HIDDEN = {'LoginIcons', 'unity-webapps-applications'}
+
+def roots(kind):
+    """Return the directories holding themes of kind, 'themes' or 'icons',
+    least important first so that later ones win on name clashes"""
+    data_dirs = [GLib.get_user_data_dir()] + list(GLib.get_system_data_dirs())
+    dirs = [os.path.join(data_dir, kind) for data_dir in reversed(data_dirs)]
+    dirs.append(os.path.expanduser('~/.themes' if kind == 'themes' else '~/.icons'))
+    result = []
+    for directory in dirs:
+        if directory not in result:
+            result.append(directory)
+    return result
+
+def subdirs(path):
+    """Return the names of the directories in path, or none if it cannot
+    be read. One scandir call answers every isdir question about it."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
+
+def index_parser(path):
+    """Return the index.theme file at path parsed, or None if it cannot
+    be read or has no [Icon Theme] group"""
+    parser = configparser.RawConfigParser(strict = False, interpolation = None)
+    parser.optionxform = str
+    try:
+        with open(path, encoding = 'utf-8', errors = 'replace') as f:
+            parser.read_file(f)
+    except (OSError, configparser.Error):
+        return None
+    return parser if parser.has_section('Icon Theme') else None
+
+def parse_index(path):
+    """Read the [Icon Theme] group of an index.theme file: Name, Inherits,
+    Directories and Hidden. Returns None if it cannot be read."""
+    parser = index_parser(path)
+    if parser is None:
+        return None
+    group = parser['Icon Theme']
+    def strings(key):
+        return [value.strip() for value in group.get(key, '').split(',') if value.strip()]
+    return {
+        'name': group.get('Name', '').strip(),
+        'inherits': strings('Inherits'),
+        'directories': strings('Directories'),
+        'hidden': group.get('Hidden', 'false').strip().lower() == 'true',
+    }
+
+def classify(path):
+    """Return what the theme at path holds:
+
+        {'flags': FLAGS found at its top,
+         'index': parse_index() of its index.theme, or None,
+         'broken': xcursor.broken() if it has cursors, else [],
+         'complete': the kinds, 'gtk', 'icon' or 'cursors', it is complete as}
+
+    An icon theme is complete when its index.theme names it, is not
+    hidden and lists directories that are all there; a cursor theme when
+    it is not hidden and has all the core cursors, in readable files."""
+    try:
+        with os.scandir(path) as entries:
+            names = {entry.name for entry in entries}
+    except OSError:
+        names = set()
+    flags = sorted(FLAGS[name] for name in names & FLAGS.keys())
+    meta = parse_index(os.path.join(path, 'index.theme')) if 'index' in flags else None
+    hidden = meta is not None and meta['hidden']
+    complete = []
+    if REQUIRED.issubset(flags):
+        complete.append('gtk')
+    if (meta is not None and meta['name'] and not hidden and meta['directories'] and
+            all(directory.split('/')[0] in names for directory in meta['directories'])):
+        complete.append('icon')
+    broken = xcursor.broken(path) if 'cursors' in flags else []
+    if 'cursors' in flags and not hidden and not broken:
+        complete.append('cursors')
+    return {'flags': flags, 'index': meta, 'broken': broken, 'complete': complete}
+
+def stamp(path):
+    """Return the mtimes of what classify() reads at path: the theme
+    directory, its index.theme and its cursors directory, with None for
+    the ones that do not exist"""
+    result = []
+    for name in ('', 'index.theme', 'cursors'):
+        try:
+            result.append(os.stat(os.path.join(path, name)).st_mtime_ns)
+        except OSError:
+            result.append(None)
+    return result
+
+def survey(path):
+    """Return classify() for the theme at path with its stamp() added"""
+    # Stamped first, so that changes made meanwhile are seen next time
+    current = stamp(path)
+    return dict(classify(path), stamp = current)
+
+def cache_file():
+    return os.path.join(GLib.get_user_cache_dir(), 'unity-tweak-tool', 'themes.json')
+
+def _load():
+    try:
+        with open(cache_file()) as cache:
+            data = json.load(cache)
+        if data['version'] == CACHE_VERSION:
+            return data['roots']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return {}
+
+def _save(index):
+    path = cache_file()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        with open(path+'.tmp', 'w') as cache:
+            json.dump({'version': CACHE_VERSION, 'roots': index}, cache)
+        os.replace(path+'.tmp', path)
+    except OSError:
+        # Not being able to cache only costs a full scan on the next start
+        pass
+
+def scan_root(root):
+    """Return {'mtime': ..., 'themes': {name: survey()}} for a theme root"""
+    try:
+        mtime = os.stat(root).st_mtime_ns
+    except OSError:
+        return {'mtime': None, 'themes': {}}
+    return {'mtime': mtime,
+            'themes': {name: survey(os.path.join(root, name)) for name in subdirs(root)}}
+
+def index():
+    """Return {root: {'mtime': ..., 'themes': {name: survey()}}} for every
+    theme and icon root. Roots whose mtime matches the cached index are
+    not listed again, and of their themes only those whose stamp() has
+    changed are classified again; the index is saved if anything was."""
+    cached = _load()
+    result = {}
+    changed = False
+    for root in roots('themes') + roots('icons'):
+        try:
+            mtime = os.stat(root).st_mtime_ns
+        except OSError:
+            mtime = None
+        entry = cached.get(root)
+        if entry is not None and entry['mtime'] == mtime:
+            themes = {}
+            for name, theme in entry['themes'].items():
+                path = os.path.join(root, name)
+                if theme.get('stamp') == stamp(path):
+                    themes[name] = theme
+                else:
+                    themes[name] = survey(path)
+                    changed = True
+            result[root] = {'mtime': mtime, 'themes': themes}
+        else:
+            result[root] = scan_root(root)
+            changed = True
+    if changed or result.keys() != cached.keys():
+        _save(result)
+    return result
+
+def kind_of(path):
+    """Return 'gtk' or 'icon' for a theme path under one of the roots"""
+    return 'gtk' if os.path.dirname(path) in roots('themes') else 'icon'
+
+def row(kind, path, entry):
+    """Return the row scan() hands out for a theme, given classify(), or
+    None if it is not listed at all:
+
+        'gtk':  (title, path, complete)
+        'icon': (title, path, has_cursors, icons complete, cursors complete)"""
+    name = os.path.basename(path)
+    flags = entry['flags']
+    if kind == 'gtk':
+        if 'gtk2' in flags or 'gtk3' in flags:
+            return name.capitalize(), path, 'gtk' in entry['complete']
+    elif name not in HIDDEN:
+        return (name.capitalize(), path, 'cursors' in flags,
+                'icon' in entry['complete'], 'cursors' in entry['complete'])
+    return None
+
+def _rows(found, kind):
+    for root in roots('themes' if kind == 'gtk' else 'icons'):
+        for name, entry in sorted(found[root]['themes'].items()):
+            result = row(kind, os.path.join(root, name), entry)
+            if result is not None:
+                yield result
+
+def gtk_themes(found):
+    """Yield a row() for each GTK theme, complete or not, given index()"""
+    return _rows(found, 'gtk')
+
+def icon_themes(found):
+    """Yield a row() for each icon theme, given index()"""
+    return _rows(found, 'icon')
+
+class scan():
+    """Run index(), gtk_themes() and icon_themes() on a worker thread.
+
+    on_rows(kind, rows) is called on the main loop with 'gtk' or 'icon'
+    and a list of what the generator yielded, at most every interval
+    seconds or batch rows; on_done() is called once everything is in."""
+    def __init__(self, on_rows, on_done = None, batch = 64, interval = 0.05):
+        self.on_rows = on_rows
+        self.on_done = on_done
+        self.batch = batch
+        self.interval = interval
+        self.thread = threading.Thread(target = self.run, daemon = True)
+        self.thread.start()
+
+    def run(self):
+        found = index()
+        for kind, rows in (('gtk', gtk_themes(found)), ('icon', icon_themes(found))):
+            pending = []
+            sent = time.monotonic()
+            for row in rows:
+                pending.append(row)
+                if len(pending) >= self.batch or time.monotonic() - sent >= self.interval:
+                    GLib.idle_add(self.deliver, self.on_rows, kind, pending)
+                    pending = []
+                    sent = time.monotonic()
+            if pending:
+                GLib.idle_add(self.deliver, self.on_rows, kind, pending)
+        if self.on_done:
+            GLib.idle_add(self.deliver, self.on_done)
+
+    def deliver(self, callback, *args):
+        callback(*args)
+        return False
+
+class monitor():
+    """Watch every theme and icon root for themes added or removed.
+
+    A theme that appears is watched too, along with its subdirectories,
+    since copying or unpacking it fills it in after it is created.
+    Events are collected per theme and handed over once nothing has
+    happened for delay milliseconds; a theme that is still being filled
+    in then is handed over again as the rest arrives. on_changes gets
+    {path: classify()}, with None when the theme is gone."""
+    def __init__(self, on_changes, delay = 1000):
+        self.on_changes = on_changes
+        self.delay = delay
+        self.pending = set()
+        self.source = None
+        self.monitors = []
+        # Theme path -> monitors on it and its subdirectories
+        self.themes = {}
+        for root in roots('themes') + roots('icons'):
+            root_monitor = self.watch(root)
+            if root_monitor is not None:
+                root_monitor.connect('changed', self.on_root_changed, root)
+                self.monitors.append(root_monitor)
+
+    def watch(self, path):
+        try:
+            return Gio.File.new_for_path(path).monitor_directory(Gio.FileMonitorFlags.NONE, None)
+        except GLib.Error:
+            return None
+
+    def watch_theme(self, theme, path):
+        file_monitor = self.watch(path)
+        if file_monitor is not None:
+            file_monitor.connect('changed', self.on_theme_changed, theme)
+            self.themes.setdefault(theme, []).append(file_monitor)
+
+    def on_root_changed(self, root_monitor, changed, other, event, root):
+        if event not in (Gio.FileMonitorEvent.CREATED, Gio.FileMonitorEvent.DELETED):
+            return
+        path = changed.get_path()
+        if os.path.dirname(path) != root:
+            return
+        for file_monitor in self.themes.pop(path, ()):
+            file_monitor.cancel()
+        if event == Gio.FileMonitorEvent.CREATED and os.path.isdir(path):
+            self.watch_theme(path, path)
+            for name in subdirs(path):
+                self.watch_theme(path, os.path.join(path, name))
+        self.queue(path)
+
+    def on_theme_changed(self, file_monitor, changed, other, event, theme):
+        if event not in (Gio.FileMonitorEvent.CREATED, Gio.FileMonitorEvent.DELETED,
+                         Gio.FileMonitorEvent.CHANGES_DONE_HINT):
+            return
+        path = changed.get_path()
+        if (event == Gio.FileMonitorEvent.CREATED and os.path.dirname(path) == theme and
+                os.path.isdir(path)):
+            self.watch_theme(theme, path)
+        self.queue(theme)
+
+    def queue(self, path):
+        self.pending.add(path)
+        if self.source is not None:
+            GLib.source_remove(self.source)
+        self.source = GLib.timeout_add(self.delay, self.flush)
+
+    def flush(self):
+        self.source = None
+        pending, self.pending = self.pending, set()
+        self.on_changes({path: classify(path) if os.path.isdir(path) else None for path in pending})
+        return False
+
+    def cancel(self):
+        for file_monitor in self.monitors + [file_monitor for monitors in self.themes.values()
+                                                for file_monitor in monitors]:
+            file_monitor.cancel()
+        self.monitors = []
+        self.themes = {}
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Preview thumbnails for the theme lists.
+
+Each row gets a small strip: a few representative icons for an icon
+theme, a few cursors for a cursor theme and a mock window in the
+theme's colours for a GTK theme. They are drawn in a pool of worker
+processes, so hundreds of themes never hold up the main loop, and kept
+under $XDG_CACHE_HOME/thumbnails keyed by the theme's path and mtime,
+so later runs only load the finished PNGs."""
+
+import hashlib, os, os.path, queue, re, threading
+import multiprocessing
+
+from gi.repository import GLib, GdkPixbuf
+
+from . import iconindex
+from . import xcursor
+
+# Height of every thumbnail, and of each image in a strip
+SIZE = 24
+GAP = 4
+
+SAMPLE_ICONS = ('folder', 'text-x-generic', 'utilities-terminal', 'user-trash')
+SAMPLE_CURSORS = ('left_ptr', 'xterm', 'hand2', 'watch')
+
+# Colours a GTK theme is drawn in when it does not name its own
+COLORS = {
+    'bg':           '#edeceb',
+    'fg':           '#3c3c3c',
+    'base':         '#ffffff',
+    'selected_bg':  '#f07746',
+}
+# @define-color theme_bg_color #...; in GTK 3, bg_color:#... in a GTK 2
+# gtk-color-scheme, whose entries are separated by a literal \n
+COLOR = re.compile(r'@define-color\s+theme_(\w+?)_color\s+(#[0-9a-fA-F]{6})\b|'
+                   r'(?:\\n|\b)(\w+?)_color\s*:\s*(#[0-9a-fA-F]{6})\b')
+
+def cache_dir():
+    return os.path.join(GLib.get_user_cache_dir(), 'thumbnails', 'unity-tweak-tool')
+
+def cache_file(kind, path, mtime):
+    key = '{}\n{}\n{}'.format(kind, GLib.filename_to_uri(path, None), mtime)
+    return os.path.join(cache_dir(), hashlib.md5(key.encode('utf-8')).hexdigest()+'.png')
+
+def strip(pixbufs):
+    """Lay out pixbufs left to right, each centred in a SIZE square"""
+    width = max(len(pixbufs)*(SIZE+GAP)-GAP, 1)
+    result = GdkPixbuf.Pixbuf.new(GdkPixbuf.Colorspace.RGB, True, 8, width, SIZE)
+    result.fill(0)
+    for index, pixbuf in enumerate(pixbufs):
+        if pixbuf.get_width() > SIZE or pixbuf.get_height() > SIZE:
+            scale = SIZE/max(pixbuf.get_width(), pixbuf.get_height())
+            pixbuf = pixbuf.scale_simple(max(int(pixbuf.get_width()*scale), 1),
+                                         max(int(pixbuf.get_height()*scale), 1),
+                                         GdkPixbuf.InterpType.BILINEAR)
+        pixbuf.copy_area(0, 0, pixbuf.get_width(), pixbuf.get_height(), result,
+                         index*(SIZE+GAP)+(SIZE-pixbuf.get_width())//2, (SIZE-pixbuf.get_height())//2)
+    return result
+
+_lookup = None
+
+def render_icon(path):
+    global _lookup
+    if _lookup is None:
+        # Built once per worker; the tables it reads are kept for later themes
+        _lookup = iconindex.lookup()
+    pixbufs = []
+    for name in SAMPLE_ICONS:
+        entries = _lookup.find(os.path.basename(path), name)
+        if not entries:
+            continue
+        # The smallest image at least SIZE big, or else the biggest there is
+        size, context, filename = min(entries, key = lambda entry: (entry[0] < SIZE, abs(entry[0]-SIZE)))
+        try:
+            pixbufs.append(GdkPixbuf.Pixbuf.new_from_file_at_size(filename, SIZE, SIZE))
+        except GLib.Error:
+            pass
+    return strip(pixbufs) if pixbufs else None
+
+def render_cursor(path):
+    pixbufs = []
+    for name in SAMPLE_CURSORS:
+        try:
+            width, height, pixels = xcursor.image(os.path.join(path, 'cursors', name), SIZE)
+        except (OSError, ValueError):
+            continue
+        pixbufs.append(GdkPixbuf.Pixbuf.new_from_bytes(GLib.Bytes.new(pixels), GdkPixbuf.Colorspace.RGB,
+                                                       True, 8, width, height, width*4))
+    return strip(pixbufs) if pixbufs else None
+
+def theme_colors(path):
+    """Return the COLORS of the GTK theme at path, from its GTK 3 style
+    sheets or else its GTK 2 colour scheme"""
+    found = {}
+    sources = []
+    gtk3 = os.path.join(path, 'gtk-3.0')
+    try:
+        sources = sorted(os.path.join(gtk3, name) for name in os.listdir(gtk3) if name.endswith('.css'))
+    except OSError:
+        pass
+    sources.append(os.path.join(path, 'gtk-2.0', 'gtkrc'))
+    for source in sources:
+        try:
+            with open(source, encoding = 'utf-8', errors = 'replace') as f:
+                text = f.read()
+        except OSError:
+            continue
+        for match in COLOR.finditer(text):
+            name, value = (match.group(1), match.group(2)) if match.group(1) else (match.group(3), match.group(4))
+            if name in COLORS:
+                found.setdefault(name, value)
+    return dict(COLORS, **found)
+
+def fill(pixbuf, x, y, width, height, color):
+    pixbuf.new_subpixbuf(x, y, width, height).fill(int(color[1:], 16) << 8 | 0xff)
+
+def render_gtk(path):
+    """A mock window: background, a selected row, an entry and text"""
+    colors = theme_colors(path)
+    width = 3*SIZE
+    result = GdkPixbuf.Pixbuf.new(GdkPixbuf.Colorspace.RGB, True, 8, width, SIZE)
+    fill(result, 0, 0, width, SIZE, colors['fg'])
+    fill(result, 1, 1, width-2, SIZE-2, colors['bg'])
+    fill(result, 3, 3, width-6, 7, colors['selected_bg'])
+    fill(result, 3, 12, width-6, 9, colors['fg'])
+    fill(result, 4, 13, width-8, 7, colors['base'])
+    fill(result, 6, 16, width//3, 1, colors['fg'])
+    return result
+
+RENDER = {
+    'gtk':      render_gtk,
+    'icon':     render_icon,
+    'cursor':   render_cursor,
+}
+
+def thumbnail(job):
+    """Return (kind, path, file) with the thumbnail of the theme at path,
+    rendering it unless it is cached; file is None if there is nothing to
+    show. Runs in the worker processes."""
+    kind, path = job
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        filename = cache_file(kind, path, mtime)
+        if os.path.exists(filename):
+            return kind, path, filename
+        pixbuf = RENDER[kind](path)
+        if pixbuf is None:
+            return kind, path, None
+        os.makedirs(cache_dir(), exist_ok = True)
+        pixbuf.savev(filename+'.tmp', 'png', ['tEXt::Thumb::URI', 'tEXt::Thumb::MTime'],
+                     [GLib.filename_to_uri(path, None), str(mtime//10**9)])
+        os.replace(filename+'.tmp', filename)
+        return kind, path, filename
+    except (OSError, GLib.Error):
+        return kind, path, None
+
+class renderer():
+    """Make thumbnails with a pool of jobs worker processes (one per CPU
+    by default). add(kind, path) queues a theme of kind 'gtk', 'icon' or
+    'cursor'; on_thumbnail(kind, path, pixbuf) is called on the main
+    loop as each one is ready. close() stops the pool, dropping what is
+    still queued; call it before quitting.
+
+    The pool is started from a thread of its own and forks from a clean
+    server process rather than from this one, which runs GTK and other
+    threads."""
+    def __init__(self, on_thumbnail, jobs = None):
+        self.on_thumbnail = on_thumbnail
+        self.jobs = jobs
+        self.queue = queue.Queue()
+        self.thread = threading.Thread(target = self.run, daemon = True)
+        self.thread.start()
+
+    def add(self, kind, path):
+        self.queue.put((kind, path))
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+    def run(self):
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__])
+        # Jobs are handed over one by one, so that nothing in the pool is
+        # left waiting on this queue when it is terminated
+        with context.Pool(self.jobs) as pool:
+            for job in iter(self.queue.get, None):
+                pool.apply_async(thumbnail, (job,), callback = self.done)
+
+    def done(self, result):
+        GLib.idle_add(self.deliver, *result)
+
+    def deliver(self, kind, path, filename):
+        if filename is not None:
+            try:
+                self.on_thumbnail(kind, path, GdkPixbuf.Pixbuf.new_from_file(filename))
+            except GLib.Error:
+                pass
+        return False
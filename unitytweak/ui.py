@@ -28,6 +28,14 @@
 # You should have received a copy of the GNU General Public License along with
 # this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
 
+from gi.repository import GLib, GObject, Gio, Gtk
+
+from . import gsettings
+from . import settings
+
+# Mapping for ui.bind entries showing a boolean key the other way round
+INVERT = 'invert'
+
 class ui():
     def __init__(self, builder):
         self.builder = builder
@@ -39,3 +47,161 @@ class ui():
     def unsensitize(self,list):
         for item in list:
             self.__getitem__(item).set_sensitive(False)
+    def inside(self, widget, within):
+        '''Whether widget is within, or one of its descendants. Anything
+        counts when within is None; nothing that is not built yet does.'''
+        if within is None:
+            return True
+        widget = self.__getitem__(widget)
+        within = self.__getitem__(within)
+        return widget is not None and (widget is within or widget.is_ancestor(within))
+    def hide_missing(self, requires, within = None):
+        '''Hide every widget in requires, a {widget: names} mapping, that
+        needs a gsettings object whose schema is not installed. With
+        within, only widgets inside that one are considered.'''
+        for widget, names in requires.items():
+            if not self.inside(widget, within):
+                continue
+            if not gsettings.available(*names):
+                widget = self.__getitem__(widget)
+                # Keep show_all on the main window from bringing it back
+                widget.set_no_show_all(True)
+                widget.hide()
+    def bind(self, bindings, within = None):
+        '''Keep widgets and the keys they show in sync.
+
+        bindings is a sequence of (name, key, widget, property, mapping,
+        dependants) where name is a gsettings object name. With mapping
+        None or INVERT the property is bound natively by Gio.Settings.bind;
+        otherwise mapping is a (get, set) pair converting the key's value
+        to the property's and back. Widgets in dependants are sensitive
+        only while the property is true. Entries whose schema is not
+        installed are skipped, and so are widgets outside within.'''
+        for name, key, widget, prop, mapping, dependants in bindings:
+            if not gsettings.available(name) or not self.inside(widget, within):
+                continue
+            settings = getattr(gsettings, name)
+            widget = self.__getitem__(widget)
+            if mapping is None or mapping is INVERT:
+                flags = Gio.SettingsBindFlags.DEFAULT | Gio.SettingsBindFlags.NO_SENSITIVITY
+                if mapping is INVERT:
+                    flags |= Gio.SettingsBindFlags.INVERT_BOOLEAN
+                settings.bind(key, widget, prop, flags)
+            else:
+                self._bind_mapped(settings, key, widget, prop, *mapping)
+            for dependant in dependants:
+                widget.bind_property(prop, self.__getitem__(dependant), 'sensitive',
+                                     GObject.BindingFlags.SYNC_CREATE)
+
+    def _bind_mapped(self, settings, key, widget, prop, get_mapping, set_mapping):
+        value_type = settings.get_value(key).get_type_string()
+        def on_changed(settings, key):
+            value = get_mapping(settings.get_value(key).unpack())
+            if widget.get_property(prop) != value:
+                widget.set_property(prop, value)
+        def on_notify(widget, pspec):
+            variant = GLib.Variant(value_type, set_mapping(widget.get_property(prop)))
+            if not settings.get_value(key).equal(variant):
+                settings.set_value(key, variant)
+        on_changed(settings, key)
+        settings.connect('changed::'+key, on_changed)
+        widget.connect('notify::'+prop, on_notify)
+
+class quiet():
+    '''The signal handlers of page, to pass to Gtk.Builder.connect_signals,
+    made to do nothing while page.refreshing is set: showing the current
+    settings in the widgets must not write them back.'''
+    def __init__(self, page):
+        self.page = page
+        page.refreshing = False
+    def __getattr__(self, name):
+        handler = getattr(self.page, name)
+        def guarded(*args):
+            if not self.page.refreshing:
+                return handler(*args)
+        return guarded
+    def section(self, section):
+        '''Wrap a gsettings.watcher section to run with page.refreshing set'''
+        def refresh():
+            refreshing, self.page.refreshing = self.page.refreshing, True
+            try:
+                section()
+            finally:
+                self.page.refreshing = refreshing
+        return refresh
+
+class lazy():
+    '''Stand-in for a settings page that is only built when first used.
+
+    The notebook gets an empty placeholder in the page's slot. Looking
+    up any attribute, such as .page from a menu handler, builds the real
+    page with factory(*args) and swaps it into that slot.'''
+    def __init__(self, notebook, factory, *args):
+        self.notebook = notebook
+        self.factory = factory
+        self.args = args
+        self.instance = None
+        self.placeholder = Gtk.Box()
+        notebook.append_page(self.placeholder, None)
+    def build(self):
+        if self.instance is None:
+            instance = self.factory(*self.args)
+            index = self.notebook.page_num(self.placeholder)
+            current = self.notebook.get_current_page() == index
+            self.notebook.insert_page(instance.page, None, index)
+            self.notebook.remove_page(index+1)
+            instance.page.show_all()
+            if current:
+                self.notebook.set_current_page(index)
+            self.instance = instance
+        return self.instance
+    def __getattr__(self, name):
+        return getattr(self.build(), name)
+
+class tabs():
+    '''A notebook whose tabs are loaded from a .ui file one at a time.
+
+    subpages lists (content, label, objects) for each tab: the id of its
+    content, the id of its tab label and the ids of the top-level objects
+    its widgets use, such as adjustments and list stores. Only the labels
+    are loaded up front. The first time a tab is shown its widgets are
+    picked out of the file with settings.add_ui and built(content) is
+    called. Tabs whose content is in requires with a schema that is not
+    installed are hidden and never loaded.'''
+    def __init__(self, builder, name, subpages, requires, built):
+        self.builder = builder
+        self.name = name
+        self.subpages = subpages
+        self.built = built
+        self.notebook = Gtk.Notebook(margin_top = 4)
+        settings.add_ui(builder, name, [label for content, label, objects in subpages])
+        self.slots = []
+        for content, label, objects in subpages:
+            slot = Gtk.Box()
+            if not gsettings.available(*requires.get(content, ())):
+                slot.set_no_show_all(True)
+            self.notebook.append_page(slot, builder.get_object(label))
+            self.slots.append(slot)
+        self.notebook.connect('switch-page', self.on_switch_page)
+        self.notebook.connect('map', self.on_map)
+    def load(self, index):
+        slot = self.slots[index]
+        if slot.get_children() or slot.get_no_show_all():
+            return
+        content, label, objects = self.subpages[index]
+        settings.add_ui(self.builder, self.name, [content]+list(objects))
+        slot.pack_start(self.builder.get_object(content), True, True, 0)
+        self.built(content)
+        slot.show_all()
+    def load_all(self):
+        for index in range(len(self.slots)):
+            self.load(index)
+    def on_switch_page(self, notebook, page, index):
+        self.load(index)
+    def on_map(self, notebook):
+        # Deep links pick a tab right after the page is shown; load
+        # whichever is current then, before the first redraw
+        GLib.idle_add(self.on_map_idle, priority = GLib.PRIORITY_HIGH_IDLE)
+    def on_map_idle(self):
+        self.load(self.notebook.get_current_page())
+        return False
@@ -32,46 +32,168 @@ import os, os.path
 
 from gi.repository import Gtk, Gio, Gdk
 
-from .ui import ui
+from .ui import ui, tabs, quiet, INVERT
 from . import settings
 from . import gsettings
+from . import mappings
+
+# Widgets that show a single key as it is: (object, key, widget, property,
+# mapping, dependants). See ui.bind.
+bindings = [
+    # Launcher
+    ('unityshell', 'autohide-animation', 'cbox_autohide_animation', 'active', None, ()),
+    ('unityshell', 'backlight-mode', 'cbox_launcher_icon_colouring', 'active', None, ()),
+    ('unityshell', 'urgent-animation', 'cbox_urgent_animation', 'active', None, ()),
+    ('unityshell', 'launch-animation', 'cbox_launch_animation', 'active', None, ()),
+    # Dash
+    ('lenses', 'remote-content-search', 'check_suggestions', 'active',
+        (lambda value: value == 'all', lambda active: 'all' if active else 'none'), ()),
+    ('lens_apps', 'display-recent-apps', 'check_show_recent_apps', 'active', None, ()),
+    ('lens_apps', 'display-available-apps', 'check_show_available_apps', 'active', None, ()),
+    ('lens_files', 'use-locate', 'check_use_locate', 'active', None, ()),
+    # Panel
+    ('unityshell', 'panel-opacity-maximized-toggle', 'check_panel_opaque', 'active', None, ()),
+    ('datetime', 'show-clock', 'check_indicator_datetime', 'active', None,
+        ('radio_12hour', 'radio_24hour', 'check_date', 'check_weekday',
+         'l_clock', 'check_calendar', 'check_time_seconds')),
+    ('datetime', 'show-seconds', 'check_time_seconds', 'active', None, ()),
+    ('datetime', 'show-date', 'check_date', 'active', None, ()),
+    ('datetime', 'show-day', 'check_weekday', 'active', None, ()),
+    ('datetime', 'show-calendar', 'check_calendar', 'active', None, ()),
+    ('session', 'show-real-name-on-panel', 'check_indicator_username', 'active', None, ()),
+    ('power', 'show-time', 'check_indicator_battery_life', 'active', None, ()),
+    ('bluetooth', 'visible', 'check_indicator_bluetooth', 'active', None, ()),
+    ('sound', 'visible', 'check_indicator_sound', 'active', None, ()),
+    ('sound', 'show-notify-osd-on-scroll', 'check_scroll_notifyosd', 'active', None, ()),
+    # Switcher
+    ('unityshell', 'alt-tab-bias-viewport', 'check_switchwindows_all_workspaces', 'active', INVERT, ()),
+    ('unityshell', 'disable-show-desktop', 'check_switcher_showdesktop', 'active', INVERT, ()),
+    ('unityshell', 'show-minimized-windows', 'check_minimizedwindows_switch', 'active', None, ()),
+    ('unityshell', 'alt-tab-timeout', 'check_autoexposewindows', 'active', None, ()),
+    # Webapps
+    ('webapps', 'integration-allowed', 'switch_unity_webapps', 'active', None, ()),
+    # Additional
+    ('unityshell', 'shortcut-overlay', 'check_shortcuts_hints_overlay', 'active', None, ()),
+]
+
+# Widgets to hide when the schemas they need are not installed
+requires = {
+    'box_unity_launcher':           ('unityshell', 'launcher'),
+    'box_unity_dash':               ('unityshell',),
+    'check_suggestions':            ('lenses',),
+    'grid_application_lens':        ('lens_apps',),
+    'grid_files_lens':              ('lens_files',),
+    'box_unity_panel':              ('unityshell',),
+    'box_indicator_datetime':       ('datetime',),
+    'check_indicator_bluetooth':    ('bluetooth',),
+    'box_indicator_power':          ('power',),
+    'grid_indicator_sound':         ('sound',),
+    'check_indicator_username':     ('session',),
+    'box_unity_switcher':           ('unityshell',),
+    'box_unity_webapps':            ('webapps',),
+    'box_unity_additional':         ('unityshell',),
+}
+
+# Sub-tabs, each loaded when first shown: (content, tab label, top-level
+# objects it uses). See ui.tabs.
+subpages = [
+    ('box_unity_launcher', 'l_page_unity_launcher',
+        ('adj_launcher_icon_size', 'adj_launcher_transparency', 'adj_reveal_sensitivity')),
+    ('box_unity_dash', 'l_page_unity_dash', ()),
+    ('box_unity_panel', 'l_page_unity_panel',
+        ('adj_menu_visible', 'adj_panel_transparency')),
+    ('box_unity_switcher', 'l_page_unity_switcher',
+        ('list_unity_switcher_launcher_accelerators', 'list_unity_switcher_windows_accelerators')),
+    ('box_unity_webapps', 'l_page_webapps', ()),
+    ('box_unity_additional', 'l_page_unity_additional',
+        ('list_unity_additional_accelerators',)),
+]
 
 class Unitysettings ():
     def __init__(self, container):
         '''Handler Initialisations.
         Obtain all references here.'''
         self.builder = Gtk.Builder()
-        self.glade = (os.path.join(settings.UI_DIR,
-                                    'unity.ui'))
+        self.glade = 'unity.ui'
         self.container = container
-        self.builder.add_from_file(self.glade)
         self.ui = ui(self.builder)
-        self.page = self.ui['nb_unitysettings']
-        self.page.unparent()
 
-        self.ui['sc_reveal_sensitivity'].add_mark(2.0, Gtk.PositionType.BOTTOM, None)
-
-        self.ui['sc_launcher_transparency'].add_mark(.666, Gtk.PositionType.BOTTOM, None)
-
-        self.ui['sc_panel_transparency'].add_mark(.67, Gtk.PositionType.BOTTOM, None)
-
-        if Gdk.Screen.get_default().get_n_monitors() == 1:
-            dependants = ['l_launcher_visibility',
-                          'radio_launcher_visibility_all',
-                          'radio_launcher_visibility_primary']
-            self.ui.unsensitize(dependants)
-
-
-        self.refresh()
-        self.builder.connect_signals(self)
+        # Keep the page in sync when the keys change, from here or elsewhere.
+        # Each sub-tab's sections are watched once the sub-tab is built,
+        # and the handlers keep quiet while a section runs.
+        self.handlers = quiet(self)
+        self.watcher = gsettings.watcher([])
+        self.sections = {
+            'box_unity_launcher': [
+                (self.handlers.section(self.refresh_launcher), {
+                    'unityshell': ('launcher-hide-mode', 'reveal-trigger',
+                                   'edge-responsiveness', 'launcher-opacity',
+                                   'num-launchers', 'background-color',
+                                   'icon-size'),
+                    'launcher': ('favorites',)})],
+            'box_unity_dash': [
+                (self.handlers.section(self.refresh_dash), {
+                    'unityshell': ('dash-blur-experimental',)})],
+            'box_unity_panel': [
+                (self.handlers.section(self.refresh_panel), {
+                    'unityshell': ('menus-discovery-duration', 'panel-opacity')}),
+                (self.handlers.section(self.refresh_power), {
+                    'power': ('icon-policy',)}),
+                (self.handlers.section(self.refresh_datetime), {
+                    'datetime': ('time-format',)}),
+                (self.handlers.section(self.refresh_sound), {
+                    'sound': ('interested-media-players', 'preferred-media-players')})],
+            'box_unity_switcher': [
+                (self.handlers.section(self.refresh_switcher), {
+                    'unityshell': ('alt-tab-forward', 'alt-tab-prev',
+                                   'alt-tab-forward-all', 'alt-tab-prev-all',
+                                   'alt-tab-right', 'alt-tab-left',
+                                   'alt-tab-detail-start', 'alt-tab-detail-stop',
+                                   'alt-tab-next-window', 'alt-tab-prev-window',
+                                   'launcher-switcher-forward', 'launcher-switcher-prev')})],
+            'box_unity_webapps': [],
+            'box_unity_additional': [
+                (self.handlers.section(self.refresh_additional), {
+                    'unityshell': ('show-hud', 'show-launcher',
+                                   'execute-command', 'keyboard-focus',
+                                   'panel-first-menu')})],
+        }
+
+        self.tabs = tabs(self.builder, self.glade, subpages, requires, self.on_subpage_built)
+        self.page = self.tabs.notebook
+
+    def on_subpage_built(self, content):
+        '''Wire up a sub-tab the first time it is shown'''
+        if content == 'box_unity_launcher':
+            self.ui['sc_reveal_sensitivity'].add_mark(2.0, Gtk.PositionType.BOTTOM, None)
+
+            self.ui['sc_launcher_transparency'].add_mark(.666, Gtk.PositionType.BOTTOM, None)
+
+            if Gdk.Screen.get_default().get_n_monitors() == 1:
+                dependants = ['l_launcher_visibility',
+                              'radio_launcher_visibility_all',
+                              'radio_launcher_visibility_primary']
+                self.ui.unsensitize(dependants)
+
+        elif content == 'box_unity_panel':
+            self.ui['sc_panel_transparency'].add_mark(.67, Gtk.PositionType.BOTTOM, None)
+
+        self.ui.hide_missing(requires, content)
+        self.watcher.add(self.sections[content])
+        self.ui.bind(bindings, content)
+        self.builder.connect_signals(self.handlers)
 
 #=====================================================================#
 #                                Helpers                              #
 #=====================================================================#
     def refresh(self):
         '''Reads the current config and refreshes the displayed values'''
+        self.watcher.refresh()
 
-        # ====== Launcher Helpers ===== #
+    # ====== Launcher Helpers ===== #
+
+    def refresh_launcher(self):
+        snap = gsettings.snapshot()
 
         # Auto hide
         dependants = ['radio_reveal_left',
@@ -80,7 +202,7 @@ class Unitysettings ():
                     'l_launcher_reveal',
                     'l_launcher_reveal_sensitivity']
 
-        if gsettings.unityshell.get_int('launcher-hide-mode'):
+        if snap.unityshell.get_int('launcher-hide-mode'):
             self.ui['sw_launcher_hidemode'].set_active(True)
             self.ui.sensitize(dependants)
         else:
@@ -88,60 +210,57 @@ class Unitysettings ():
             self.ui.unsensitize(dependants)
         del dependants
 
-        self.ui['cbox_autohide_animation'].set_active(gsettings.unityshell.get_int('autohide-animation'))
-
         # Reveal
-        self.ui['radio_reveal_left'].set_active(True if gsettings.unityshell.get_int('reveal-trigger') is 0 else False)
-        self.ui['radio_reveal_topleft'].set_active(True if gsettings.unityshell.get_int('reveal-trigger') is 1 else False)
-        self.ui['sc_reveal_sensitivity'].set_value(gsettings.unityshell.get_double('edge-responsiveness'))
+        self.ui['radio_reveal_left'].set_active(True if snap.unityshell.get_int('reveal-trigger') == 0 else False)
+        self.ui['radio_reveal_topleft'].set_active(True if snap.unityshell.get_int('reveal-trigger') == 1 else False)
+        self.ui['sc_reveal_sensitivity'].set_value(snap.unityshell.get_double('edge-responsiveness'))
 
         # Transparency
         dependants = ['l_launcher_transparency_scale',
                     'sc_launcher_transparency']
-        opacity = gsettings.unityshell.get_double('launcher-opacity')
+        opacity = snap.unityshell.get_double('launcher-opacity')
         if opacity == 1:
             self.ui['sw_launcher_transparent'].set_active(False)
             self.ui.unsensitize(dependants)
         else:
+            self.ui['sc_launcher_transparency'].set_value(opacity)
             self.ui['sw_launcher_transparent'].set_active(True)
             self.ui.sensitize(dependants)
-        self.ui['sc_launcher_transparency'].set_value(0.67)
         del dependants
         del opacity
 
         # Visibility
-        mode = gsettings.unityshell.get_int('num-launchers')
-        self.ui['radio_launcher_visibility_all'].set_active(True if mode is 0 else False)
-        self.ui['radio_launcher_visibility_primary'].set_active(True if mode is 1 else False)
+        mode = snap.unityshell.get_int('num-launchers')
+        self.ui['radio_launcher_visibility_all'].set_active(True if mode == 0 else False)
+        self.ui['radio_launcher_visibility_primary'].set_active(True if mode == 1 else False)
         del mode
 
         # Colour
-        color = gsettings.unityshell.get_string('background-color')
-        if color.endswith('00'):
-            self.ui['radio_launcher_color_cham'].set_active(True)
-            self.ui.unsensitize(['color_launcher_color_cus'])
-        else:
+        custom, color = mappings.launcher_color(snap.unityshell.get_string('background-color'))
+        if custom:
             self.ui['radio_launcher_color_cus'].set_active(True)
             self.ui.sensitize(['color_launcher_color_cus'])
-        valid, gdkcolor = Gdk.Color.parse(color[:-2])
+        else:
+            self.ui['radio_launcher_color_cham'].set_active(True)
+            self.ui.unsensitize(['color_launcher_color_cus'])
+        valid, gdkcolor = Gdk.Color.parse(color)
         if valid:
             self.ui['color_launcher_color_cus'].set_color(gdkcolor)
-        del color, valid, gdkcolor
+        del custom, color, valid, gdkcolor
 
         # Icons
-        self.ui['spin_launcher_icon_size'].set_value(gsettings.unityshell.get_int('icon-size'))
-        self.ui['cbox_launcher_icon_colouring'].set_active(gsettings.unityshell.get_int('backlight-mode'))
-        self.ui['cbox_urgent_animation'].set_active(gsettings.unityshell.get_int('urgent-animation'))
-        self.ui['cbox_launch_animation'].set_active(gsettings.unityshell.get_int('launch-animation'))
+        self.ui['spin_launcher_icon_size'].set_value(snap.unityshell.get_int('icon-size'))
 
         # Show Desktop
-        self.ui['sw_launcher_show_desktop'].set_active(True if 'unity://desktop-icon' in gsettings.launcher.get_strv('favorites') else False)
+        self.ui['sw_launcher_show_desktop'].set_active(True if 'unity://desktop-icon' in snap.launcher.get_strv('favorites') else False)
 
+    # ====== Dash Helpers ===== #
 
-        # ====== Dash Helpers ===== #
+    def refresh_dash(self):
+        snap = gsettings.snapshot()
 
         # Blur
-        dash_blur = gsettings.unityshell.get_int('dash-blur-experimental')
+        dash_blur = snap.unityshell.get_int('dash-blur-experimental')
         dependants = ['radio_dash_blur_smart',
                     'radio_dash_blur_static',
                     'l_dash_blur_type']
@@ -159,77 +278,33 @@ class Unitysettings ():
             self.ui['radio_dash_blur_smart'].set_active(True)
         del dependants
 
-        # Suggestions
-        suggestions = gsettings.lenses.get_string('remote-content-search')
-        if suggestions == 'all':
-            self.ui['check_suggestions'].set_active(True)
-        else:
-            self.ui['check_suggestions'].set_active(False)
-        del suggestions
-
-        # Applications Lens
-        self.ui['check_show_recent_apps'].set_active(gsettings.lens_apps.get_boolean('display-recent-apps'))
-        self.ui['check_show_available_apps'].set_active(gsettings.lens_apps.get_boolean('display-available-apps'))
+    # ====== Panel Helpers ====== #
 
-        # Files Lens
-        self.ui['check_use_locate'].set_active(gsettings.lens_files.get_boolean('use-locate'))
+    def refresh_panel(self):
+        snap = gsettings.snapshot()
 
-        # ====== Panel Helpers ====== #
-
-        self.ui['spin_menu_visible'].set_value(gsettings.unityshell.get_int('menus-discovery-duration'))
+        self.ui['spin_menu_visible'].set_value(snap.unityshell.get_int('menus-discovery-duration'))
 
         dependants = ['l_transparent_panel',
                     'sc_panel_transparency',
                     'check_panel_opaque']
 
-        opacity = gsettings.unityshell.get_double('panel-opacity')
+        opacity = snap.unityshell.get_double('panel-opacity')
+        self.ui['sc_panel_transparency'].set_value(opacity)
         if opacity == 1:
             self.ui['sw_transparent_panel'].set_active(False)
             self.ui.unsensitize(dependants)
         else:
             self.ui['sw_transparent_panel'].set_active(True)
             self.ui.sensitize(dependants)
-        self.ui['sc_panel_transparency'].set_value(opacity)
         del dependants
         del opacity
 
-        # Panel opacity
-        panel_opacity_value = gsettings.unityshell.get_boolean('panel-opacity-maximized-toggle')
-        if panel_opacity_value == True:
-            self.ui['check_panel_opaque'].set_active(True)
-        else:
-            self.ui['check_panel_opaque'].set_active(False)
-        del panel_opacity_value
-
-        # Date time indicator
-        clock_visibility = gsettings.datetime.get_boolean('show-clock')
-        dependants = ['radio_12hour',
-                    'radio_24hour',
-                    'check_date',
-                    'check_weekday',
-                    'check_calendar',
-                    'l_clock',
-                    'check_time_seconds']
-
-        if clock_visibility == True:
-            self.ui['check_indicator_datetime'].set_active(True)
-            self.ui.sensitize(dependants)
-        else:
-            self.ui['check_indicator_datetime'].set_active(False)
-            self.ui.sensitize(dependants)
-        del clock_visibility
-        del dependants
-
-        # User name indicator
-        show_username = gsettings.session.get_boolean('show-real-name-on-panel')
-        if show_username == True:
-            self.ui['check_indicator_username'].set_active(True)
-        else:
-            self.ui['check_indicator_username'].set_active(False)
-        del show_username
+    def refresh_power(self):
+        snap = gsettings.snapshot()
 
         # Battery status
-        battery_status = gsettings.power.get_string('icon-policy')
+        battery_status = snap.power.get_string('icon-policy')
 
         dependants = ['check_indicator_battery_life',
                     'radio_power_charging',
@@ -250,133 +325,75 @@ class Unitysettings ():
         del battery_status
         del dependants
 
-        # Battery life indicator
-        battery_life = gsettings.power.get_boolean('show-time')
-
-        if battery_life == True:
-            self.ui['check_indicator_battery_life'].set_active(True)
-        else:
-            self.ui['check_indicator_battery_life'].set_active(False)
-        del battery_life
+    def refresh_datetime(self):
+        snap = gsettings.snapshot()
 
         # 24 hour time format
-        time_format = gsettings.datetime.get_string('time-format')
+        time_format = snap.datetime.get_string('time-format')
         if time_format == '12-hour':
             self.ui['radio_12hour'].set_active(True)
         else:
             self.ui['radio_24hour'].set_active(True)
         del time_format
 
-        # Seconds
-        show_seconds = gsettings.datetime.get_boolean('show-seconds')
-        if show_seconds == True:
-            self.ui['check_time_seconds'].set_active(True)
-        else:
-            self.ui['check_time_seconds'].set_active(False)
-        del show_seconds
-
-        # Date
-        show_date = gsettings.datetime.get_boolean('show-date')
-        if show_date == True:
-            self.ui['check_date'].set_active(True)
-        else:
-            self.ui['check_date'].set_active(False)
-        del show_date
-
-        # Day
-        show_weekday = gsettings.datetime.get_boolean('show-day')
-        if show_weekday == True:
-            self.ui['check_weekday'].set_active(True)
-        else:
-            self.ui['check_weekday'].set_active(False)
-        del show_weekday
-
-        # Calendar
-        show_calendar = gsettings.datetime.get_boolean('show-calendar')
-        if show_calendar == True:
-            self.ui['check_calendar'].set_active(True)
-        else:
-            self.ui['check_calendar'].set_active(False)
-        del show_calendar
-
-        # Bluetooth indicator
-        show_bluetooth = gsettings.bluetooth.get_boolean('visible')
-        if show_bluetooth == True:
-            self.ui['check_indicator_bluetooth'].set_active(True)
-        else:
-            self.ui['check_indicator_bluetooth'].set_active(False)
-        del show_bluetooth
-
-        # Sound indicator
-        show_sound = gsettings.sound.get_boolean('visible')
-        if show_sound == True:
-            self.ui['check_indicator_sound'].set_active(True)
-        else:
-            self.ui['check_indicator_sound'].set_active(False)
-        del show_sound
-
-        show_notifyosd = gsettings.sound.get_boolean('show-notify-osd-on-scroll')
-        if show_notifyosd == True:
-            self.ui['check_scroll_notifyosd'].set_active(True)
-        else:
-            self.ui['check_scroll_notifyosd'].set_active(False)
-        del show_notifyosd
+    def refresh_sound(self):
+        snap = gsettings.snapshot()
 
-         # Default Player
-        interested_players = gsettings.sound.get_strv('interested-media-players')
-        preferred_players = gsettings.sound.get_strv('preferred-media-players')
+        # Default Player
+        interested_players = snap.sound.get_strv('interested-media-players')
+        preferred_players = snap.sound.get_strv('preferred-media-players')
 
+        # Rebuilt on every refresh, so start from an empty list
+        self.ui['cbox_default_player'].remove_all()
         for player in interested_players:
             self.ui['cbox_default_player'].append_text(player.capitalize())
-            if preferred_players[0] in interested_players:
-                self.ui['cbox_default_player'].set_active(interested_players.index(preferred_players[0]))
+        if preferred_players and preferred_players[0] in interested_players:
+            self.ui['cbox_default_player'].set_active(interested_players.index(preferred_players[0]))
 
-        # ====== Unity Switcher helpers ====== #
+    # ====== Unity Switcher helpers ====== #
 
-        self.ui['check_switchwindows_all_workspaces'].set_active(True if gsettings.unityshell.get_boolean('alt-tab-bias-viewport') is False else False)
-        self.ui['check_switcher_showdesktop'].set_active(True if gsettings.unityshell.get_boolean('disable-show-desktop') is False else False)
-        self.ui['check_minimizedwindows_switch'].set_active(gsettings.unityshell.get_boolean('show-minimized-windows'))
-        self.ui['check_autoexposewindows'].set_active(gsettings.unityshell.get_boolean('alt-tab-timeout'))
+    def refresh_switcher(self):
+        snap = gsettings.snapshot()
 
         model = self.ui['list_unity_switcher_windows_accelerators']
 
-        alt_tab_forward = gsettings.unityshell.get_string('alt-tab-forward')
+        alt_tab_forward = snap.unityshell.get_string('alt-tab-forward')
         iter_alt_tab_forward = model.get_iter_first()
         model.set_value(iter_alt_tab_forward, 1, alt_tab_forward)
 
-        alt_tab_prev = gsettings.unityshell.get_string('alt-tab-prev')
+        alt_tab_prev = snap.unityshell.get_string('alt-tab-prev')
         iter_alt_tab_prev = model.iter_next(iter_alt_tab_forward)
         model.set_value(iter_alt_tab_prev, 1, alt_tab_prev)
 
-        alt_tab_forward_all = gsettings.unityshell.get_string('alt-tab-forward-all')
+        alt_tab_forward_all = snap.unityshell.get_string('alt-tab-forward-all')
         iter_alt_tab_forward_all = model.iter_next(iter_alt_tab_prev)
         model.set_value(iter_alt_tab_forward_all, 1, alt_tab_forward_all)
 
-        alt_tab_prev_all = gsettings.unityshell.get_string('alt-tab-prev-all')
+        alt_tab_prev_all = snap.unityshell.get_string('alt-tab-prev-all')
         iter_alt_tab_prev_all = model.iter_next(iter_alt_tab_forward_all)
         model.set_value(iter_alt_tab_prev_all, 1, alt_tab_prev_all)
 
-        alt_tab_right = gsettings.unityshell.get_string('alt-tab-right')
+        alt_tab_right = snap.unityshell.get_string('alt-tab-right')
         iter_alt_tab_right = model.iter_next(iter_alt_tab_prev_all)
         model.set_value(iter_alt_tab_right, 1, alt_tab_right)
 
-        alt_tab_left = gsettings.unityshell.get_string('alt-tab-left')
+        alt_tab_left = snap.unityshell.get_string('alt-tab-left')
         iter_alt_tab_left = model.iter_next(iter_alt_tab_right)
         model.set_value(iter_alt_tab_left, 1, alt_tab_left)
 
-        alt_tab_detail_start = gsettings.unityshell.get_string('alt-tab-detail-start')
+        alt_tab_detail_start = snap.unityshell.get_string('alt-tab-detail-start')
         iter_alt_tab_detail_start = model.iter_next(iter_alt_tab_left)
         model.set_value(iter_alt_tab_detail_start, 1, alt_tab_detail_start)
 
-        alt_tab_detail_stop = gsettings.unityshell.get_string('alt-tab-detail-stop')
+        alt_tab_detail_stop = snap.unityshell.get_string('alt-tab-detail-stop')
         iter_alt_tab_detail_stop = model.iter_next(iter_alt_tab_detail_start)
         model.set_value(iter_alt_tab_detail_stop, 1, alt_tab_detail_stop)
 
-        alt_tab_next_window = gsettings.unityshell.get_string('alt-tab-next-window')
+        alt_tab_next_window = snap.unityshell.get_string('alt-tab-next-window')
         iter_alt_tab_next_window = model.iter_next(iter_alt_tab_detail_stop)
         model.set_value(iter_alt_tab_next_window, 1, alt_tab_next_window)
 
-        alt_tab_prev_window = gsettings.unityshell.get_string('alt-tab-prev-window')
+        alt_tab_prev_window = snap.unityshell.get_string('alt-tab-prev-window')
 
         iter_alt_tab_prev_window = model.iter_next(iter_alt_tab_next_window)
         model.set_value(iter_alt_tab_prev_window, 1, alt_tab_prev_window)
@@ -385,49 +402,40 @@ class Unitysettings ():
 
         model = self.ui['list_unity_switcher_launcher_accelerators']
 
-        launcher_switcher_forward = gsettings.unityshell.get_string('launcher-switcher-forward')
+        launcher_switcher_forward = snap.unityshell.get_string('launcher-switcher-forward')
         iter_launcher_switcher_forward = model.get_iter_first()
         model.set_value(iter_launcher_switcher_forward, 1, launcher_switcher_forward)
 
-        launcher_switcher_prev = gsettings.unityshell.get_string('launcher-switcher-prev')
+        launcher_switcher_prev = snap.unityshell.get_string('launcher-switcher-prev')
         iter_launcher_switcher_prev = model.iter_next(iter_launcher_switcher_forward)
         model.set_value(iter_launcher_switcher_prev, 1, launcher_switcher_prev)
 
         del model, launcher_switcher_forward, iter_launcher_switcher_forward, launcher_switcher_prev, iter_launcher_switcher_prev
 
-        # ====== Unity Webapps helpers ===== #
-
-        # Integration
-        webapp_integration = gsettings.webapps.get_boolean('integration-allowed')
-        if webapp_integration == True:
-            self.ui['switch_unity_webapps'].set_active(True)
-        else:
-            self.ui['switch_unity_webapps'].set_active(False)
-        del webapp_integration
-
-        # ====== Unity additional helpers ======= #
+    # ====== Unity additional helpers ======= #
 
-        self.ui['check_shortcuts_hints_overlay'].set_active(gsettings.unityshell.get_boolean('shortcut-overlay'))
+    def refresh_additional(self):
+        snap = gsettings.snapshot()
 
         model = self.ui['list_unity_additional_accelerators']
 
-        show_hud = gsettings.unityshell.get_string('show-hud')
+        show_hud = snap.unityshell.get_string('show-hud')
         iter_show_hud = model.get_iter_first()
         model.set_value(iter_show_hud, 1, show_hud)
 
-        show_launcher = gsettings.unityshell.get_string('show-launcher')
+        show_launcher = snap.unityshell.get_string('show-launcher')
         iter_show_launcher = model.iter_next(iter_show_hud)
         model.set_value(iter_show_launcher, 1, show_launcher)
 
-        execute_command = gsettings.unityshell.get_string('execute-command')
+        execute_command = snap.unityshell.get_string('execute-command')
         iter_execute_command = model.iter_next(iter_show_launcher)
         model.set_value(iter_execute_command, 1, execute_command)
 
-        keyboard_focus = gsettings.unityshell.get_string('keyboard-focus')
+        keyboard_focus = snap.unityshell.get_string('keyboard-focus')
         iter_keyboard_focus = model.iter_next(iter_execute_command)
         model.set_value(iter_keyboard_focus, 1, keyboard_focus)
 
-        panel_first_menu = gsettings.unityshell.get_string('panel-first-menu')
+        panel_first_menu = snap.unityshell.get_string('panel-first-menu')
         iter_panel_first_menu = model.iter_next(iter_keyboard_focus)
         model.set_value(iter_panel_first_menu, 1, panel_first_menu)
 
@@ -450,8 +458,9 @@ class Unitysettings ():
                     'cbox_autohide_animation']
 
         if self.ui['sw_launcher_hidemode'].get_active():
-            gsettings.unityshell.set_int("launcher-hide-mode", 1)
-            gsettings.unityshell.set_double('edge-responsiveness', 2.0)
+            with gsettings.changeset() as changes:
+                changes[gsettings.unityshell].set_int("launcher-hide-mode", 1)
+                changes[gsettings.unityshell].set_double('edge-responsiveness', 2.0)
             self.ui.sensitize(dependants)
         else:
             gsettings.unityshell.set_int("launcher-hide-mode", 0)
@@ -462,10 +471,6 @@ class Unitysettings ():
         mode = 0 if radio.get_active() else 1
         gsettings.unityshell.set_int('reveal-trigger', mode)
 
-    def on_cbox_autohide_animation_changed(self, widget, udata = None):
-        mode = self.ui['cbox_autohide_animation'].get_active()
-        gsettings.unityshell.set_int('autohide-animation', mode)
-
 # XXX :Strictly speaking, only one of these two will suffice.
     def on_radio_reveal_topleft_toggled(self, button, udata = None):
         radio = self.ui['radio_reveal_topleft']
@@ -475,7 +480,7 @@ class Unitysettings ():
     def on_sc_reveal_sensitivity_value_changed(self, widget, udata = None):
         slider = self.ui['sc_reveal_sensitivity']
         val = slider.get_value()
-        gsettings.unityshell.set_double('edge-responsiveness', val)
+        gsettings.schedule(gsettings.unityshell, 'edge-responsiveness', val)
 
     def on_sw_launcher_transparent_active_notify(self, widget, udata = None):
         dependants = ['l_launcher_transparency_scale',
@@ -487,16 +492,20 @@ class Unitysettings ():
             self.ui.sensitize(dependants)
             if self.ui['sc_launcher_transparency'].get_value() == 1.0:
                 self.ui['sc_launcher_transparency'].set_value(0.67)
+                # Setting the slider schedules a write; this one must win
+                gsettings.cancel(gsettings.unityshell, 'launcher-opacity')
                 gsettings.unityshell.set_double('launcher-opacity', 0.33)
             else:
+                gsettings.cancel(gsettings.unityshell, 'launcher-opacity')
                 gsettings.unityshell.set_double('launcher-opacity', opacity)
         else:
             self.ui.unsensitize(dependants)
+            gsettings.cancel(gsettings.unityshell, 'launcher-opacity')
             gsettings.unityshell.set_double('launcher-opacity', 1.00)
 
     def on_sc_launcher_transparency_value_changed(self, widget, udata = None):
         opacity = self.ui['sc_launcher_transparency'].get_value()
-        gsettings.unityshell.set_double('launcher-opacity', opacity)
+        gsettings.schedule(gsettings.unityshell, 'launcher-opacity', opacity)
 
     def on_radio_launcher_visibility_all_toggled(self, widget, udata = None):
         if self.ui['radio_launcher_visibility_all'].get_active():
@@ -508,33 +517,21 @@ class Unitysettings ():
         dependants = ['color_launcher_color_cus']
         color = self.ui['color_launcher_color_cus'].get_color()
         colorhash = gsettings.color_to_hash(color)
-        if self.ui['radio_launcher_color_cus'].get_active():
+        custom = self.ui['radio_launcher_color_cus'].get_active()
+        if custom:
             self.ui.sensitize(dependants)
-            gsettings.unityshell.set_string('background-color', colorhash)
         else:
             self.ui.unsensitize(dependants)
-            gsettings.unityshell.set_string('background-color', colorhash[:-2]+'00')
+        gsettings.unityshell.set_string('background-color', mappings.launcher_color_value(custom, colorhash))
 
     def on_color_launcher_color_cus_color_set(self, widget, udata = None):
         color = self.ui['color_launcher_color_cus'].get_color()
         colorhash = gsettings.color_to_hash(color)
-        gsettings.unityshell.set_string('background-color', colorhash)
+        gsettings.unityshell.set_string('background-color', mappings.launcher_color_value(True, colorhash))
 
     def on_spin_launcher_icon_size_value_changed(self, widget, udata = None):
         size = self.ui['spin_launcher_icon_size'].get_value()
-        gsettings.unityshell.set_int('icon-size', size)
-
-    def on_cbox_launcher_icon_colouring_changed(self, widget, udata = None):
-        mode = self.ui['cbox_launcher_icon_colouring'].get_active()
-        gsettings.unityshell.set_int('backlight-mode', mode)
-
-    def on_cbox_urgent_animation_changed(self, widget, udata = None):
-        mode = self.ui['cbox_urgent_animation'].get_active()
-        gsettings.unityshell.set_int('urgent-animation', mode)
-
-    def on_cbox_launch_animation_changed(self, widget, udata = None):
-        mode = self.ui['cbox_launch_animation'].get_active()
-        gsettings.unityshell.set_int('launch-animation', mode)
+        gsettings.schedule(gsettings.unityshell, 'icon-size', int(size))
 
     def on_sw_launcher_show_desktop_active_notify(self, widget, udata = None):
         fav = gsettings.launcher.get_strv('favorites')
@@ -549,26 +546,26 @@ class Unitysettings ():
                 gsettings.launcher.set_strv('favorites', fav)
 
     def on_b_unity_launcher_reset_clicked(self, widget):
-        gsettings.unityshell.reset('launch-animation')
-        gsettings.unityshell.reset('urgent-animation')
-        gsettings.unityshell.reset('backlight-mode')
-        gsettings.unityshell.reset('icon-size')
-        gsettings.unityshell.reset('background-color')
-        gsettings.unityshell.reset('num-launchers')
-        gsettings.unityshell.reset('panel-opacity')
-        gsettings.unityshell.reset('launcher-opacity')
-        gsettings.unityshell.reset('launcher-hide-mode')
-        gsettings.unityshell.reset('edge-responsiveness')
-        gsettings.unityshell.reset('reveal-trigger')
-
-        # Remove "Show Desktop" icon
-        fav = gsettings.launcher.get_strv('favorites')
-        desktop = "unity://desktop-icon"
-        if desktop in fav:
-            fav.remove(desktop)
-            gsettings.launcher.set_strv('favorites', fav)
-
-        self.refresh()
+        with gsettings.changeset() as changes:
+            unityshell = changes[gsettings.unityshell]
+            unityshell.reset('launch-animation')
+            unityshell.reset('urgent-animation')
+            unityshell.reset('backlight-mode')
+            unityshell.reset('icon-size')
+            unityshell.reset('background-color')
+            unityshell.reset('num-launchers')
+            unityshell.reset('panel-opacity')
+            unityshell.reset('launcher-opacity')
+            unityshell.reset('launcher-hide-mode')
+            unityshell.reset('edge-responsiveness')
+            unityshell.reset('reveal-trigger')
+
+            # Remove "Show Desktop" icon
+            fav = gsettings.launcher.get_strv('favorites')
+            desktop = "unity://desktop-icon"
+            if desktop in fav:
+                fav.remove(desktop)
+                changes[gsettings.launcher].set_strv('favorites', fav)
 
 # ----- END: Launcher -----
 
@@ -594,32 +591,14 @@ class Unitysettings ():
         mode = 2 if button.get_active() else 1
         gsettings.unityshell.set_int('dash-blur-experimental', mode)
 
-    def on_check_suggestions_toggled(self, widget, udata = None):
-        if self.ui['check_suggestions'].get_active():
-            gsettings.lenses.set_string('remote-content-search', "all")
-
-        else:
-            gsettings.lenses.set_string('remote-content-search', "none")
-
-    def on_check_show_recent_apps_toggled(self, widget, udata = None):
-        gsettings.lens_apps.set_boolean('display-recent-apps',
-                            self.ui['check_show_recent_apps'].get_active())
-
-    def on_check_show_available_apps_toggled(self, widget, udata = None):
-        gsettings.lens_apps.set_boolean('display-available-apps',
-                            self.ui['check_show_available_apps'].get_active())
-
-    def on_check_use_locate_toggled(self, widget, udata = None):
-        gsettings.lens_files.set_boolean('use-locate',
-                            self.ui['check_use_locate'].get_active())
-
-
     def on_b_unity_dash_reset_clicked(self, widget):
-        gsettings.unityshell.reset('dash-blur-experimental')
-        gsettings.lenses.reset('remote-content-search')
-        gsettings.lens_apps.reset('display-recent-apps')
-        gsettings.lens_apps.reset('display-available-apps')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            changes[gsettings.unityshell].reset('dash-blur-experimental')
+            if gsettings.available('lenses'):
+                changes[gsettings.lenses].reset('remote-content-search')
+            if gsettings.available('lens_apps'):
+                changes[gsettings.lens_apps].reset('display-recent-apps')
+                changes[gsettings.lens_apps].reset('display-available-apps')
 
 #----- END: Dash -------
 
@@ -644,34 +623,23 @@ class Unitysettings ():
             if self.ui['sc_panel_transparency'].get_value() == 1.0:
                 self.ui['sc_panel_transparency'].set_value(0.67)
                 self.ui['check_panel_opaque'].set_active(True)
-                gsettings.unityshell.set_double('panel-opacity', 0.33)
-                gsettings.unityshell.set_boolean('panel-opacity-maximized-toggle', True)
+                with gsettings.changeset() as changes:
+                    changes[gsettings.unityshell].set_double('panel-opacity', 0.33)
+                    changes[gsettings.unityshell].set_boolean('panel-opacity-maximized-toggle', True)
 
             else:
                 panel_transparency = self.ui['sc_panel_transparency'].get_value()
+                gsettings.cancel(gsettings.unityshell, 'panel-opacity')
                 gsettings.unityshell.set_double('panel-opacity', panel_transparency)
 
         else:
             self.ui.unsensitize(dependants)
+            gsettings.cancel(gsettings.unityshell, 'panel-opacity')
             gsettings.unityshell.set_double('panel-opacity', 1.00)
 
     def on_sc_panel_transparency_value_changed(self, widget, udata = None):
         panel_transparency = widget.get_value()
-        gsettings.unityshell.set_double('panel-opacity', panel_transparency)
-
-    def on_check_panel_opaque_toggled(self, widget, udata = None):
-
-        if widget.get_active():
-            gsettings.unityshell.set_boolean('panel-opacity-maximized-toggle', True)
-        else:
-            gsettings.unityshell.set_boolean('panel-opacity-maximized-toggle', False)
-
-    def on_check_indicator_username_active(self, widget, udata = None):
-
-        if widget.get_active():
-            gsettings.session.set_boolean('show-real-name-on-panel', True)
-        else:
-            gsettings.session.set_boolean('show-real-name-on-panel', False)
+        gsettings.schedule(gsettings.unityshell, 'panel-opacity', panel_transparency)
 
     def on_check_indicator_battery_toggled(self, widget, udata = None):
         dependants = ['check_indicator_battery_life',
@@ -703,29 +671,6 @@ class Unitysettings ():
         else:
             gsettings.power.set_string('icon-policy', "charge")
 
-    def on_check_indicator_battery_life_toggled(self, widget, udata = None):
-
-        if widget.get_active():
-            gsettings.power.set_boolean('show-time', True)
-        else:
-            gsettings.power.set_boolean('show-time', False)
-
-    def on_check_indicator_datetime_active(self, widget, udata = None):
-        dependants = ['radio_12hour',
-                    'radio_24hour',
-                    'check_date',
-                    'check_weekday',
-                    'l_clock',
-                    'check_calendar',
-                    'check_time_seconds']
-
-        if widget.get_active():
-            gsettings.datetime.set_boolean('show-clock', True)
-            self.ui.sensitize(dependants)
-        else:
-            gsettings.datetime.set_boolean('show-clock', False)
-            self.ui.unsensitize(dependants)
-
     def on_radio_12hour_toggled(self, button, udata = None):
 
         mode = self.ui['radio_12hour'].get_active()
@@ -745,102 +690,43 @@ class Unitysettings ():
             gsettings.datetime.set_string('time-format', '24-hour')
 
 
-    def on_check_time_seconds_toggled(self, widget, udata = None):
-        gsettings.datetime.set_boolean('show-seconds',
-                  self.ui['check_time_seconds'].get_active())
-
-    def on_check_date_toggled(self, widget, udata = None):
-        gsettings.datetime.set_boolean('show-date',
-                  self.ui['check_date'].get_active())
-
-    def on_check_weekday_toggled(self, widget, udata = None):
-        gsettings.datetime.set_boolean('show-day',
-                  self.ui['check_weekday'].get_active())
-
-    def on_check_calendar_toggled(self, widget, udata = None):
-        gsettings.datetime.set_boolean('show-calendar',
-                  self.ui['check_calendar'].get_active())
-
-    def on_check_indicator_bluetooth_toggled(self, widget, udata = None):
-
-        if widget.get_active():
-            gsettings.bluetooth.set_boolean('visible', True)
-        else:
-            gsettings.bluetooth.set_boolean('visible', False)
-
-    def on_check_indicator_sound_toggled(self, widget, udata = None):
-
-        if widget.get_active():
-            gsettings.sound.set_boolean('visible', True)
-        else:
-            gsettings.sound.set_boolean('visible', False)
-
-    def on_check_scroll_notifyosd_toggled(self, widget, udata = None):
-
-        if widget.get_active():
-            gsettings.sound.set_boolean('show-notify-osd-on-scroll', True)
-        else:
-            gsettings.sound.set_boolean('show-notify-osd-on-scroll', False)
-
     def on_cbox_default_player_changed(self, widget, udata = None):
         combobox_text = self.ui['cbox_default_player'].get_active_text()
+        # Emitted with nothing selected while refresh rebuilds the list
+        if combobox_text is None:
+            return
         gsettings.sound.set_strv('preferred-media-players', [combobox_text.lower()])
 
     def on_b_unity_panel_reset_clicked(self, widget):
-        gsettings.sound.reset('visible')
-        gsettings.bluetooth.reset('visible')
-        gsettings.datetime.reset('show-calendar')
-        gsettings.datetime.reset('show-day')
-        gsettings.datetime.reset('show-date')
-        gsettings.datetime.reset('show-seconds')
-        gsettings.datetime.reset('show-clock')
-        gsettings.datetime.reset('time-format')
-        gsettings.power.reset('show-time')
-        gsettings.power.reset('icon-policy')
-        gsettings.session.reset('show-real-name-on-panel')
-        gsettings.unityshell.reset('panel-opacity-maximized-toggle')
-        gsettings.unityshell.reset('panel-opacity')
-        gsettings.sound.reset('preferred-media-players')
-        gsettings.sound.reset('show-notify-osd-on-scroll')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            changes[gsettings.unityshell].reset('panel-opacity-maximized-toggle')
+            changes[gsettings.unityshell].reset('panel-opacity')
+            # Indicators that are not installed have nothing to reset
+            if gsettings.available('datetime'):
+                datetime = changes[gsettings.datetime]
+                datetime.reset('show-calendar')
+                datetime.reset('show-day')
+                datetime.reset('show-date')
+                datetime.reset('show-seconds')
+                datetime.reset('show-clock')
+                datetime.reset('time-format')
+            if gsettings.available('power'):
+                changes[gsettings.power].reset('show-time')
+                changes[gsettings.power].reset('icon-policy')
+            if gsettings.available('session'):
+                changes[gsettings.session].reset('show-real-name-on-panel')
+            if gsettings.available('bluetooth'):
+                changes[gsettings.bluetooth].reset('visible')
+            if gsettings.available('sound'):
+                sound = changes[gsettings.sound]
+                sound.reset('visible')
+                sound.reset('preferred-media-players')
+                sound.reset('show-notify-osd-on-scroll')
 
 #----- END: Panel -----
 
 #----- BEGIN: Switcher -----
 
-    def on_check_switchwindows_all_workspaces_toggled(self, widget, udata = None):
-
-        if widget.get_active():
-            gsettings.unityshell.set_boolean('alt-tab-bias-viewport', False)
-
-        else:
-            gsettings.unityshell.set_boolean('alt-tab-bias-viewport', True)
-
-
-    def on_check_switcher_showdesktop_toggled(self, widget, udata = None):
-
-        if widget.get_active():
-            gsettings.unityshell.set_boolean("disable-show-desktop", False)
-
-        else:
-            gsettings.unityshell.set_boolean("disable-show-desktop", True)
-
-    def on_check_minimizedwindows_switch_toggled(self, widget, udata = None):
-
-        if widget.get_active():
-            gsettings.unityshell.set_boolean("show-minimized-windows", True)
-
-        else:
-            gsettings.unityshell.set_boolean("show-minimized-windows", False)
-
-    def on_check_autoexposewindows_toggled(self, widget, udata = None):
-
-        if widget.get_active():
-            gsettings.unityshell.set_boolean('alt-tab-timeout', True)
-
-        else:
-            gsettings.unityshell.set_boolean('alt-tab-timeout', False)
-
     # keyboard widgets in unity-windows-switcher
 
     def on_craccel_unity_switcher_windows_accel_edited(self, craccel, path, key, mods, hwcode, model = None):
@@ -920,51 +806,37 @@ class Unitysettings ():
             gsettings.unityshell.set_string('launcher-switcher-prev', "Disabled")
 
     def on_b_unity_switcher_reset_clicked(self, widget):
-        gsettings.unityshell.reset('alt-tab-bias-viewport')
-        gsettings.unityshell.reset('disable-show-desktop')
-        gsettings.unityshell.reset('show-minimized-windows')
-        gsettings.unityshell.reset('alt-tab-timeout')
-        gsettings.unityshell.reset('alt-tab-forward')
-        gsettings.unityshell.reset('alt-tab-prev')
-        gsettings.unityshell.reset('alt-tab-forward-all')
-        gsettings.unityshell.reset('alt-tab-prev-all')
-        gsettings.unityshell.reset('alt-tab-right')
-        gsettings.unityshell.reset('alt-tab-left')
-        gsettings.unityshell.reset('alt-tab-detail-start')
-        gsettings.unityshell.reset('alt-tab-detail-stop')
-        gsettings.unityshell.reset('alt-tab-next-window')
-        gsettings.unityshell.reset('alt-tab-prev-window')
-        gsettings.unityshell.reset('launcher-switcher-forward')
-        gsettings.unityshell.reset('launcher-switcher-prev')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            unityshell = changes[gsettings.unityshell]
+            unityshell.reset('alt-tab-bias-viewport')
+            unityshell.reset('disable-show-desktop')
+            unityshell.reset('show-minimized-windows')
+            unityshell.reset('alt-tab-timeout')
+            unityshell.reset('alt-tab-forward')
+            unityshell.reset('alt-tab-prev')
+            unityshell.reset('alt-tab-forward-all')
+            unityshell.reset('alt-tab-prev-all')
+            unityshell.reset('alt-tab-right')
+            unityshell.reset('alt-tab-left')
+            unityshell.reset('alt-tab-detail-start')
+            unityshell.reset('alt-tab-detail-stop')
+            unityshell.reset('alt-tab-next-window')
+            unityshell.reset('alt-tab-prev-window')
+            unityshell.reset('launcher-switcher-forward')
+            unityshell.reset('launcher-switcher-prev')
 
 #----- END: Switch -----
 
 #----- BEGIN: Webapps -----
 
-    def on_switch_webapps_active_notify(self, widget, udata = None):
-        if self.ui['switch_unity_webapps'].get_active() == True:
-            gsettings.webapps.set_boolean('integration-allowed', True)
-        else:
-            gsettings.webapps.set_boolean('integration-allowed', False)
-
     def on_b_unity_webapps_reset_clicked(self, widget):
-        gsettings.webapps.reset('integration-allowed')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            changes[gsettings.webapps].reset('integration-allowed')
 
 #----- END: Webapps -----
 
 #----- BEGIN: Additional -----
 
-    def on_check_shortcuts_hints_overlay_toggled(self, widget, udata = None):
-
-        if widget.get_active():
-            gsettings.unityshell.set_boolean('shortcut-overlay', True)
-
-        else:
-            gsettings.unityshell.set_boolean('shortcut-overlay', False)
-
-
     # keyboard widgets in unity-additional
 
     def on_craccel_unity_additional_accel_edited(self, craccel, path, key, mods, hwcode, model = None):
@@ -1003,13 +875,14 @@ class Unitysettings ():
             gsettings.unityshell.set_string('panel-first-menu', "Disabled")
 
     def on_b_unity_additional_reset_clicked(self, widget):
-        gsettings.unityshell.reset('shortcut-overlay')
-        gsettings.unityshell.reset('show-hud')
-        gsettings.unityshell.reset('show-launcher')
-        gsettings.unityshell.reset('execute-command')
-        gsettings.unityshell.reset('keyboard-focus')
-        gsettings.unityshell.reset('panel-first-menu')
-        self.refresh()
+        with gsettings.changeset() as changes:
+            unityshell = changes[gsettings.unityshell]
+            unityshell.reset('shortcut-overlay')
+            unityshell.reset('show-hud')
+            unityshell.reset('show-launcher')
+            unityshell.reset('execute-command')
+            unityshell.reset('keyboard-focus')
+            unityshell.reset('panel-first-menu')
 
 #----- END: Additional -----
 
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+#
+# Team:
+#   J Phani Mahesh <phanimahesh@gmail.com>
+#   Barneedhar (jokerdino) <barneedhar@ubuntu.com>
+#   Amith KK <amithkumaran@gmail.com>
+#   Georgi Karavasilev <motorslav@gmail.com>
+#   Sam Tran <samvtran@gmail.com>
+#   Sam Hewitt <hewittsamuel@gmail.com>
+#
+# Description:
+#   A One-stop configuration tool for Unity.
+#
+# Legal Stuff:
+#
+# This file is a part of Unity Tweak Tool
+#
+# Unity Tweak Tool is free software; you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the Free Software
+# Foundation; version 3.
+#
+# Unity Tweak Tool is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+# details.
+#
+# You should have received a copy of the GNU General Public License along with
+# this program; if not, see <https://www.gnu.org/licenses/gpl-3.0.txt>
+
+
+"""Reading Xcursor files without loading them.
+
+A cursor theme can hold hundreds of animated cursors of several sizes,
+some of them megabytes each. Everything here maps the file and reads
+only the table of contents and the one image asked for out of it."""
+
+import mmap, os, os.path, struct
+
+MAGIC = b'Xcur'
+IMAGE = 0xfffd0002
+# Chunk header of an image: header, type, subtype, version, width,
+# height, xhot, yhot, delay
+IMAGE_HEADER = struct.Struct('<9I')
+
+# Cursors every theme has to provide for the desktop to look right
+CORE = ('left_ptr', 'xterm', 'hand2', 'watch', 'crosshair', 'fleur',
+        'question_arrow', 'sb_h_double_arrow', 'sb_v_double_arrow',
+        'top_left_corner', 'top_right_corner', 'bottom_left_corner',
+        'bottom_right_corner')
+
+def toc(data):
+    """Return [(nominal size, position)] of the images in a mapped file.
+    Raises ValueError if it is not a well formed Xcursor file."""
+    try:
+        magic, header, version, count = struct.unpack_from('<4sIII', data, 0)
+        if magic != MAGIC:
+            raise ValueError('not an Xcursor file')
+        entries = struct.unpack_from('<{}I'.format(3*count), data, header)
+    except struct.error:
+        raise ValueError('truncated Xcursor header')
+    images = []
+    for index in range(0, len(entries), 3):
+        chunk, nominal, position = entries[index:index+3]
+        if chunk == IMAGE:
+            images.append((nominal, position))
+    if not images:
+        raise ValueError('no images in cursor')
+    return images
+
+def _image_header(data, position):
+    try:
+        header, chunk, nominal, version, width, height = IMAGE_HEADER.unpack_from(data, position)[:6]
+    except struct.error:
+        raise ValueError('image past the end of the file')
+    if chunk != IMAGE or not 0 < width <= 0x7fff or not 0 < height <= 0x7fff:
+        raise ValueError('bad image header')
+    if position+header+width*height*4 > len(data):
+        raise ValueError('image past the end of the file')
+    return header, width, height
+
+def check(filename):
+    """Raise OSError or ValueError unless filename is an Xcursor file
+    whose table of contents and images all lie within it"""
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as data:
+        for nominal, position in toc(data):
+            _image_header(data, position)
+
+def image(filename, size):
+    """Return (width, height, pixels) of the image whose nominal size is
+    nearest size, pixels being non-premultiplied RGBA. Only that image's
+    pixels are read out of the mapped file."""
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as data:
+        nominal, position = min(toc(data), key = lambda image: abs(image[0]-size))
+        header, width, height = _image_header(data, position)
+        start = position+header
+        # Both views have to go before the map can be closed
+        with memoryview(data) as view, view[start:start+width*height*4] as pixels:
+            return width, height, unpremultiply(pixels)
+
+def unpremultiply(pixels):
+    """Turn premultiplied little endian ARGB into RGBA"""
+    rgba = bytearray(len(pixels))
+    # Fully opaque pixels only swap bytes, which slicing does all at once
+    rgba[0::4] = pixels[2::4]
+    rgba[1::4] = pixels[1::4]
+    rgba[2::4] = pixels[0::4]
+    rgba[3::4] = pixels[3::4]
+    for index in range(3, len(rgba), 4):
+        alpha = rgba[index]
+        if alpha != 255:
+            if alpha:
+                rgba[index-3] = min(rgba[index-3]*255//alpha, 255)
+                rgba[index-2] = min(rgba[index-2]*255//alpha, 255)
+                rgba[index-1] = min(rgba[index-1]*255//alpha, 255)
+            else:
+                rgba[index-3:index] = b'\0\0\0'
+    return bytes(rgba)
+
+def broken(path):
+    """Return the CORE cursors the theme at path is missing or has
+    unreadable files for"""
+    result = []
+    for name in CORE:
+        try:
+            check(os.path.join(path, 'cursors', name))
+        except (OSError, ValueError):
+            result.append(name)
+    return result